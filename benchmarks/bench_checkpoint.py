@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Time to resume zipping at a checkpoint by unpickling a
+`NamedZipIterator`, against replaying the skipped rows with
+`itertools.islice`.
+
+Usage::
+
+    $ python benchmarks/bench_checkpoint.py [rows]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+from itertools import islice
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+from namedzip import namedzip
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+def elapsed(func):
+    """Return the wall time of `func()` and its result."""
+
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(rows=5000000):
+    target = rows // 2
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "y.txt")
+        with open(path, "w") as file:
+            file.writelines("{}\n".format(i) for i in range(rows))
+        print("rows: {:,}, checkpoint at row {:,}".format(rows, target))
+        header = ["inputs", "replay", "pickle", "unpickle"]
+        print("{:<12}{:>12}{:>12}{:>12}".format(*header))
+        for title, make_inputs in [
+            ("ranges", lambda: (range(rows), range(rows))),
+            ("range+file", lambda: (range(rows), open(path))),
+        ]:
+            inputs = make_inputs()
+            replay, _ = elapsed(
+                lambda: next(islice(namedzip(Point, *inputs), target, None))
+            )
+            points = namedzip(Point, *make_inputs(), checkpoint=True)
+            next(islice(points, target - 1, None))
+            dump, state = elapsed(lambda: pickle.dumps(points))
+            load, restored = elapsed(lambda: pickle.loads(state))
+            assert next(restored) == next(points)
+            print(
+                "{:<12}{:>10.1f}ms{:>10.3f}ms{:>10.3f}ms".format(
+                    title, replay * 1e3, dump * 1e3, load * 1e3
+                )
+            )
+            for source in inputs + points._sources + restored._sources:
+                getattr(source, "close", lambda: None)()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
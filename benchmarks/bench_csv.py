@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Time and peak memory of reading two of four CSV columns into named
+tuples with `namedzip_csv`, and by splitting the file into columns for
+`namedzip` first.
+
+Usage::
+
+    $ python benchmarks/bench_csv.py [rows]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+import csv
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from namedzip import namedzip, namedzip_csv
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+def peak_mb():
+    """Return the peak resident set size of this process in megabytes."""
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def split_columns(path):
+    """Generate rows by reading the x and y columns into lists first."""
+
+    with open(path, newline="") as file:
+        records = csv.reader(file)
+        names = next(records)
+        x, y = names.index("x"), names.index("y")
+        columns = list(zip(*((record[x], record[y]) for record in records)))
+    return namedzip(Point, *columns)
+
+
+def main(rows=1000000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "points.csv")
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["id", "x", "name", "y"])
+            writer.writerows((i, i * 2, "point", i * 3) for i in range(rows))
+        print("rows: {:,}".format(rows))
+        print("{:<16}{:>10}{:>12}".format("", "time", "peak RSS"))
+        # Streaming first, since the peak resident set size never shrinks.
+        for title, read in [
+            ("namedzip_csv", lambda: namedzip_csv(Point, path)),
+            ("split columns", lambda: split_columns(path)),
+        ]:
+            start = time.perf_counter()
+            for _ in read():
+                pass
+            seconds = time.perf_counter() - start
+            print("{:<16}{:>9.3f}s{:>10.0f}MB".format(title, seconds, peak_mb()))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Per-call overhead of the `namedzip` and `namedzip_longest` interfaces.
+
+Measures calls with the current signature against the same calls made
+through a copy of the decorator which dispatched deprecated calls up to
+namedzip v1.1.0, and reports the number of global warning filters after
+a series of deprecated calls.
+
+Usage::
+
+    $ python benchmarks/bench_dispatch.py [calls]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+from functools import wraps
+import sys
+import timeit
+import warnings
+
+from namedzip import namedzip, namedzip_longest
+
+Point = namedtuple("Point", ["x", "y"])
+X_VALS = [1, 2, 3]
+Y_VALS = [9, 8, 7]
+
+
+def legacy_dispatch(func):
+    """Decorator equivalent to `_deprecation_warning` in namedzip v1.1.0."""
+
+    message = "legacy deprecation message"
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        deprecated_kwargs = bool(
+            "typename" in kwargs.keys() or "field_names" in kwargs.keys()
+        )
+        if deprecated_kwargs:
+            warnings.filterwarnings("always", message=message)
+            warnings.warn(category=DeprecationWarning, message=message, stacklevel=2)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def nanoseconds_per_call(stmt, calls):
+    """Return the best time per call in nanoseconds."""
+
+    best = min(timeit.repeat(stmt, number=calls, repeat=5))
+    return best / calls * 1e9
+
+
+def main(calls=200000):
+    cases = [
+        ("namedzip(Point)", lambda: namedzip(Point)),
+        ("namedzip(Point, x, y)", lambda: namedzip(Point, X_VALS, Y_VALS)),
+        (
+            "namedzip_longest(Point, x, y, fillvalue=0)",
+            lambda: namedzip_longest(Point, X_VALS, Y_VALS, fillvalue=0),
+        ),
+    ]
+    legacy_namedzip = legacy_dispatch(namedzip)
+    legacy_namedzip_longest = legacy_dispatch(namedzip_longest)
+    legacy_cases = [
+        lambda: legacy_namedzip(Point),
+        lambda: legacy_namedzip(Point, X_VALS, Y_VALS),
+        lambda: legacy_namedzip_longest(Point, X_VALS, Y_VALS, fillvalue=0),
+    ]
+
+    print("calls: {:,}".format(calls))
+    print("{:<44}{:>10}{:>10}{:>10}".format("", "legacy", "current", "saved"))
+    for (title, current), legacy in zip(cases, legacy_cases):
+        legacy_ns = nanoseconds_per_call(legacy, calls)
+        current_ns = nanoseconds_per_call(current, calls)
+        print(
+            "{:<44}{:>8.0f}ns{:>8.0f}ns{:>8.0f}ns".format(
+                title, legacy_ns, current_ns, legacy_ns - current_ns
+            )
+        )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        before = len(warnings.filters)
+        for _ in range(100):
+            namedzip(typename="Point", field_names=["x", "y"])
+        print(
+            "warning filters added by 100 deprecated calls: {}".format(
+                len(warnings.filters) - before
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
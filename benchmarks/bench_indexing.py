@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Time to reach a row deep into zipped sequences by skipping with
+`itertools.islice`, and by indexing the `namedzip` result.
+
+Usage::
+
+    $ python benchmarks/bench_indexing.py [rows]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+from itertools import islice
+import sys
+import timeit
+
+from namedzip import namedzip, namedzip_longest
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+def seconds(func, number):
+    """Return the best wall time per call of `func()`."""
+
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main(rows=10000000):
+    xs, ys = range(rows), list(range(rows // 2))
+    target = rows // 2 - 1
+    print("rows: {:,}, target row: {:,}".format(rows, target))
+    print("{:<20}{:>14}{:>14}{:>14}".format("", "islice", "index", "slice[::1000]"))
+    for title, func in [("namedzip", namedzip), ("namedzip_longest", namedzip_longest)]:
+        skipping = seconds(
+            lambda: next(islice(func(Point, xs, ys), target, None)), number=1
+        )
+        indexing = seconds(lambda: func(Point, xs, ys)[target], number=1000)
+        slicing = seconds(lambda: list(func(Point, xs, ys)[::1000]), number=10)
+        print(
+            "{:<20}{:>12.1f}ms{:>12.1f}us{:>12.1f}ms".format(
+                title, skipping * 1e3, indexing * 1e6, slicing * 1e3
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Wall time and peak memory of joining sorted (id, value) streams with
+gaps using `namedzip_join`, against loading them into dicts.
+
+Usage::
+
+    $ python benchmarks/bench_join.py [rows]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import deque, namedtuple
+from operator import itemgetter
+import sys
+import time
+import tracemalloc
+
+from namedzip import namedzip_join
+
+Row = namedtuple("Row", ["a", "b", "c"])
+
+
+def stream(rows, step):
+    """Generate (id, value) pairs for every `step`-th id below `rows`."""
+
+    return ((i, float(i)) for i in range(0, rows, step))
+
+
+def dict_join(streams):
+    """Join `streams` by loading each into a dict."""
+
+    tables = [dict(pairs) for pairs in streams]
+    ids = sorted(set().union(*tables))
+    for i in ids:
+        yield Row._make(table.get(i) for table in tables)
+
+
+def measure(func):
+    """Return the wall time and peak traced memory of exhausting `func()`.
+
+    Memory is traced in a second run, which tracing slows down.
+
+    """
+
+    start = time.perf_counter()
+    deque(func(), 0)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    deque(func(), 0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(rows=1000000):
+    steps = (1, 2, 3)
+    cases = [
+        ("dicts", lambda: dict_join([stream(rows, step) for step in steps])),
+        (
+            "namedzip_join",
+            lambda: namedzip_join(
+                Row, *[stream(rows, step) for step in steps], key=itemgetter(0)
+            ),
+        ),
+    ]
+    print("ids: {}".format(rows))
+    for name, func in cases:
+        elapsed, peak = measure(func)
+        print("{:<14} {:.3f}s, peak {:.1f} MB".format(name, elapsed, peak / 1e6))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Time to materialize zipped named tuples with `list`, and the size of
+the list, with and without the length hint of `NamedZipIterator`.
+
+Usage::
+
+    $ python benchmarks/bench_materialize.py [rows]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+import sys
+import timeit
+
+from namedzip import namedzip, namedzip_longest
+
+namedzip_module = sys.modules["namedzip.namedzip"]
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+def seconds(func):
+    """Return the best wall time of `func()`."""
+
+    return min(timeit.repeat(func, number=1, repeat=3))
+
+
+def main(rows=10000000):
+    xs, ys = list(range(rows)), list(range(rows))
+    backend = "python" if namedzip_module._speedups is None else "c"
+    print("rows: {:,}, backend: {}".format(rows, backend))
+    print("{:<20}{:>10}{:>16}{:>10}{:>16}".format("", "no hint", "", "hint", ""))
+    for title, func in [("namedzip", namedzip), ("namedzip_longest", namedzip_longest)]:
+        results = []
+        # `iter` returns the wrapped iterator, which has no length hint.
+        for materialize in [
+            lambda: list(iter(func(Point, xs, ys))),
+            lambda: list(func(Point, xs, ys)),
+        ]:
+            results.append(seconds(materialize))
+            results.append(sys.getsizeof(materialize()))
+        print("{:<20}{:>9.3f}s{:>15,}B{:>9.3f}s{:>15,}B".format(title, *results))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Rows per second for `namedzip` with and without the map fast path.
+
+Compares `namedzip_generator`, a copy of the original implementation
+which resumes a Python generator frame and calls the named tuple class
+for every row,
+with the iterators returned by `namedzip` and by `namedzip_longest`
+with individual default values.
+
+Usage::
+
+    $ python benchmarks/bench_namedzip.py [rows]
+
+Build the `_speedups` extension in place to benchmark the C backend::
+
+    $ python setup.py build_ext --inplace
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import deque, namedtuple
+import sys
+import timeit
+
+from namedzip import namedzip, namedzip_longest
+from namedzip.namedzip import _create_zip
+
+namedzip_module = sys.modules["namedzip.namedzip"]
+
+Row = namedtuple("Row", ["a", "b", "c"])
+
+sentinel = object()
+
+
+def namedzip_generator(zipped, named_tuple, defaults=None):
+    """Generate named tuples from `zipped`, the implementation before the
+    map fast path. Replaces `sentinel` values with `defaults`."""
+
+    for vals in zipped:
+        if defaults:
+            vals = (x if x is not sentinel else defaults[i] for i, x in enumerate(vals))
+        yield named_tuple(*vals)
+
+
+def consume(iterator):
+    """Exhaust `iterator` without storing the generated rows."""
+
+    deque(iterator, maxlen=0)
+
+
+def rows_per_second(func, rows, repeat=5):
+    """Return the best rate in rows per second over `repeat` runs."""
+
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    return rows / best
+
+
+def report(title, rows, before, after):
+    """Print rates for the `before` and `after` callables."""
+
+    before_rate = rows_per_second(before, rows)
+    after_rate = rows_per_second(after, rows)
+    print(title)
+    print("  namedzip_generator:  {:>14,.0f} rows/s".format(before_rate))
+    print("  namedzip:            {:>14,.0f} rows/s".format(after_rate))
+    print("  speedup:             {:>14.2f}x".format(after_rate / before_rate))
+
+
+def main(rows=1000000):
+    columns = [list(range(rows)) for _ in Row._fields]
+    # Half of the rows are padded with a default value for field `b`.
+    padded = [columns[0], columns[1][: rows // 2], columns[2]]
+    defaults = (-1, -2, -3)
+    print("rows: {:,}".format(rows))
+    backend = "python" if namedzip_module._speedups is None else "c"
+    print("backend: {}".format(backend))
+
+    report(
+        "namedzip",
+        rows,
+        lambda: consume(namedzip_generator(_create_zip(*columns), Row)),
+        lambda: consume(namedzip(Row, *columns)),
+    )
+    report(
+        "namedzip_longest with defaults",
+        rows,
+        lambda: consume(
+            namedzip_generator(
+                _create_zip(*padded, fillvalue=sentinel, type_longest=True),
+                Row,
+                defaults,
+            )
+        ),
+        lambda: consume(namedzip_longest(Row, *padded, defaults=defaults)),
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Wall time of mapping a CPU bound function over zipped named tuples
+with `map` over `namedzip` and with `namedzip_map`.
+
+Usage::
+
+    $ python benchmarks/bench_parallel.py [rows]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+from functools import partial
+import os
+import sys
+import time
+
+from namedzip import namedzip, namedzip_map
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+def work(point):
+    """CPU bound transform of `point`."""
+
+    total = 0
+    for i in range(point.x % 100 + 2000):
+        total += i * point.y % 7
+    return total
+
+
+def seconds(func):
+    """Return the wall time of exhausting `func()`."""
+
+    start = time.perf_counter()
+    for _ in func():
+        pass
+    return time.perf_counter() - start
+
+
+def main(rows=20000):
+    xs, ys = range(rows), range(rows)
+    print("rows: {:,}, processors: {}".format(rows, os.cpu_count()))
+    cases = [("map(work, namedzip(...))", lambda: map(work, namedzip(Point, xs, ys)))]
+    for chunksize in [16, 256, 4096]:
+        cases.append(
+            (
+                "namedzip_map(chunksize={})".format(chunksize),
+                partial(namedzip_map, work, Point, xs, ys, chunksize=chunksize),
+            )
+        )
+    for title, func in cases:
+        print("{:<36}{:>8.3f}s".format(title, seconds(func)))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
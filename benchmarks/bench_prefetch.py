@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Wall time of zipping slow, I/O bound iterables with and without
+prefetching.
+
+Each iterable sleeps for `delay` seconds before every value, simulating
+a file, database cursor or network source.
+
+Usage::
+
+    $ python benchmarks/bench_prefetch.py [rows] [delay]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+import sys
+import time
+
+from namedzip import namedzip
+
+Row = namedtuple("Row", ["a", "b", "c", "d"])
+
+
+def slow_source(rows, delay):
+    """Generate `rows` values, sleeping `delay` seconds before each."""
+
+    for value in range(rows):
+        time.sleep(delay)
+        yield value
+
+
+def seconds(rows, delay, prefetch):
+    """Return the wall time of zipping four slow sources."""
+
+    sources = [slow_source(rows, delay) for _ in Row._fields]
+    start = time.perf_counter()
+    for _ in namedzip(Row, *sources, prefetch=prefetch):
+        pass
+    return time.perf_counter() - start
+
+
+def main(rows=200, delay=0.001):
+    print("rows: {:,}, delay per value: {}s, sources: 4".format(rows, delay))
+    for prefetch in [0, 1, 16, 256]:
+        print(
+            "prefetch={:<6}{:>8.3f}s".format(prefetch, seconds(rows, delay, prefetch))
+        )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:3]
+    main(*[convert(arg) for convert, arg in zip([int, float], args)])
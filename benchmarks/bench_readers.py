@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Time and peak memory of zipping binary column files read into lists
+and memory-mapped with `MappedColumn`.
+
+Usage::
+
+    $ python benchmarks/bench_readers.py [rows]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from array import array
+from collections import namedtuple
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from namedzip import MappedColumn, namedzip
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+def peak_mb():
+    """Return the peak resident set size of this process in megabytes."""
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def consume(rows):
+    """Exhaust `rows` and return the elapsed wall time."""
+
+    start = time.perf_counter()
+    for _ in rows:
+        pass
+    return time.perf_counter() - start
+
+
+def main(rows=5000000):
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, name) for name in Point._fields]
+        for path in paths:
+            with open(path, "wb") as file:
+                array("d", range(rows)).tofile(file)
+        print("rows: {:,}, file size: {:.0f}MB each".format(rows, rows * 8 / 2 ** 20))
+        print("{:<16}{:>10}{:>12}".format("", "time", "peak RSS"))
+
+        # Memory-mapped first, since the peak resident set size never shrinks.
+        columns = [MappedColumn(path, "d") for path in paths]
+        seconds = consume(namedzip(Point, *columns))
+        print("{:<16}{:>9.3f}s{:>10.0f}MB".format("MappedColumn", seconds, peak_mb()))
+        for column in columns:
+            column.close()
+
+        start = time.perf_counter()
+        columns = []
+        for path in paths:
+            column = array("d")
+            with open(path, "rb") as file:
+                column.fromfile(file, rows)
+            columns.append(column.tolist())
+        seconds = time.perf_counter() - start + consume(namedzip(Point, *columns))
+        print("{:<16}{:>9.3f}s{:>10.0f}MB".format("read to list", seconds, peak_mb()))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Memory per row and construction speed of row types created by
+`namedzip`: named tuples, `namedrecord` classes and, on Python 3.10 and
+later, dataclasses with slots.
+
+Usage::
+
+    $ python benchmarks/bench_records.py [rows]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+from itertools import repeat
+import sys
+import timeit
+import tracemalloc
+
+from namedzip import namedrecord, namedzip
+
+namedzip_module = sys.modules["namedzip.namedzip"]
+
+FIELDS = ["a", "b", "c", "d"]
+
+
+def row_types():
+    """Return (title, class) pairs of the compared row types."""
+
+    types = [
+        ("collections.namedtuple", namedtuple("Row", FIELDS)),
+        ("namedrecord", namedrecord("Row", FIELDS)),
+    ]
+    if sys.version_info >= (3, 10):
+        import dataclasses
+
+        types.append(
+            (
+                "dataclass(slots=True)",
+                dataclasses.make_dataclass("Row", FIELDS, slots=True),
+            )
+        )
+    return types
+
+
+def bytes_per_row(row_type, rows):
+    """Return the memory allocated per row, excluding the values."""
+
+    columns = [repeat(None, rows) for _ in FIELDS]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = list(namedzip(row_type, *columns))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(kept)) / rows
+
+
+def rows_per_second(row_type, rows):
+    """Return the number of rows created per second."""
+
+    columns = [list(range(rows))] * len(FIELDS)
+    best = min(
+        timeit.repeat(lambda: list(namedzip(row_type, *columns)), number=1, repeat=5)
+    )
+    return rows / best
+
+
+def main(rows=200000):
+    backend = "python" if namedzip_module._speedups is None else "c"
+    print("rows: {:,}, fields: {}, backend: {}".format(rows, len(FIELDS), backend))
+    print("{:<26}{:>12}{:>16}".format("", "bytes/row", "rows/s"))
+    for title, row_type in row_types():
+        print(
+            "{:<26}{:>12.1f}{:>16,.0f}".format(
+                title, bytes_per_row(row_type, rows), rows_per_second(row_type, rows)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Wall time and peak memory of splitting a stream of named tuples into
+columns with `namedunzip`, against ``zip(*rows)``.
+
+Usage::
+
+    $ python benchmarks/bench_unzip.py [rows]
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+import sys
+import time
+import tracemalloc
+
+from namedzip import namedunzip, namedzip
+
+Point = namedtuple("Point", ["x", "y", "z"])
+
+
+def measure(func):
+    """Return the wall time and peak traced memory of `func()`."""
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(rows=1000000):
+    xs = [float(i) for i in range(rows)]
+
+    def stream():
+        return namedzip(Point, xs, xs, xs)
+
+    cases = [
+        ("zip(*rows)", lambda: list(zip(*stream()))),
+        ("namedunzip list", lambda: namedunzip(Point, stream())),
+        ("namedunzip array", lambda: namedunzip(Point, stream(), container="d")),
+    ]
+    try:
+        import numpy
+    except ImportError:
+        pass
+    else:
+        cases.append(
+            (
+                "namedunzip numpy",
+                lambda: namedunzip(Point, stream(), container=numpy.float64),
+            )
+        )
+    print("rows: {}".format(rows))
+    for name, func in cases:
+        elapsed, peak = measure(func)
+        print("{:<18} {:.3f}s, peak {:.1f} MB".format(name, elapsed, peak / 1e6))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""Benchmark suite for `namedzip` and `namedzip_longest`.
+
+Times each case with `timeit` at row counts from 10 to 10,000,000 and
+reports the best time per row in nanoseconds. Cases cover `namedzip`
+against raw `zip` and `zip_longest`, direct calls against factory functions,
+`namedzip_longest` with a fill value against individual defaults, and
+the deprecated `typename`/`field_names` api. The `stats`, `columns`,
+`converters` and `where` arguments are timed against their overhead
+free or hand written equivalents, `where` at 1%, 10% and 50%
+selectivity.
+
+Results are saved as JSON, and two result files can be compared to
+spot regressions. ``benchmarks/baseline.json`` holds the stored
+baseline, which `compare` uses by default.
+
+Usage::
+
+    $ python benchmarks/suite.py run [--max-rows N] [--output FILE]
+
+All row counts are run by default, so results cover every case of the
+baseline.
+    $ python benchmarks/suite.py compare [BASELINE] CURRENT [--threshold PCT]
+
+`compare` exits with status 1 if any case is slower than the baseline
+by more than the threshold percentage.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import argparse
+from collections import namedtuple
+from functools import partial
+from itertools import zip_longest
+import json
+import os
+import platform
+import sys
+import timeit
+import warnings
+
+from namedzip import namedzip, namedzip_longest
+
+namedzip_module = sys.modules["namedzip.namedzip"]
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+ROW_COUNTS = [10, 1000, 100000, 1000000, 10000000]
+
+Point = namedtuple("Point", ["x", "y", "z"])
+Input = namedtuple("Input", ["z", "extra", "x", "y"])
+
+
+def cases(rows):
+    """Return (name, function) pairs which each zip `rows` rows.
+
+    The last column is half as long as the others, so the longest cases
+    fill in missing values for half of the rows. The `where` cases and
+    the generators they replace keep 1%, 10% and 50% of the rows.
+
+    """
+
+    xs, ys, zs = list(range(rows)), list(range(rows)), list(range(rows // 2))
+    strings = list(map(str, xs))
+    zip_points = namedzip(Point)
+    zip_longest_points = namedzip_longest(Point, defaults=[0, 1, 2])
+    zip_columns = namedzip(Point, columns=Input._fields)
+    zip_converted = namedzip(Point, converters={"x": int, "y": float})
+    zip_ok = namedzip(Point, where={"z": "ok".__eq__})
+
+    def deprecated():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return namedzip(typename="Point", field_names=["x", "y", "z"])(xs, ys, ys)
+
+    def deprecated_longest():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return namedzip_longest(
+                typename="Point", field_names=["x", "y", "z"], defaults=[0, 1, 2]
+            )(xs, ys, zs)
+
+    def reordered():
+        for row in namedzip(Input, ys, ys, xs, ys):
+            yield Point(row.x, row.y, row.z)
+
+    def converted():
+        for row in namedzip(Point, strings, strings, strings):
+            yield Point(int(row.x), float(row.y), row.z)
+
+    def filtered(statuses):
+        rows = namedzip(Point, xs, ys, statuses)
+        return (row for row in rows if row.z == "ok")
+
+    selective = []
+    for percent in (1, 10, 50):
+        period = 100 // percent
+        statuses = ["ok" if i % period == 0 else "failed" for i in range(rows)]
+        selective += [
+            (
+                "namedzip filtering generator {}%".format(percent),
+                partial(filtered, statuses),
+            ),
+            ("namedzip where {}%".format(percent), partial(zip_ok, xs, ys, statuses)),
+        ]
+
+    return [
+        ("zip", lambda: zip(xs, ys, ys)),
+        ("namedzip", lambda: namedzip(Point, xs, ys, ys)),
+        ("namedzip factory", lambda: zip_points(xs, ys, ys)),
+        ("namedzip v1", deprecated),
+        ("zip_longest", lambda: zip_longest(xs, ys, zs, fillvalue=0)),
+        (
+            "namedzip_longest fillvalue",
+            lambda: namedzip_longest(Point, xs, ys, zs, fillvalue=0),
+        ),
+        (
+            "namedzip_longest defaults",
+            lambda: namedzip_longest(Point, xs, ys, zs, defaults=[0, 1, 2]),
+        ),
+        ("namedzip_longest factory", lambda: zip_longest_points(xs, ys, zs)),
+        ("namedzip_longest v1", deprecated_longest),
+        ("namedzip stats", lambda: namedzip(Point, xs, ys, ys, stats=True)),
+        (
+            "namedzip_longest stats",
+            lambda: namedzip_longest(Point, xs, ys, zs, defaults=[0, 1, 2], stats=True),
+        ),
+        ("namedzip reordering generator", reordered),
+        ("namedzip columns names", lambda: zip_columns(ys, ys, xs, ys)),
+        (
+            "namedzip columns mapping",
+            lambda: namedzip(Point, columns={"z": ys, "extra": ys, "x": xs, "y": ys}),
+        ),
+        ("namedzip converting generator", converted),
+        ("namedzip converters", lambda: zip_converted(strings, strings, strings)),
+    ] + selective
+
+
+def time_per_row(func, rows, repeat=5):
+    """Return the best time per row in nanoseconds to exhaust `func()`."""
+
+    # Small row counts are repeated to keep each measurement above ~10ms.
+    number = max(1, 100000 // rows)
+
+    def consume():
+        for _ in func():
+            pass
+
+    best = min(timeit.repeat(consume, number=number, repeat=repeat))
+    return best / number / rows * 1e9
+
+
+def run(max_rows=None, output=None):
+    """Run the suite and return the results, saving them to `output`."""
+
+    results = {
+        "python": platform.python_version(),
+        "backend": "python" if namedzip_module._speedups is None else "c",
+        "ns_per_row": {},
+    }
+    print("python {python}, backend {backend}".format(**results))
+    for rows in ROW_COUNTS:
+        if max_rows is not None and rows > max_rows:
+            continue
+        # Repeats are reduced for the largest row counts.
+        repeat = 5 if rows <= 100000 else 2
+        for name, func in cases(rows):
+            key = "{} [{}]".format(name, rows)
+            results["ns_per_row"][key] = time_per_row(func, rows, repeat)
+            print("{:<42}{:>10.1f} ns/row".format(key, results["ns_per_row"][key]))
+    if output:
+        with open(output, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print("saved to {}".format(output))
+    return results
+
+
+def compare(baseline, current, threshold=10.0):
+    """Print the change per case and return the regressed case names."""
+
+    regressions = []
+    print("{:<42}{:>12}{:>12}{:>10}".format("", "baseline", "current", "change"))
+    for key, now in sorted(current["ns_per_row"].items()):
+        before = baseline["ns_per_row"].get(key)
+        if before is None:
+            continue
+        change = (now - before) / before * 100
+        flag = ""
+        if change > threshold:
+            flag = "  slower"
+            regressions.append(key)
+        print(
+            "{:<42}{:>10.1f}ns{:>10.1f}ns{:>+9.1f}%{}".format(
+                key, before, now, change, flag
+            )
+        )
+    return regressions
+
+
+def load(path):
+    """Return the results saved in `path`."""
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command")
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument(
+        "--max-rows", type=int, help="largest row count to run (default is all)"
+    )
+    run_parser.add_argument("--output", help="JSON file to save the results to")
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("files", nargs="+", help="[BASELINE] CURRENT")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=10.0, help="regression threshold in %%"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        run(args.max_rows, args.output)
+    elif args.command == "compare":
+        if len(args.files) > 2:
+            parser.error("compare takes at most two files")
+        paths = [BASELINE] + args.files if len(args.files) == 1 else args.files
+        baseline, current = map(load, paths)
+        if compare(baseline, current, args.threshold):
+            return 1
+    else:
+        parser.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
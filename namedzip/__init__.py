@@ -1,5 +1,31 @@
-from .namedzip import namedzip, namedzip_longest
+from .namedzip import namedzip, namedzip_batches, namedzip_longest
+from .arrays import namedzip_array
+from .join import namedzip_join
+from .parallel import namedzip_map
+from .readers import MappedColumn, namedzip_csv
+from .records import namedrecord
+from .unzip import namedunzip
+from .view import NamedZipView
 from collections import namedtuple
+import sys
 
-__all__ = ["namedtuple", "namedzip", "namedzip_longest"]
+__all__ = [
+    "MappedColumn",
+    "NamedZipView",
+    "namedrecord",
+    "namedtuple",
+    "namedunzip",
+    "namedzip",
+    "namedzip_array",
+    "namedzip_batches",
+    "namedzip_csv",
+    "namedzip_join",
+    "namedzip_longest",
+    "namedzip_map",
+]
 __version__ = "1.1.0"
+
+if sys.version_info >= (3, 5):  # Requires async/await syntax.
+    from .aio import anamedzip, anamedzip_longest
+
+    __all__ += ["anamedzip", "anamedzip_longest"]
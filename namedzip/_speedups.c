@@ -0,0 +1,450 @@
+/* Optional C accelerator for the namedzip row-building loop.
+ *
+ * Implements `NamedZipIterator`, which zips iterables like `zip` or
+ * `itertools.zip_longest` and builds named tuple objects directly from
+ * the zipped values, replacing missing values with individual defaults
+ * and skipping rows rejected by field predicates.
+ * The pure-Python implementation in `namedzip.namedzip` is used when this
+ * module is not available.
+ *
+ * copyright: (c) 2019 by Erik R Berlin.
+ * license: MIT, see LICENSE for more details.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+typedef struct {
+    PyObject_HEAD
+    PyTypeObject *row_type;  /* Named tuple class. */
+    PyObject **iterators;    /* NULL once exhausted (longest only). */
+    PyObject *fillvalues;    /* Tuple of fill values, or NULL for zip. */
+    Py_ssize_t *where_indices;  /* Field index of each predicate. */
+    PyObject **predicates;   /* Predicates, or NULL if not filtered. */
+    Py_ssize_t where_size;
+    Py_ssize_t size;
+    Py_ssize_t active;
+    int fast;
+} NamedZipIteratorObject;
+
+static PyTypeObject NamedZipIterator_Type;
+
+/* Store the (index, predicate) pairs of `where`. */
+static int
+namedzip_iterator_set_where(NamedZipIteratorObject *nz, PyObject *where)
+{
+    Py_ssize_t i, n = PyTuple_GET_SIZE(where);
+
+    nz->where_indices = PyMem_New(Py_ssize_t, n);
+    nz->predicates = PyMem_New(PyObject *, n);
+    if (nz->where_indices == NULL || nz->predicates == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (i = 0; i < n; i++) {
+        nz->predicates[i] = NULL;
+    }
+    nz->where_size = n;
+    for (i = 0; i < n; i++) {
+        PyObject *pair = PyTuple_GET_ITEM(where, i);
+        Py_ssize_t index;
+
+        if (!PyTuple_Check(pair) || PyTuple_GET_SIZE(pair) != 2) {
+            PyErr_SetString(PyExc_TypeError,
+                            "where must be a tuple of (index, predicate) "
+                            "pairs");
+            return -1;
+        }
+        index = PyNumber_AsSsize_t(PyTuple_GET_ITEM(pair, 0),
+                                   PyExc_IndexError);
+        if (index == -1 && PyErr_Occurred()) {
+            return -1;
+        }
+        if (index < 0 || index >= nz->size) {
+            PyErr_SetString(PyExc_IndexError, "where index out of range");
+            return -1;
+        }
+        nz->where_indices[i] = index;
+        nz->predicates[i] = PyTuple_GET_ITEM(pair, 1);
+        Py_INCREF(nz->predicates[i]);
+    }
+    return 0;
+}
+
+static PyObject *
+namedzip_iterator_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"named_tuple", "iterables", "fast", "longest",
+                             "fillvalue", "defaults", "where", NULL};
+    PyObject *row_type, *iterables, *fillvalue, *defaults;
+    PyObject *where = NULL;
+    int fast, longest;
+    Py_ssize_t i, size;
+    NamedZipIteratorObject *nz;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds,
+                                     "O!O!ppOO|O!:NamedZipIterator", kwlist, &PyType_Type, &row_type,
+                                     &PyTuple_Type, &iterables, &fast,
+                                     &longest, &fillvalue, &defaults,
+                                     &PyTuple_Type, &where)) {
+        return NULL;
+    }
+    if (fast && !PyType_IsSubtype((PyTypeObject *)row_type, &PyTuple_Type)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "fast row construction requires a tuple subclass");
+        return NULL;
+    }
+    size = PyTuple_GET_SIZE(iterables);
+    if (longest && defaults != Py_None) {
+        defaults = PySequence_Tuple(defaults);
+        if (defaults == NULL) {
+            return NULL;
+        }
+        if (PyTuple_GET_SIZE(defaults) != size) {
+            PyErr_Format(PyExc_ValueError,
+                         "Unequal number of iterable objects (%zd) and "
+                         "default values (%zd).",
+                         size, PyTuple_GET_SIZE(defaults));
+            Py_DECREF(defaults);
+            return NULL;
+        }
+    }
+    else {
+        defaults = NULL;
+    }
+
+    nz = (NamedZipIteratorObject *)type->tp_alloc(type, 0);
+    if (nz == NULL) {
+        Py_XDECREF(defaults);
+        return NULL;
+    }
+    nz->size = size;
+    nz->active = size;
+    nz->fast = fast;
+    nz->where_indices = NULL;
+    nz->predicates = NULL;
+    nz->where_size = 0;
+    Py_INCREF(row_type);
+    nz->row_type = (PyTypeObject *)row_type;
+    nz->iterators = PyMem_New(PyObject *, size > 0 ? size : 1);
+    if (nz->iterators == NULL) {
+        Py_XDECREF(defaults);
+        Py_DECREF(nz);
+        return PyErr_NoMemory();
+    }
+    for (i = 0; i < size; i++) {
+        nz->iterators[i] = NULL;
+    }
+    for (i = 0; i < size; i++) {
+        PyObject *it = PyObject_GetIter(PyTuple_GET_ITEM(iterables, i));
+        if (it == NULL) {
+            Py_XDECREF(defaults);
+            Py_DECREF(nz);
+            return NULL;
+        }
+        nz->iterators[i] = it;
+    }
+    if (longest && defaults == NULL) {
+        defaults = PyTuple_New(size);
+        if (defaults == NULL) {
+            Py_DECREF(nz);
+            return NULL;
+        }
+        for (i = 0; i < size; i++) {
+            Py_INCREF(fillvalue);
+            PyTuple_SET_ITEM(defaults, i, fillvalue);
+        }
+    }
+    nz->fillvalues = defaults;
+    if (where != NULL && PyTuple_GET_SIZE(where) > 0
+        && namedzip_iterator_set_where(nz, where) < 0) {
+        Py_DECREF(nz);
+        return NULL;
+    }
+    return (PyObject *)nz;
+}
+
+static void
+namedzip_iterator_dealloc(NamedZipIteratorObject *nz)
+{
+    Py_ssize_t i;
+
+    PyObject_GC_UnTrack(nz);
+    if (nz->iterators != NULL) {
+        for (i = 0; i < nz->size; i++) {
+            Py_XDECREF(nz->iterators[i]);
+        }
+        PyMem_Free(nz->iterators);
+    }
+    if (nz->predicates != NULL) {
+        for (i = 0; i < nz->where_size; i++) {
+            Py_XDECREF(nz->predicates[i]);
+        }
+        PyMem_Free(nz->predicates);
+    }
+    PyMem_Free(nz->where_indices);
+    Py_XDECREF(nz->fillvalues);
+    Py_XDECREF(nz->row_type);
+    Py_TYPE(nz)->tp_free(nz);
+}
+
+static int
+namedzip_iterator_traverse(NamedZipIteratorObject *nz, visitproc visit,
+                           void *arg)
+{
+    Py_ssize_t i;
+
+    if (nz->iterators != NULL) {
+        for (i = 0; i < nz->size; i++) {
+            Py_VISIT(nz->iterators[i]);
+        }
+    }
+    if (nz->predicates != NULL) {
+        for (i = 0; i < nz->where_size; i++) {
+            Py_VISIT(nz->predicates[i]);
+        }
+    }
+    Py_VISIT(nz->fillvalues);
+    Py_VISIT(nz->row_type);
+    return 0;
+}
+
+/* Fetch the next value from iterator `i`. Returns a new reference, or
+ * NULL with no exception set when the zip is exhausted. */
+static PyObject *
+namedzip_iterator_value(NamedZipIteratorObject *nz, Py_ssize_t i)
+{
+    PyObject *it = nz->iterators[i];
+    PyObject *item;
+
+    if (it == NULL) {
+        item = PyTuple_GET_ITEM(nz->fillvalues, i);
+        Py_INCREF(item);
+        return item;
+    }
+    item = (*Py_TYPE(it)->tp_iternext)(it);
+    if (item != NULL) {
+        return item;
+    }
+    if (PyErr_Occurred()) {
+        if (!PyErr_ExceptionMatches(PyExc_StopIteration)) {
+            return NULL;
+        }
+        PyErr_Clear();
+    }
+    if (nz->fillvalues == NULL) {
+        return NULL;
+    }
+    nz->iterators[i] = NULL;
+    Py_DECREF(it);
+    nz->active--;
+    if (nz->active == 0) {
+        return NULL;
+    }
+    item = PyTuple_GET_ITEM(nz->fillvalues, i);
+    Py_INCREF(item);
+    return item;
+}
+
+/* Return 1 if the predicates accept the values in `values`, 0 if not,
+ * or -1 on error. */
+static int
+namedzip_iterator_accept(NamedZipIteratorObject *nz, PyObject *values)
+{
+    Py_ssize_t i;
+    PyObject *result;
+    int accepted;
+
+    for (i = 0; i < nz->where_size; i++) {
+        result = PyObject_CallFunctionObjArgs(
+            nz->predicates[i],
+            PyTuple_GET_ITEM(values, nz->where_indices[i]), NULL);
+        if (result == NULL) {
+            return -1;
+        }
+        accepted = PyObject_IsTrue(result);
+        Py_DECREF(result);
+        if (accepted <= 0) {
+            return accepted;
+        }
+    }
+    return 1;
+}
+
+/* Zip rows into a new tuple until the predicates accept one, and build
+ * the row from it. Values of rejected rows are released and the tuple
+ * is refilled, so no row is allocated per rejected row. The tuple is
+ * owned by this call, so iterators or predicates which advance the
+ * same iterator again fill their own. */
+static PyObject *
+namedzip_iterator_next_filtered(NamedZipIteratorObject *nz)
+{
+    Py_ssize_t i, size = nz->size;
+    PyObject *values, *item, *row;
+    int accepted;
+
+    if (nz->fast) {
+        values = nz->row_type->tp_alloc(nz->row_type, size);
+    }
+    else {
+        values = PyTuple_New(size);
+    }
+    if (values == NULL) {
+        return NULL;
+    }
+    for (;;) {
+        for (i = 0; i < size; i++) {
+            item = namedzip_iterator_value(nz, i);
+            if (item == NULL) {
+                Py_DECREF(values);
+                return NULL;
+            }
+            PyTuple_SET_ITEM(values, i, item);
+        }
+        accepted = namedzip_iterator_accept(nz, values);
+        if (accepted > 0) {
+            break;
+        }
+        if (accepted < 0) {
+            Py_DECREF(values);
+            return NULL;
+        }
+        for (i = 0; i < size; i++) {
+            item = PyTuple_GET_ITEM(values, i);
+            PyTuple_SET_ITEM(values, i, NULL);
+            Py_DECREF(item);
+        }
+    }
+    if (nz->fast) {
+        return values;
+    }
+    row = PyObject_Call((PyObject *)nz->row_type, values, NULL);
+    Py_DECREF(values);
+    return row;
+}
+
+static PyObject *
+namedzip_iterator_next(NamedZipIteratorObject *nz)
+{
+    Py_ssize_t i, size = nz->size;
+    PyObject *values, *item, *row;
+
+    if (size == 0 || nz->active == 0) {
+        return NULL;
+    }
+    if (nz->predicates != NULL) {
+        return namedzip_iterator_next_filtered(nz);
+    }
+    if (nz->fast) {
+        values = nz->row_type->tp_alloc(nz->row_type, size);
+    }
+    else {
+        values = PyTuple_New(size);
+    }
+    if (values == NULL) {
+        return NULL;
+    }
+    for (i = 0; i < size; i++) {
+        item = namedzip_iterator_value(nz, i);
+        if (item == NULL) {
+            Py_DECREF(values);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(values, i, item);
+    }
+    if (nz->fast) {
+        return values;
+    }
+    row = PyObject_Call((PyObject *)nz->row_type, values, NULL);
+    Py_DECREF(values);
+    return row;
+}
+
+PyDoc_STRVAR(namedzip_iterator_doc,
+"NamedZipIterator(named_tuple, iterables, fast, longest, fillvalue, defaults,\n\
+                 where=())\n\
+--\n\
+\n\
+Zip `iterables` and build `named_tuple` objects from the zipped values.\n\
+\n\
+Behaves like `zip` when `longest` is false, and like\n\
+`itertools.zip_longest` with `fillvalue`, or with one default value per\n\
+iterable from `defaults`, when `longest` is true. Rows are allocated\n\
+directly as `named_tuple` instances when `fast` is true, otherwise\n\
+`named_tuple` is called with the unpacked values.\n\
+\n\
+`where` is a tuple of (index, predicate) pairs. Rows are only generated\n\
+if every predicate returns a true value for the value at its index, and\n\
+rejected rows are skipped without allocating them.");
+
+static PyTypeObject NamedZipIterator_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "namedzip._speedups.NamedZipIterator",  /* tp_name */
+    sizeof(NamedZipIteratorObject),         /* tp_basicsize */
+    0,                                      /* tp_itemsize */
+    (destructor)namedzip_iterator_dealloc,  /* tp_dealloc */
+    0,                                      /* tp_vectorcall_offset */
+    0,                                      /* tp_getattr */
+    0,                                      /* tp_setattr */
+    0,                                      /* tp_as_async */
+    0,                                      /* tp_repr */
+    0,                                      /* tp_as_number */
+    0,                                      /* tp_as_sequence */
+    0,                                      /* tp_as_mapping */
+    0,                                      /* tp_hash */
+    0,                                      /* tp_call */
+    0,                                      /* tp_str */
+    PyObject_GenericGetAttr,                /* tp_getattro */
+    0,                                      /* tp_setattro */
+    0,                                      /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,  /* tp_flags */
+    namedzip_iterator_doc,                  /* tp_doc */
+    (traverseproc)namedzip_iterator_traverse,  /* tp_traverse */
+    0,                                      /* tp_clear */
+    0,                                      /* tp_richcompare */
+    0,                                      /* tp_weaklistoffset */
+    PyObject_SelfIter,                      /* tp_iter */
+    (iternextfunc)namedzip_iterator_next,   /* tp_iternext */
+    0,                                      /* tp_methods */
+    0,                                      /* tp_members */
+    0,                                      /* tp_getset */
+    0,                                      /* tp_base */
+    0,                                      /* tp_dict */
+    0,                                      /* tp_descr_get */
+    0,                                      /* tp_descr_set */
+    0,                                      /* tp_dictoffset */
+    0,                                      /* tp_init */
+    PyType_GenericAlloc,                    /* tp_alloc */
+    namedzip_iterator_new,                  /* tp_new */
+    PyObject_GC_Del,                        /* tp_free */
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "namedzip._speedups",
+    "C accelerator for the namedzip row-building loop.",
+    -1,
+    NULL,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    PyObject *module;
+
+    if (PyType_Ready(&NamedZipIterator_Type) < 0) {
+        return NULL;
+    }
+    module = PyModule_Create(&speedups_module);
+    if (module == NULL) {
+        return NULL;
+    }
+    Py_INCREF(&NamedZipIterator_Type);
+    if (PyModule_AddObject(module, "NamedZipIterator",
+                           (PyObject *)&NamedZipIterator_Type) < 0) {
+        Py_DECREF(&NamedZipIterator_Type);
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""This module implements `anamedzip` and `anamedzip_longest`, which
+zip asynchronous and synchronous iterables into named tuples like
+`namedzip` and `namedzip_longest` do for synchronous iterables.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from .namedzip import (
+    _compare_iterables_to_fields,
+    _default_values,
+    _named_tuple_info,
+    _row_maker,
+    _set_defaults,
+    sentinel,
+)
+
+
+def anamedzip(named_tuple, *iterables):
+    """Extends :func:`namedzip` to asynchronous iterables.
+
+    Returns an asynchronous iterator if `*iterables` are supplied,
+    otherwise returns a function for creating asynchronous iterators.
+    The next values of all asynchronous iterables are awaited
+    concurrently with `asyncio.gather`.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+    *iterables : iterable or asynchronous iterable, optional
+        Objects to zip, any mix of synchronous and asynchronous
+        iterables.
+
+    Returns
+    -------
+    asynchronous iterator object
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    """
+
+    field_count = _named_tuple_info(named_tuple).field_count
+
+    def _anamedzip_factory(*iterables):
+        _compare_iterables_to_fields(len(iterables), field_count)
+        return _AsyncNamedZip(named_tuple, iterables)
+
+    if iterables:
+        return _anamedzip_factory(*iterables)
+    else:
+        return _anamedzip_factory
+
+
+def anamedzip_longest(named_tuple, *iterables, fillvalue=None, defaults=None):
+    """Extends :func:`namedzip_longest` to asynchronous iterables.
+
+    Returns an asynchronous iterator if `*iterables` are supplied,
+    otherwise returns a function for creating asynchronous iterators.
+    The next values of all asynchronous iterables which are not
+    exhausted are awaited concurrently with `asyncio.gather`.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+    *iterables : iterable or asynchronous iterable, optional
+        Objects to zip, any mix of synchronous and asynchronous
+        iterables.
+    fillvalue : optional
+        Use for setting all missing values to the same default value.
+        (default is None).
+    defaults : iterable, optional
+        Individual default values for each iterable to zip, applied
+        like the `defaults` of `namedzip_longest`.
+
+    Returns
+    -------
+    asynchronous iterator object
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    """
+
+    field_count = _named_tuple_info(named_tuple).field_count
+    defaults = _set_defaults(defaults, fillvalue, named_tuple)
+    defaults = _default_values(defaults, fillvalue, field_count)
+
+    def _anamedzip_longest_factory(*iterables):
+        _compare_iterables_to_fields(len(iterables), field_count)
+        return _AsyncNamedZip(named_tuple, iterables, defaults)
+
+    if iterables:
+        return _anamedzip_longest_factory(*iterables)
+    else:
+        return _anamedzip_longest_factory
+
+
+class _AsyncNamedZip:
+    """Asynchronous iterator of named tuples.
+
+    Zips like `zip` if `defaults` is None, otherwise like `zip_longest`
+    with an individual fill value for each iterable.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+    iterables : tuple
+        Synchronous and asynchronous iterables to zip.
+    defaults : tuple or None, optional
+        Fill value for each of the `iterables`. (default is None).
+
+    """
+
+    def __init__(self, named_tuple, iterables, defaults=None):
+        self._make_row = _row_maker(named_tuple)
+        # Asynchronous iterators are flagged True, synchronous ones False.
+        self._sources = [
+            (iterable.__aiter__(), True)
+            if hasattr(iterable, "__aiter__")
+            else (iter(iterable), False)
+            for iterable in iterables
+        ]
+        self._defaults = defaults
+        self._active = len(self._sources)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._active:
+            raise StopAsyncIteration
+        values = [sentinel] * len(self._sources)
+        pending = []
+        for i, (source, is_async) in enumerate(self._sources):
+            if source is None:
+                values[i] = self._defaults[i]
+            elif is_async:
+                pending.append(i)
+            else:
+                values[i] = next(source, sentinel)
+                if values[i] is sentinel and not self._exhausted(i, values):
+                    raise StopAsyncIteration
+        if pending:
+            # Imported here, as `asyncio` is slow to import with the package.
+            from asyncio import gather
+
+            results = await gather(*(_anext(self._sources[i][0]) for i in pending))
+            for i, value in zip(pending, results):
+                values[i] = value
+                if value is sentinel and not self._exhausted(i, values):
+                    raise StopAsyncIteration
+        return self._make_row(values)
+
+    def _exhausted(self, i, values):
+        """Handle exhaustion of source `i`.
+
+        Replaces the missing value with its default and returns True if
+        the row is still valid, otherwise ends iteration and returns
+        False.
+
+        """
+
+        if self._defaults is None:
+            self._active = 0
+            return False
+        self._sources[i] = (None, False)
+        self._active -= 1
+        values[i] = self._defaults[i]
+        return bool(self._active)
+
+
+async def _anext(iterator):
+    """Await the next value of `iterator`, or `sentinel` when exhausted."""
+
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return sentinel
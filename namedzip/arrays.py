@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""This module implements `namedzip_array`, which zips array-like
+columns into a NumPy record array with one field per named tuple
+field name.
+
+NumPy is an optional dependency, imported on the first call of
+`namedzip_array`. Without it `namedzip_array` falls back to returning a
+list of named tuples.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from .namedzip import (
+    _compare_iterables_to_fields,
+    _default_values,
+    _import_numpy,
+    _named_tuple_info,
+    _set_defaults,
+    namedzip,
+    namedzip_longest,
+)
+
+
+def namedzip_array(
+    named_tuple, *iterables, longest=False, fillvalue=None, defaults=None, dtype=None
+):
+    """Zip array-like columns into a NumPy record array.
+
+    Columns are converted with `numpy.asarray` and combined into a
+    `numpy.recarray` in one vectorized step, without creating a named
+    tuple per row. Columns are truncated to the shortest one, or, if
+    `longest` is True, padded to the longest one with `fillvalue` or
+    individual `defaults` like `namedzip_longest`.
+
+    Returns a list of named tuples from `namedzip` or `namedzip_longest`
+    instead if NumPy is not installed.
+
+    Returns a record array if `*iterables` are supplied, otherwise
+    returns a function for creating record arrays.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`. Its field names are used as
+        the record array field names.
+    *iterables : iterable, optional
+        Array-like or iterable objects to zip.
+    longest : bool, optional
+        Pad columns like `namedzip_longest` instead of truncating them
+        like `namedzip`. (default is False).
+    fillvalue : optional
+        Passed on to `_set_defaults` when `longest` is True.
+        (default is None).
+    defaults : iterable, optional
+        Passed on to `_set_defaults` when `longest` is True.
+        (default is None).
+    dtype : data-type, optional
+        Structured data type for the record array. Inferred from the
+        columns if not specified. (default is None).
+
+    Returns
+    -------
+    numpy.recarray or list
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    """
+
+    info = _named_tuple_info(named_tuple)
+    field_count = info.field_count
+    numpy = _import_numpy()
+    if numpy is None:
+        if longest:
+            zip_rows = namedzip_longest(
+                named_tuple, fillvalue=fillvalue, defaults=defaults
+            )
+        else:
+            zip_rows = namedzip(named_tuple)
+
+        def _namedzip_array_factory(*iterables):
+            return list(zip_rows(*iterables))
+
+    else:
+        if longest:
+            defaults = _set_defaults(defaults, fillvalue, named_tuple)
+            defaults = _default_values(defaults, fillvalue, field_count)
+
+        def _namedzip_array_factory(*iterables):
+            _compare_iterables_to_fields(len(iterables), field_count)
+            columns = [_as_column(iterable) for iterable in iterables]
+            if longest:
+                size = max((len(column) for column in columns), default=0)
+                columns = [
+                    _pad_column(column, size, default)
+                    for column, default in zip(columns, defaults)
+                ]
+            else:
+                size = min((len(column) for column in columns), default=0)
+                columns = [column[:size] for column in columns]
+            if dtype is None:
+                return numpy.rec.fromarrays(columns, names=info.fields)
+            return numpy.rec.fromarrays(columns, dtype=dtype)
+
+    if iterables:
+        return _namedzip_array_factory(*iterables)
+    else:
+        return _namedzip_array_factory
+
+
+def _as_column(iterable):
+    """Convert `iterable` to a one-dimensional NumPy array.
+
+    Arrays and sequences are converted by `numpy.asarray` without
+    copying where possible. Other iterables are collected into a list
+    first.
+
+    Parameters
+    ----------
+    iterable : iterable
+
+    Returns
+    -------
+    numpy.ndarray
+
+    """
+
+    if not hasattr(iterable, "__len__"):
+        iterable = list(iterable)
+    return _import_numpy().asarray(iterable)
+
+
+def _pad_column(column, size, default):
+    """Pad `column` with `default` up to `size` elements.
+
+    The column is returned unchanged if it is long enough. Otherwise a
+    new array is allocated with a data type which can hold both the
+    column values and `default`, and filled with two slice assignments.
+
+    Parameters
+    ----------
+    column : numpy.ndarray
+    size : int
+    default :
+        Value for the padded elements.
+
+    Returns
+    -------
+    numpy.ndarray
+
+    """
+
+    if len(column) >= size:
+        return column
+    numpy = _import_numpy()
+    fill = numpy.asarray(default)
+    padded = numpy.empty(size, dtype=numpy.result_type(column, fill))
+    padded[: len(column)] = column
+    padded[len(column) :] = fill
+    return padded
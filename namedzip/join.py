@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""This module implements `namedzip_join`, which aligns iterables sorted
+by a key into named tuples with a streaming merge join.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from .namedzip import (
+    _compare_iterables_to_fields,
+    _default_values,
+    _named_tuple_info,
+    _row_maker,
+    _set_defaults,
+)
+
+# Marks an exhausted iterable in `_merge_join`.
+_end = object()
+
+
+def namedzip_join(
+    named_tuple, *sorted_iterables, key=None, fillvalue=None, defaults=None
+):
+    """Join iterables sorted by key into named tuples.
+
+    Each iterable provides the values of one field, like in `namedzip`,
+    but values are aligned by their keys instead of their positions. A
+    named tuple is generated for every key of any iterable, in order,
+    with the value of each iterable which has that key. Fields of
+    iterables without the key get `fillvalue` or individual `defaults`
+    like in `namedzip_longest`. This is a full outer join.
+
+    The iterables are merged in a single pass which holds one value per
+    iterable, so the join takes linear time and constant memory instead
+    of loading the iterables into dicts. Keys must therefore be
+    strictly increasing within each iterable.
+
+    Returns an iterator if `*sorted_iterables` are supplied, otherwise
+    returns a function for creating iterators.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+    *sorted_iterables : iterable, optional
+        Iterable objects to join, each sorted by strictly increasing
+        keys.
+    key : function, optional
+        Function which returns the key of a value, such as
+        ``operator.itemgetter(0)`` or ``operator.attrgetter("id")``.
+        Values are their own keys if None. (default is None).
+    fillvalue : optional
+        Passed on to `_set_defaults`. (default is None).
+    defaults : iterable, optional
+        Passed on to `_set_defaults`. (default is None).
+
+    Returns
+    -------
+    generator object
+        If `*sorted_iterables` are supplied.
+    function object
+        If `*sorted_iterables` are not supplied.
+
+    Raises
+    ------
+    ValueError
+        If the number of `*sorted_iterables` does not equal the number
+        of field names. During iteration, if the keys of an iterable are
+        not strictly increasing.
+
+    Examples
+    --------
+    >>> Prices = namedtuple("Prices", ["bid", "ask"])
+    >>> bids = [(1, 9.5), (2, 9.6)]
+    >>> asks = [(2, 9.8), (3, 9.9)]
+    >>> for row in namedzip_join(Prices, bids, asks, key=itemgetter(0)):
+    ...     print(row)
+    Prices(bid=(1, 9.5), ask=None)
+    Prices(bid=(2, 9.6), ask=(2, 9.8))
+    Prices(bid=None, ask=(3, 9.9))
+
+    """
+
+    field_count = _named_tuple_info(named_tuple).field_count
+    defaults = _set_defaults(defaults, fillvalue, named_tuple)
+    defaults = _default_values(defaults, fillvalue, field_count)
+    make_row = _row_maker(named_tuple)
+
+    def _namedzip_join_factory(*sorted_iterables):
+        _compare_iterables_to_fields(len(sorted_iterables), field_count)
+        iterators = [iter(iterable) for iterable in sorted_iterables]
+        return _merge_join(make_row, iterators, key, defaults)
+
+    if sorted_iterables:
+        return _namedzip_join_factory(*sorted_iterables)
+    else:
+        return _namedzip_join_factory
+
+
+def _merge_join(make_row, iterators, key, defaults):
+    """Generate rows of `namedzip_join`.
+
+    Holds the next value and key of each iterator. Every row takes the
+    values with the smallest key, and advances their iterators.
+
+    Parameters
+    ----------
+    make_row : function
+        Builds a row from a list of values.
+    iterators : list of iterator objects
+    key : function or None
+    defaults : tuple
+        Value of each field for iterators without the key of a row.
+
+    Raises
+    ------
+    ValueError
+        If the keys of an iterator are not strictly increasing.
+
+    """
+
+    values = [next(iterator, _end) for iterator in iterators]
+    if key is None:
+        keys = list(values)
+    else:
+        keys = [_end if value is _end else key(value) for value in values]
+    active = [index for index, value in enumerate(values) if value is not _end]
+    while active:
+        current = min(map(keys.__getitem__, active))
+        row = list(defaults)
+        exhausted = False
+        for index in active:
+            if keys[index] != current:
+                continue
+            row[index] = values[index]
+            value = values[index] = next(iterators[index], _end)
+            if value is _end:
+                keys[index] = _end
+                exhausted = True
+                continue
+            keys[index] = value if key is None else key(value)
+            if not current < keys[index]:
+                raise ValueError(
+                    "Keys of iterable {} are not strictly increasing, "
+                    "received {!r} after {!r}.".format(index, keys[index], current)
+                )
+        if exhausted:
+            active = [index for index in active if values[index] is not _end]
+        yield make_row(row)
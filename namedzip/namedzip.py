@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """This module implements `namedzip` and `namedzip_longest`, which
 extend `zip` and `itertools.zip_longest` respectively to generate
-named tuples.
+named tuples, and `namedzip_batches` for generating them in batches.
 
 copyright: (c) 2019 by Erik R Berlin.
 license: MIT, see LICENSE for more details.
@@ -9,47 +9,141 @@ license: MIT, see LICENSE for more details.
 """
 
 from collections import namedtuple
-from functools import wraps
+from collections.abc import Mapping, Sequence
+from functools import lru_cache, partial
 from inspect import isclass
+import io
+from itertools import chain, compress, islice, starmap, tee, zip_longest
+from operator import length_hint
+import sys
 import warnings
+from weakref import WeakKeyDictionary
+
+from .prefetch import _PrefetchIterator, _prefetch_iterables
+from .stats import _instrument, _StatsRows
+
+try:
+    from namedzip import _speedups
+except ImportError:  # pragma: no cover
+    _speedups = None
+
+try:
+    import dataclasses
+except ImportError:  # pragma: no cover
+    dataclasses = None
 
 sentinel = object()
 
 
-def _deprecation_warning(func):
-    """Deprecation warning decorator for old api signatures."""
+deprecation_message = (
+    "The typename and field_names parameters will be removed in "
+    "namedzip v2.0.0. Please use the named_tuple parameter instead."
+)
 
-    deprecation_message = (
-        "The typename and field_names parameters will be removed in "
-        "namedzip v2.0.0. Please use the named_tuple parameter instead."
-    )
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        deprecated_kwargs = bool(
-            "typename" in kwargs.keys() or "field_names" in kwargs.keys()
+def _deprecated_call(func, named_tuple, iterables, kwargs, **options):
+    """Dispatch a call with the old api signature to `func`.
+
+    Called by the public interfaces only when they receive keyword
+    arguments they do not define, so calls with the current signature
+    do not pay for the check. Issues a `FutureWarning` attributed to the
+    caller of the public interface. Unlike `DeprecationWarning`, which
+    they ignore outside of ``__main__``, the default warning filters
+    show it once per call site, without modifying the filters.
+
+    Parameters
+    ----------
+    func : function
+        `_namedzip_v1` or `_namedzip_longest_v1`.
+    named_tuple :
+        First positional argument, if any, of the public interface.
+    iterables : tuple
+        Remaining positional arguments of the public interface.
+    kwargs : dict
+        Keyword arguments not defined by the public interface.
+    **options
+        Keyword arguments defined by the public interface which are
+        passed on to `func`.
+
+    Returns
+    -------
+    iterator object or function object
+        Return value of `func`.
+
+    Raises
+    ------
+    TypeError
+        If `kwargs` contain neither `typename` nor `field_names`.
+
+    """
+
+    if "typename" not in kwargs and "field_names" not in kwargs:
+        raise TypeError(
+            "Unexpected keyword argument(s): {}.".format(", ".join(sorted(kwargs)))
         )
-        if deprecated_kwargs:
-            warnings.filterwarnings("always", message=deprecation_message)
-            warnings.warn(
-                category=DeprecationWarning, message=deprecation_message, stacklevel=2
-            )
-            if func.__name__ == "namedzip":
-                return _namedzip_v1(*args, **kwargs)
-            else:
-                return _namedzip_longest_v1(*args, **kwargs)
-        else:
-            return func(*args, **kwargs)
+    warnings.warn(deprecation_message, FutureWarning, stacklevel=3)
+    if named_tuple is not None:
+        iterables = (named_tuple,) + iterables
+    kwargs.update(options)
+    return func(*iterables, **kwargs)
 
-    return wrapper
 
+def _check_deprecated_options(
+    prefetch, executor, stats, columns, converters, where, checkpoint
+):
+    """Reject options of the current api in calls with the old signature.
 
-@_deprecation_warning
-def namedzip(named_tuple, *iterables):
+    The deprecated implementations do not support these options, which
+    would otherwise be ignored.
+
+    Parameters
+    ----------
+    prefetch, executor, stats, columns, converters, where, checkpoint
+        Keyword arguments of `namedzip` and `namedzip_longest`.
+
+    Raises
+    ------
+    TypeError
+        If any of the options is not its default value.
+
+    """
+
+    used = [
+        name
+        for name, value in (
+            ("prefetch", prefetch),
+            ("executor", executor is not None),
+            ("stats", stats),
+            ("columns", columns is not None),
+            ("converters", converters is not None),
+            ("where", where is not None),
+            ("checkpoint", checkpoint),
+        )
+        if value
+    ]
+    if used:
+        raise TypeError(
+            "The typename and field_names parameters cannot be combined "
+            "with: {}.".format(", ".join(used))
+        )
+
+
+def namedzip(
+    named_tuple=None,
+    *iterables,
+    prefetch=0,
+    executor=None,
+    stats=False,
+    columns=None,
+    converters=None,
+    where=None,
+    checkpoint=False,
+    **kwargs
+):
     """Extends :func:`zip` to generate named tuples.
 
-    Returns a generator if `*iterables` are supplied, otherwise returns
-    a function for creating generators.
+    Returns an iterator if `*iterables` are supplied, otherwise returns
+    a function for creating iterators.
 
     Parameters
     ----------
@@ -58,22 +152,93 @@ def namedzip(named_tuple, *iterables):
         or subclass of `typing.NamedTuple`.
     *iterables : iterable, optional
         Iterable objects to zip.
+    prefetch : int, optional
+        If positive, each iterable is read ahead by a background thread
+        into a buffer of up to `prefetch` values, so that slow, I/O
+        bound iterables are read concurrently. Exceptions raised by an
+        iterable are raised again by the returned iterator. Background
+        threads stop when the zip ends, when the returned iterator is
+        closed with `close`, or when it is garbage collected.
+        (default is 0).
+    executor : concurrent.futures.Executor, optional
+        Executor to run the background threads in when `prefetch` is
+        positive. Must be able to run one task per iterable at the same
+        time. New daemon threads are started if not specified.
+        (default is None).
+    stats : bool, optional
+        If True, each iterable is read through a wrapper which counts
+        its values and times the waits for them, available from the
+        `stats` attribute of the returned iterator as a `ZipStats`.
+        Iterators are not wrapped otherwise. (default is False).
+    columns : mapping or sequence, optional
+        Binds iterables to fields by name instead of by position. A
+        mapping of names to iterables is zipped instead of `*iterables`.
+        A sequence of names is the order of the `*iterables` passed to
+        the returned function. Names which are not field names are
+        left out, and their iterables are not read. The order of the
+        fields is resolved once, so binding costs nothing per row.
+        (default is None).
+    converters : mapping, optional
+        Functions by field name, which convert the values of their
+        fields. Each is applied to its whole iterable with `map` before
+        zipping, so values are converted column by column without a
+        Python loop per row. Converted iterables are not sequences, so
+        the returned iterator does not support `len`. (default is None).
+    where : mapping, optional
+        Predicates by field name. Only rows for which every predicate
+        returns a true value for the value of its field are generated.
+        Predicates are called with the zipped values before the named
+        tuple of a row is built, so rejected rows never become named
+        tuples. Predicates see converted values. The returned iterator
+        is then a plain iterator, without `len`, `offset` or pickling,
+        as its rows no longer line up with the zipped iterables. With
+        ``stats=True`` it still has a `stats` attribute, which counts
+        rejected rows too. (default is None).
+    checkpoint : bool, optional
+        If True, lines of file objects are read with `readline`, which
+        keeps their positions available for pickling the returned
+        iterator, see `NamedZipIterator`. Otherwise files are iterated
+        over, which is faster for short lines, but the position of a
+        text file being iterated over cannot be pickled.
+        (default is False).
+    **kwargs
+        Deprecated `typename` and `field_names` keyword arguments, see
+        `_namedzip_v1`.
 
     Returns
     -------
-    generator object
-        If `*iterables` are supplied.
+    NamedZipIterator
+        If `*iterables` are supplied. Supports `len` if all of
+        `*iterables` are sequences like lists, tuples or ranges.
     function object
         If `*iterables` are not supplied.
 
     """
 
-    _verify_named_tuple(named_tuple)
+    if kwargs:
+        _check_deprecated_options(
+            prefetch, executor, stats, columns, converters, where, checkpoint
+        )
+        return _deprecated_call(_namedzip_v1, named_tuple, iterables, kwargs)
+    info = _named_tuple_info(named_tuple)
+    field_count = info.field_count
+    _check_prefetch(prefetch, executor)
+    iterables, order = _bind_columns(columns, iterables, info.fields)
+    converters = _index_fields(converters, info.fields)
+    where = _index_fields(where, info.fields)
+    zip_rows = _zip_builder(
+        named_tuple, stats=stats, where=where, checkpoint=checkpoint
+    )
 
     def _namedzip_factory(*iterables):
-        _compare_iterables_to_fields(len(iterables), len(named_tuple._fields))
-        zipped = _create_zip(*iterables)
-        return _namedzip_generator(zipped, named_tuple)
+        if order is not None:
+            iterables = _order_iterables(iterables, order)
+        _compare_iterables_to_fields(len(iterables), field_count)
+        if converters:
+            iterables = _convert_iterables(iterables, converters)
+        if prefetch:
+            iterables = _prefetch_iterables(iterables, prefetch, executor)
+        return zip_rows(*iterables)
 
     if iterables:
         return _namedzip_factory(*iterables)
@@ -81,12 +246,24 @@ def namedzip(named_tuple, *iterables):
         return _namedzip_factory
 
 
-@_deprecation_warning
-def namedzip_longest(named_tuple, *iterables, fillvalue=None, defaults=None):
+def namedzip_longest(
+    named_tuple=None,
+    *iterables,
+    fillvalue=None,
+    defaults=None,
+    prefetch=0,
+    executor=None,
+    stats=False,
+    columns=None,
+    converters=None,
+    where=None,
+    checkpoint=False,
+    **kwargs
+):
     """Extends :func:`itertools.zip_longest` to generate named tuples.
 
-    Returns a generator if `*iterables` are supplied, otherwise returns
-    a function for creating generators.
+    Returns an iterator if `*iterables` are supplied, otherwise returns
+    a function for creating iterators.
 
     Parameters
     ----------
@@ -103,25 +280,88 @@ def namedzip_longest(named_tuple, *iterables, fillvalue=None, defaults=None):
         `fillvalue` for last n iterables, and any defaults specified in
         `named_tuple`. Length can be less than or equal to the number of
         named tuple field names.
+    prefetch : int, optional
+        If positive, each iterable is read ahead by a background thread
+        into a buffer of up to `prefetch` values, see `namedzip`.
+        Exhausted iterables are padded once their buffers are empty.
+        (default is 0).
+    executor : concurrent.futures.Executor, optional
+        Executor to run the background threads in when `prefetch` is
+        positive, see `namedzip`. (default is None).
+    stats : bool, optional
+        If True, the returned iterator records a `ZipStats`, see
+        `namedzip`, which also counts the default values substituted
+        for each iterable. (default is False).
+    columns : mapping or sequence, optional
+        Binds iterables to fields by name, see `namedzip`.
+        (default is None).
+    converters : mapping, optional
+        Functions by field name which convert the values of their
+        fields, see `namedzip`. Default values of exhausted iterables
+        are not converted. (default is None).
+    where : mapping, optional
+        Predicates by field name which filter the rows, see `namedzip`.
+        Predicates see the default values of exhausted iterables.
+        (default is None).
+    checkpoint : bool, optional
+        If True, lines of file objects are read with `readline` so that
+        the returned iterator can be pickled, see `namedzip`.
+        (default is False).
+    **kwargs
+        Deprecated `typename` and `field_names` keyword arguments, see
+        `_namedzip_longest_v1`.
 
     Returns
     -------
-    generator object
-        If `*iterables` are supplied.
+    NamedZipIterator
+        If `*iterables` are supplied. Supports `len` if all of
+        `*iterables` are sequences like lists, tuples or ranges.
     function object
         If `*iterables` are not supplied.
 
     """
 
+    if kwargs:
+        _check_deprecated_options(
+            prefetch, executor, stats, columns, converters, where, checkpoint
+        )
+        return _deprecated_call(
+            _namedzip_longest_v1,
+            named_tuple,
+            iterables,
+            kwargs,
+            fillvalue=fillvalue,
+            defaults=defaults,
+        )
+    info = _named_tuple_info(named_tuple)
+    field_count = info.field_count
+    _check_prefetch(prefetch, executor)
+    iterables, order = _bind_columns(columns, iterables, info.fields)
+    converters = _index_fields(converters, info.fields)
+    where = _index_fields(where, info.fields)
     defaults = _set_defaults(defaults, fillvalue, named_tuple)
-    if defaults is not None:
-        # Override fillvalue when individual defaults are set.
-        fillvalue = sentinel
+    if defaults and all(value is defaults[0] for value in defaults):
+        # A single default value for all fields is filled in by `zip_longest`.
+        fillvalue, defaults = defaults[0], None
+    zip_rows = _zip_builder(
+        named_tuple,
+        fillvalue=fillvalue,
+        type_longest=True,
+        defaults=defaults,
+        stats=stats,
+        where=where,
+        checkpoint=checkpoint,
+    )
 
     def _namedzip_longest_factory(*iterables):
-        _compare_iterables_to_fields(len(iterables), len(named_tuple._fields))
-        zipped = _create_zip(*iterables, fillvalue=fillvalue, type_longest=True)
-        return _namedzip_generator(zipped, named_tuple, defaults)
+        if order is not None:
+            iterables = _order_iterables(iterables, order)
+        _compare_iterables_to_fields(len(iterables), field_count)
+        if converters:
+            iterables = _convert_iterables(iterables, converters)
+        if prefetch:
+            iterables = _prefetch_iterables(iterables, prefetch, executor, longest=True)
+        return zip_rows(*iterables)
 
     if iterables:
         return _namedzip_longest_factory(*iterables)
@@ -129,11 +369,347 @@ def namedzip_longest(named_tuple, *iterables, fillvalue=None, defaults=None):
         return _namedzip_longest_factory
 
 
+def namedzip_batches(
+    named_tuple,
+    *iterables,
+    batch_size=1000,
+    longest=False,
+    fillvalue=None,
+    defaults=None
+):
+    """Generate lists of named tuples from zipped iterables.
+
+    Zips `*iterables` like `namedzip`, or like `namedzip_longest` if
+    `longest` is True, and yields the named tuples in lists of
+    `batch_size` rows. The last list can be shorter.
+
+    Returns an iterator if `*iterables` are supplied, otherwise returns
+    a function for creating iterators.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+    *iterables : iterable, optional
+        Iterable objects to zip.
+    batch_size : int, optional
+        Maximum number of named tuples in each list. (default is 1000).
+    longest : bool, optional
+        Zip like `namedzip_longest` instead of `namedzip`.
+        (default is False).
+    fillvalue : optional
+        Passed on to `namedzip_longest` when `longest` is True.
+        (default is None).
+    defaults : iterable, optional
+        Passed on to `namedzip_longest` when `longest` is True.
+        (default is None).
+
+    Returns
+    -------
+    iterator object
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    Raises
+    ------
+    ValueError
+        If `batch_size` is less than one.
+
+    """
+
+    if batch_size < 1:
+        raise ValueError(
+            "batch_size must be at least one, received {}.".format(batch_size)
+        )
+    if longest:
+        zip_rows = namedzip_longest(named_tuple, fillvalue=fillvalue, defaults=defaults)
+    else:
+        zip_rows = namedzip(named_tuple)
+
+    def _namedzip_batches_factory(*iterables):
+        rows = zip_rows(*iterables)
+        # Each batch is sliced off in C, iteration ends at the first empty list.
+        return iter(lambda: list(islice(rows, batch_size)), [])
+
+    if iterables:
+        return _namedzip_batches_factory(*iterables)
+    else:
+        return _namedzip_batches_factory
+
+
+class NamedZipIterator:
+    """Iterator of named tuples returned by `namedzip` and its relatives.
+
+    Wraps the iterator which zips the rows, and reports the number of
+    remaining rows through `__length_hint__` when the iterators of all
+    zipped iterables report theirs, as those of lists, tuples, ranges
+    and strings do. The hint is the smallest remaining length of the
+    iterables, or the largest for `namedzip_longest`, which lets
+    consumers like `list` preallocate. Otherwise the hint is 0.
+
+    Iterating over the object with `iter` returns the wrapped iterator,
+    so loops and consumers like `list` do not call `__next__` of the
+    wrapper for every row.
+
+    The number of rows consumed so far is available as `offset`, and
+    the counters of iterators created with ``stats=True`` as `stats`.
+    Iterators can be pickled to checkpoint their position, and resume
+    from it when unpickled, if each zipped iterable is either a
+    sequence, a seekable file object with a path `name`, or a picklable
+    iterator, such as that of an `io.StringIO`. Sequences are pickled
+    with their contents and restored by index. Files are reopened for
+    reading and restored by seeking to their position. Neither is
+    replayed row by row. Text files must be zipped with
+    ``checkpoint=True``, as their position is not available while
+    iterating over them.
+
+    `close` stops the background threads of prefetched iterables, after
+    which no more rows are generated. Iterators are context managers
+    which close themselves on exit, so rows can be abandoned early
+    inside a ``with`` block of the executor which prefetches them.
+
+    Parameters
+    ----------
+    rows : iterator object
+        Iterator of named tuples.
+    sources : tuple
+        Zipped iterables.
+    iterators : tuple of iterator objects
+        Iterators of `sources`, which `rows` consumes.
+    counter : range iterator or None
+        Advanced once per row to count the rows, if `sources` are not
+        all sequences.
+    named_tuple : tuple subclass
+        Class of the rows.
+    options : tuple
+        `fillvalue`, `type_longest` and `defaults` arguments of the
+        `_zip_builder` call which created the iterator.
+
+    """
+
+    __slots__ = (
+        "_rows",
+        "_sources",
+        "_iterators",
+        "_counter",
+        "_named_tuple",
+        "_options",
+    )
+
+    def __init__(self, rows, sources, iterators, counter, named_tuple, options):
+        self._rows = rows
+        self._sources = sources
+        self._iterators = iterators
+        self._counter = counter
+        self._named_tuple = named_tuple
+        self._options = options
+
+    def __iter__(self):
+        return self._rows
+
+    def __next__(self):
+        return next(self._rows)
+
+    def __length_hint__(self):
+        hints = [length_hint(iterator, -1) for iterator in self._iterators]
+        if not hints or -1 in hints:
+            return 0
+        return max(hints) if self._options[1] else min(hints)
+
+    @property
+    def offset(self):
+        """Number of rows consumed."""
+
+        return _MAX_ROWS - length_hint(self._counter)
+
+    def close(self):
+        """Stop the background threads of prefetched iterables.
+
+        Has no effect on iterables which are not prefetched.
+
+        """
+
+        for source in self._sources:
+            if type(source) is _PrefetchIterator:
+                source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def stats(self):
+        """`ZipStats` of the iterator if it was created with
+        ``stats=True``, otherwise None."""
+
+        for iterator in self._iterators:
+            return getattr(iterator, "stats", None)
+        return None
+
+    def __reduce__(self):
+        offset = self.offset
+        states = []
+        for source, iterator in zip(self._sources, self._iterators):
+            if _is_sequence(source):
+                states.append((_SEQUENCE, source, min(offset, len(source))))
+            elif _is_named_file(source):
+                mode = "rb" if "b" in getattr(source, "mode", "") else "r"
+                encoding = getattr(source, "encoding", None)
+                try:
+                    position = source.tell()
+                except OSError:
+                    raise TypeError(
+                        "Cannot pickle the position of {!r}, zip text files "
+                        "with checkpoint=True to pickle.".format(source.name)
+                    ) from None
+                states.append((_FILE, source.name, mode, encoding, position))
+            else:
+                states.append((_ITERATOR, iterator))
+        return (
+            _restore_named_zip,
+            (self._named_tuple, self._options, tuple(states), offset),
+        )
+
+
+class SizedNamedZipIterator(NamedZipIterator):
+    """`NamedZipIterator` of zipped sequences, which supports `len` and
+    indexing.
+
+    Returned instead of `NamedZipIterator` when all zipped iterables
+    are sequences whose iterators report their remaining length. The
+    length is the number of remaining rows, so it decreases as rows are
+    consumed, and rows are counted without a counter. Like other
+    iterators, the object is true even when no rows remain.
+
+    Indexing and slicing apply to the remaining rows, and read the
+    sequences directly instead of advancing the iterator. Integer
+    indices return named tuples, built in constant time. Slices return
+    a `NamedZipView` of the sequences. Rows of `namedzip_longest` get
+    their default values for fields beyond the end of shorter
+    sequences.
+
+    """
+
+    __slots__ = ("_view",)
+
+    def __len__(self):
+        hints = map(length_hint, self._iterators)
+        return max(hints) if self._options[1] else min(hints)
+
+    __length_hint__ = __len__
+
+    def __bool__(self):
+        return True
+
+    @property
+    def offset(self):
+        """Number of rows consumed."""
+
+        return max(len(self._get_view()) - len(self), 0)
+
+    def __getitem__(self, index):
+        view = self._get_view()
+        # Rows consumed by iteration precede the remaining rows.
+        remaining = view._indices[self.offset :]
+        if isinstance(index, slice):
+            return view._slice(remaining[index])
+        return view[remaining[index]]
+
+    def _get_view(self):
+        """Return a `NamedZipView` of all rows, created once."""
+
+        try:
+            return self._view
+        except AttributeError:  # The slot is set on first use.
+            pass
+        from .view import NamedZipView
+
+        fillvalue, type_longest, defaults = self._options
+        if type_longest:
+            defaults = _default_values(defaults, fillvalue, len(self._sources))
+            self._view = NamedZipView._longest(
+                self._named_tuple, self._sources, defaults
+            )
+        else:
+            self._view = NamedZipView(self._named_tuple, *self._sources)
+        return self._view
+
+
+# Rows are counted by a range iterator, see `NamedZipIterator.offset`.
+_MAX_ROWS = sys.maxsize - 1
+
+# Kinds of zipped iterables in the pickled state of `NamedZipIterator`.
+_SEQUENCE, _FILE, _ITERATOR = range(3)
+
+
+def _restore_named_zip(named_tuple, options, states, offset):
+    """Recreate a pickled `NamedZipIterator` at `offset`.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        Class of the rows.
+    options : tuple
+        `fillvalue`, `type_longest` and `defaults` for `_zip_builder`.
+    states : tuple
+        Kind and state of each zipped iterable, from
+        `NamedZipIterator.__reduce__`.
+    offset : int
+        Number of rows consumed before pickling.
+
+    Returns
+    -------
+    NamedZipIterator
+
+    """
+
+    sources, iterators = [], []
+    for kind, *state in states:
+        if kind == _SEQUENCE:
+            source, consumed = state
+            iterator = iter(source)
+            try:
+                iterator.__setstate__(consumed)
+            except AttributeError:
+                iterator = map(source.__getitem__, range(consumed, len(source)))
+        elif kind == _FILE:
+            name, mode, encoding, position = state
+            source = open(name, mode, encoding=encoding)
+            source.seek(position)
+            iterator = _iterate(source)
+        else:
+            source = iterator = state[0]
+        sources.append(source)
+        iterators.append(iterator)
+    return _zip_iterators(
+        named_tuple, options, tuple(sources), tuple(iterators), offset
+    )
+
+
+def _iterate(iterable):
+    """Return an iterator of `iterable` for ``checkpoint=True``.
+
+    Lines of file objects are read with `readline`, which unlike file
+    iteration leaves `tell` usable for checkpointing. Restored file
+    iterators also use it, so they can be pickled again.
+
+    """
+
+    if isinstance(iterable, io.IOBase):
+        end = "" if isinstance(iterable, io.TextIOBase) else b""
+        return iter(iterable.readline, end)
+    return iter(iterable)
+
+
 def _namedzip_v1(*iterables, typename, field_names, **kwargs):
     """Extends :func:`zip` to generate named tuples.
 
-    Returns a generator if `*iterables` are supplied, otherwise returns
-    a function for creating generators.
+    Returns an iterator if `*iterables` are supplied, otherwise returns
+    a function for creating iterators.
 
     Parameters
     ----------
@@ -151,19 +727,19 @@ def _namedzip_v1(*iterables, typename, field_names, **kwargs):
 
     Returns
     -------
-    generator object
+    iterator object
         If `*iterables` are supplied.
     function object
         If `*iterables` are not supplied.
 
     """
 
-    named_tuple = namedtuple(typename, field_names, **kwargs)
+    named_tuple = _get_namedtuple(typename, field_names, **kwargs)
+    zip_rows = _zip_builder(named_tuple)
 
     def _namedzip_factory(*iterables):
         _compare_iterables_to_fields(len(iterables), len(named_tuple._fields))
-        zipped = _create_zip(*iterables)
-        return _namedzip_generator(zipped, named_tuple)
+        return zip_rows(*iterables)
 
     if iterables:
         return _namedzip_factory(*iterables)
@@ -174,8 +750,8 @@ def _namedzip_v1(*iterables, typename, field_names, **kwargs):
 def _namedzip_longest_v1(*iterables, typename, field_names, **kwargs):
     """Extends :func:`itertools.zip_longest` to generate named tuples.
 
-    Returns a generator if `*iterables` are supplied, otherwise returns
-    a function for creating generators.
+    Returns an iterator if `*iterables` are supplied, otherwise returns
+    a function for creating iterators.
 
     Parameters
     ----------
@@ -200,7 +776,7 @@ def _namedzip_longest_v1(*iterables, typename, field_names, **kwargs):
 
     Returns
     -------
-    generator object
+    iterator object
         If `*iterables` are supplied.
     function object
         If `*iterables` are not supplied.
@@ -220,21 +796,22 @@ def _namedzip_longest_v1(*iterables, typename, field_names, **kwargs):
 
     fillvalue = kwargs.pop("fillvalue", None)
     defaults = kwargs.pop("defaults", None)
-    named_tuple = namedtuple(typename, field_names, **kwargs)
+    named_tuple = _get_namedtuple(typename, field_names, **kwargs)
     if defaults and len(defaults) != len(named_tuple._fields):
         raise ValueError(
             "Unequal number of field names ({}) and default values ({}).".format(
                 len(named_tuple._fields), len(defaults)
             )
         )
-    elif defaults is not None:
-        # Override fillvalue if individual defaults are specified.
-        fillvalue = sentinel
+    elif not defaults:
+        defaults = None
+    zip_rows = _zip_builder(
+        named_tuple, fillvalue=fillvalue, type_longest=True, defaults=defaults
+    )
 
     def _namedzip_longest_factory(*iterables):
         _compare_iterables_to_fields(len(iterables), len(named_tuple._fields))
-        zipped = _create_zip(*iterables, fillvalue=fillvalue, type_longest=True)
-        return _namedzip_generator(zipped, named_tuple, defaults)
+        return zip_rows(*iterables)
 
     if iterables:
         return _namedzip_longest_factory(*iterables)
@@ -242,6 +819,64 @@ def _namedzip_longest_v1(*iterables, typename, field_names, **kwargs):
         return _namedzip_longest_factory
 
 
+def _get_namedtuple(typename, field_names, **kwargs):
+    """Return a cached named tuple class for the deprecated api.
+
+    Classes are created by `collections.namedtuple` and cached by
+    `_cached_namedtuple`, so repeated calls with the same arguments
+    reuse one class instead of creating a new one each time. Arguments
+    which cannot be hashed bypass the cache.
+
+    Parameters
+    ----------
+    typename : string
+        Passed on to `collections.namedtuple`.
+    field_names : iterable
+        Passed on to `collections.namedtuple`.
+    **kwargs
+        Passed on to `collections.namedtuple`.
+
+    Returns
+    -------
+    tuple subclass
+
+    """
+
+    if not isinstance(field_names, str):
+        field_names = tuple(field_names)
+    try:
+        return _cached_namedtuple(typename, field_names, tuple(sorted(kwargs.items())))
+    except TypeError:
+        return namedtuple(typename, field_names, **kwargs)
+
+
+@lru_cache(maxsize=128)
+def _cached_namedtuple(typename, field_names, options):
+    """Create a named tuple class, cached by the call arguments.
+
+    Least recently used classes are evicted once 128 classes are cached.
+    Use `_cached_namedtuple.cache_info()` for hit and miss statistics,
+    and `_cached_namedtuple.cache_clear()` to empty the cache.
+
+    Parameters
+    ----------
+    typename : string
+        Passed on to `collections.namedtuple`.
+    field_names : string or tuple
+        Passed on to `collections.namedtuple`.
+    options : tuple
+        Sorted (name, value) pairs of keyword arguments for
+        `collections.namedtuple`.
+
+    Returns
+    -------
+    tuple subclass
+
+    """
+
+    return namedtuple(typename, field_names, **dict(options))
+
+
 def _compare_iterables_to_fields(iterable_count, field_count):
     """Compare number of iterable object and field names.
 
@@ -267,11 +902,168 @@ def _compare_iterables_to_fields(iterable_count, field_count):
         )
 
 
-def _create_zip(*iterables, fillvalue=None, type_longest=False):
+def _bind_columns(columns, iterables, fields):
+    """Resolve the `columns` argument of `namedzip` and `namedzip_longest`.
+
+    Parameters
+    ----------
+    columns : mapping, sequence or None
+        Iterables by name, or names of the iterables in order.
+    iterables : tuple
+        Positional iterables.
+    fields : tuple
+        Named tuple field names.
+
+    Returns
+    -------
+    tuple
+        `iterables`, which are the values of `columns` if it is a
+        mapping, and an `order` for `_order_iterables`, which is None if
+        `columns` is None.
+
+    Raises
+    ------
+    ValueError
+        If `columns` are supplied with `*iterables`, if a name is
+        duplicated, or if a field name is not in `columns`.
+
+    """
+
+    if columns is None:
+        return iterables, None
+    if iterables:
+        raise ValueError("Iterables cannot be supplied with columns.")
+    if isinstance(columns, Mapping):
+        iterables = tuple(columns.values())
+    names = list(columns)
+    if len(set(names)) != len(names):
+        raise ValueError("Encountered duplicate column names in {!r}.".format(names))
+    missing = [field for field in fields if field not in names]
+    if missing:
+        raise ValueError("No columns for the fields {!r}.".format(missing))
+    return iterables, (tuple(names.index(field) for field in fields), len(names))
+
+
+def _order_iterables(iterables, order):
+    """Return the iterables of the fields in field order.
+
+    Parameters
+    ----------
+    iterables : tuple
+        Iterables in the order of the `columns` names.
+    order : tuple
+        Index of each field in `iterables`, and the number of columns,
+        from `_bind_columns`.
+
+    Returns
+    -------
+    tuple
+
+    Raises
+    ------
+    ValueError
+        If the number of `iterables` is not equal to the number of
+        columns.
+
+    """
+
+    indices, column_count = order
+    if len(iterables) != column_count:
+        raise ValueError(
+            "Unequal number of iterable objects ({}) and columns ({}).".format(
+                len(iterables), column_count
+            )
+        )
+    return tuple(iterables[index] for index in indices)
+
+
+def _index_fields(functions, fields):
+    """Resolve the field index of each of `functions`.
+
+    Used for the `converters` and `where` arguments.
+
+    Parameters
+    ----------
+    functions : mapping or None
+        Functions by field name.
+    fields : tuple
+        Named tuple field names.
+
+    Returns
+    -------
+    tuple
+        Pairs of field index and function, in field order.
+
+    Raises
+    ------
+    ValueError
+        If a name of `functions` is not a field name.
+
+    """
+
+    if not functions:
+        return ()
+    unknown = [name for name in functions if name not in fields]
+    if unknown:
+        raise ValueError("Encountered unknown field names {!r}.".format(unknown))
+    return tuple(
+        (index, functions[field])
+        for index, field in enumerate(fields)
+        if field in functions
+    )
+
+
+def _convert_iterables(iterables, converters):
+    """Return `iterables` with converters mapped over their values.
+
+    Parameters
+    ----------
+    iterables : sequence of iterables
+    converters : tuple
+        Pairs of index and function, from `_index_fields`.
+
+    Returns
+    -------
+    list
+
+    """
+
+    iterables = list(iterables)
+    for index, func in converters:
+        iterables[index] = map(func, iterables[index])
+    return iterables
+
+
+def _check_prefetch(prefetch, executor):
+    """Validate the `prefetch` and `executor` arguments.
+
+    Parameters
+    ----------
+    prefetch : int
+        Number of values to buffer for each iterable, or 0.
+    executor : concurrent.futures.Executor or None
+
+    Raises
+    ------
+    ValueError
+        If `prefetch` is negative, or if `executor` is specified
+        without a positive `prefetch`.
+
+    """
+
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative, received {}.".format(prefetch))
+    if executor is not None and not prefetch:
+        raise ValueError("executor requires a positive prefetch buffer size.")
+
+
+def _create_zip(*iterables, fillvalue=None, type_longest=False, defaults=None):
     """Zips supplied iterables and returns a generator.
 
     Aggregates `*iterables` using `zip` or `itertools.zip_longest`,
-    depending on the value of the `type_longest` parameter.
+    depending on the value of the `type_longest` parameter. Individual
+    `defaults` are applied by padding each iterable with
+    `_fill_iterators` and zipping the padded iterators with `zip`.
 
     Parameters
     ----------
@@ -284,6 +1076,10 @@ def _create_zip(*iterables, fillvalue=None, type_longest=False):
     type_longest : bool, optional
         Specifies whether to use `zip_longest` over `zip`. Used by
         `namedzip_longest`. (default is False).
+    defaults : tuple or None, optional
+        Default values for each of the `*iterables`, overrides
+        `fillvalue`. Only used when `type_longest` is True.
+        (default is None).
 
     Returns
     ------
@@ -291,47 +1087,384 @@ def _create_zip(*iterables, fillvalue=None, type_longest=False):
 
     """
 
-    if type_longest:
-        from itertools import zip_longest
-
+    if type_longest and defaults is not None:
+        zipped = zip(*_fill_iterators(iterables, defaults))
+    elif type_longest:
         zipped = zip_longest(*iterables, fillvalue=fillvalue)
     else:
         zipped = zip(*iterables)
     return zipped
 
 
-def _namedzip_generator(zipped, named_tuple, defaults=None):
-    """Generates named tuple objects.
+def _fill_iterators(iterables, defaults):
+    """Pad iterables with individual default values.
 
-    Generates named tuple objects from tuples in `zipped`, based on
-    the `named_tuple` class. Also replaces sentinel values in `zipped` if
-    `defaults` are specified.
+    Each iterable is chained with a generator which yields its default
+    value for as long as any of the other iterables are not exhausted.
+    Zipping the returned iterators with `zip` produces the same tuples
+    as `zip_longest` followed by replacement of the fill values, but
+    rows without missing values are produced without running any Python
+    code, and the substitution plan is fixed when the iterators are
+    created.
+
+    Parameters
+    ----------
+    iterables : sequence of iterables
+        Iterable objects to pad.
+    defaults : iterable
+        Default value for each of the `iterables`.
+
+    Returns
+    -------
+    list of iterator objects
+
+    """
+
+    active = [len(iterables)]
+
+    def pad(default):
+        active[0] -= 1
+        while active[0]:
+            yield default
+
+    return [
+        chain(iterable, pad(default)) for iterable, default in zip(iterables, defaults)
+    ]
+
+
+def _zip_builder(
+    named_tuple,
+    fillvalue=None,
+    type_longest=False,
+    defaults=None,
+    stats=False,
+    where=(),
+    checkpoint=False,
+):
+    """Return a function which zips iterables into named tuples.
 
     Parameters
     ----------
-    zipped : iterable
-        Should be generator produced by `zip` or zip_longest`.
     named_tuple : tuple subclass
         tuple subclass from `collections.namedtuple` factory function,
         or subclass of `typing.NamedTuple`.
-    defaults : iterable or None, optional
-        Default values for each index of tuples generated by `zipped`.
-        (default is None).
+    fillvalue : optional
+        Passed on to `_create_zip`. (default is None).
+    type_longest : bool, optional
+        Passed on to `_create_zip`. (default is False).
+    defaults : tuple or None, optional
+        Passed on to `_create_zip`. (default is None).
+    stats : bool, optional
+        Whether to instrument the iterators with `_instrument`.
+        (default is False).
+    where : tuple, optional
+        Pairs of field index and predicate from `_index_fields`, passed
+        on to `_zip_rows` if not empty. (default is ()).
+    checkpoint : bool, optional
+        Whether to create iterators with `_iterate` instead of `iter`.
+        (default is False).
 
-    Yields
-    ------
-    named tuple object
+    Returns
+    -------
+    function object
+        Takes `*iterables` and returns a `NamedZipIterator` from
+        `_zip_iterators`, or the iterator from `_zip_rows` if rows are
+        filtered by `where`, wrapped in a `_StatsRows` if `stats` is
+        True.
+
+    """
+
+    options = (fillvalue, type_longest, defaults)
+    iterate = _iterate if checkpoint else iter
+
+    def zip_rows(*iterables):
+        iterators = tuple(map(iterate, iterables))
+        if stats:
+            fields = _named_tuple_info(named_tuple).fields
+            iterators = _instrument(iterators, fields, type_longest)
+        if where:
+            rows = _zip_rows(named_tuple, options, iterators, where)
+            return _StatsRows(rows, iterators[0].stats) if stats else rows
+        return _zip_iterators(named_tuple, options, iterables, iterators)
+
+    return zip_rows
+
+
+def _zip_iterators(named_tuple, options, sources, iterators, offset=0):
+    """Zip `iterators` into a `NamedZipIterator` of named tuples.
+
+    Returns a `SizedNamedZipIterator` if all `sources` are sequences,
+    see `_is_sequence`, whose iterators report their remaining length.
+    Otherwise rows are counted with `itertools.compress`, which advances
+    a range iterator per row.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        Class of the rows.
+    options : tuple
+        `fillvalue`, `type_longest` and `defaults`, passed on to
+        `_zip_rows`.
+    sources : tuple
+        Zipped iterables.
+    iterators : tuple of iterator objects
+        Iterators of `sources`.
+    offset : int, optional
+        Number of rows consumed before, when restoring a pickled
+        iterator. (default is 0).
+
+    Returns
+    -------
+    NamedZipIterator or SizedNamedZipIterator
+
+    """
+
+    rows = _zip_rows(named_tuple, options, iterators)
+    # Iterators of built-in sequences always report their length.
+    if sources and (
+        _SEQUENCE_TYPES.issuperset(map(type, sources))
+        or all(
+            _is_sequence(source) and hasattr(type(iterator), "__length_hint__")
+            for source, iterator in zip(sources, iterators)
+        )
+    ):
+        return SizedNamedZipIterator(
+            rows, sources, iterators, None, named_tuple, options
+        )
+    counter = iter(range(offset + 1, _MAX_ROWS + 1))
+    return NamedZipIterator(
+        compress(rows, counter), sources, iterators, counter, named_tuple, options
+    )
+
+
+def _filter_rows(named_tuple, options, iterators, where):
+    """Return an iterator of the named tuples which satisfy `where`.
+
+    Used by `_zip_rows` without the `_speedups` C extension. Iterators
+    with predicates are split with `itertools.tee`: one copy is zipped
+    and the predicate is mapped over the other, producing a selector
+    per row. `itertools.compress` drops the zipped tuples of rejected
+    rows before they are built into named tuples. Both copies advance
+    in step, so `tee` holds at most one value. Iterators are padded
+    before they are split when zipping to the longest, so that
+    predicates see default values.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        Class of the rows.
+    options : tuple
+        `fillvalue`, `type_longest` and `defaults`.
+    iterators : tuple of iterator objects
+    where : tuple
+        Pairs of field index and predicate, from `_index_fields`.
+
+    Returns
+    -------
+    iterator object
+
+    """
+
+    fillvalue, type_longest, defaults = options
+    iterators = list(iterators)
+    if type_longest:
+        defaults = _default_values(defaults, fillvalue, len(iterators))
+        iterators = _fill_iterators(iterators, defaults)
+    selectors = []
+    for index, predicate in where:
+        iterators[index], values = tee(iterators[index])
+        selectors.append(map(predicate, values))
+    if len(selectors) > 1:
+        selectors = [map(all, zip(*selectors))]
+    return _row_builder(named_tuple)(compress(zip(*iterators), selectors[0]))
+
+
+def _zip_rows(named_tuple, options, iterators, where=()):
+    """Return an iterator which zips `iterators` into named tuples.
+
+    Uses `NamedZipIterator` from the `_speedups` C extension when it is
+    available, otherwise combines `_create_zip` and `_row_builder`, or
+    uses `_filter_rows` if rows are filtered. Both backends produce
+    identical rows. The C extension evaluates the predicates of `where`
+    on the zipped values of each row, and skips rejected rows without
+    allocating them.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        Class of the rows.
+    options : tuple
+        `fillvalue`, `type_longest` and `defaults`, passed on to
+        `_create_zip`.
+    iterators : tuple of iterator objects
+    where : tuple, optional
+        Pairs of field index and predicate, from `_index_fields`.
+        (default is ()).
+
+    Returns
+    -------
+    iterator object
+
+    """
+
+    fillvalue, type_longest, defaults = options
+    if _speedups is not None:
+        return _speedups.NamedZipIterator(
+            named_tuple,
+            iterators,
+            _named_tuple_info(named_tuple).uses_tuple_new,
+            type_longest,
+            fillvalue,
+            defaults,
+            where,
+        )
+    if where:
+        return _filter_rows(named_tuple, options, iterators, where)
+    zipped = _create_zip(
+        *iterators, fillvalue=fillvalue, type_longest=type_longest, defaults=defaults
+    )
+    return _row_builder(named_tuple)(zipped)
+
+
+def _row_builder(named_tuple):
+    """Return a function which maps zipped tuples to named tuples.
+
+    Rows of classes that keep the constructor generated by
+    `collections.namedtuple` are built by mapping `tuple.__new__` over
+    the zipped tuples, which runs entirely in C without entering a
+    Python frame per row. Other classes are called with unpacked values
+    through `itertools.starmap`.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+
+    Returns
+    -------
+    function object
+        Takes an iterable of tuples and returns an iterator of named
+        tuples.
+
+    """
+
+    if _named_tuple_info(named_tuple).uses_tuple_new:
+        return partial(map, partial(tuple.__new__, named_tuple))
+    return partial(starmap, named_tuple)
+
+
+def _row_maker(named_tuple):
+    """Return a function which builds a named tuple from its values.
+
+    Like `_row_builder`, rows of classes that keep the constructor
+    generated by `collections.namedtuple` are built with `tuple.__new__`,
+    other classes are called with unpacked values.
+
+    Parameters
+    ----------
+    named_tuple : class
+        Class of the rows.
+
+    Returns
+    -------
+    function object
+        Takes an iterable of the values of one row and returns a
+        `named_tuple` instance.
 
     """
 
-    for vals in zipped:
-        if defaults:
-            vals = (x if x is not sentinel else defaults[i] for i, x in enumerate(vals))
-        yield named_tuple(*vals)
+    if _named_tuple_info(named_tuple).uses_tuple_new:
+        return partial(tuple.__new__, named_tuple)
+
+    def make_row(values):
+        return named_tuple(*values)
+
+    return make_row
+
+
+# Built-in sequences, recognized without the slower `Sequence` check.
+_SEQUENCE_TYPES = frozenset([list, tuple, range, str, bytes, bytearray])
+
+
+def _is_sequence(iterable):
+    """Check if `iterable` is a `collections.abc.Sequence`.
+
+    Unlike a check for `__len__` and `__getitem__`, this excludes
+    mappings, which cannot be indexed by position.
+
+    Parameters
+    ----------
+    iterable : iterable
+
+    Returns
+    -------
+    bool
+
+    """
+
+    return type(iterable) in _SEQUENCE_TYPES or isinstance(iterable, Sequence)
+
+
+def _is_named_file(iterable):
+    """Check if `iterable` is a seekable file object with a path name.
+
+    Such files are pickled by their name and position, and reopened
+    when restored. In-memory streams like `io.StringIO`, and files
+    opened from a file descriptor, have no path to reopen.
+
+    Parameters
+    ----------
+    iterable : iterable
+
+    Returns
+    -------
+    bool
+
+    """
+
+    if not isinstance(iterable, io.IOBase):
+        return False
+    # `open` stores paths as strings or bytes, and descriptors as ints.
+    if not isinstance(getattr(iterable, "name", None), (str, bytes)):
+        return False
+    try:
+        return iterable.seekable()
+    except ValueError:  # Closed files.
+        return False
+
+
+def _uses_tuple_new(named_tuple):
+    """Check if `named_tuple` rows can be created with `tuple.__new__`.
+
+    True for classes that keep the constructor generated by
+    `collections.namedtuple`, False for classes which override
+    `__new__` or `__init__`.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+
+    Returns
+    -------
+    bool
+
+    """
+
+    for cls in named_tuple.__mro__:
+        attrs = vars(cls)
+        if "_make" in attrs and "__new__" in attrs:
+            # Reached the class generated by `collections.namedtuple`.
+            return True
+        if "__new__" in attrs or "__init__" in attrs:
+            break
+    return False
 
 
 def _set_defaults(defaults, fillvalue, named_tuple):
-    """Set default values to be used by `_namedzip_generator`.
+    """Set default values to be used by `_create_zip`.
 
     Set values form `defaults` if not None, otherwise check if default
     values are specified in the `named_tuple` class.
@@ -363,55 +1496,182 @@ def _set_defaults(defaults, fillvalue, named_tuple):
 
     """
 
+    info = _named_tuple_info(named_tuple)
     if defaults is not None:
         # Default values specified in interface kwarg take priority.
         defaults = tuple(defaults)
-        if len(defaults) > len(named_tuple._fields):
+        if len(defaults) > info.field_count:
             raise ValueError(
                 "Received more default values ({}) than field names ({}).".format(
-                    len(defaults), len(named_tuple._fields)
+                    len(defaults), info.field_count
                 )
             )
-        elif len(named_tuple._fields) > len(defaults):
-            padded_defaults = [fillvalue] * (len(named_tuple._fields) - len(defaults))
+        elif info.field_count > len(defaults):
+            padded_defaults = [fillvalue] * (info.field_count - len(defaults))
             padded_defaults.extend(defaults)
             defaults = tuple(padded_defaults)
     else:
+        # Defaults from `named_tuple` are resolved once per class.
+        defaults = info.defaults
+        if info.missing_defaults and fillvalue is not None:
+            padded_defaults = list(defaults)
+            for i in info.missing_defaults:
+                padded_defaults[i] = fillvalue
+            defaults = tuple(padded_defaults)
+    return defaults
+
+
+def _default_values(defaults, fillvalue, field_count):
+    """Return `defaults`, or `fillvalue` for each field if it is None.
+
+    Parameters
+    ----------
+    defaults : tuple or None
+        Default values, from `_set_defaults`.
+    fillvalue :
+    field_count : int
+        Number of named tuple field names.
+
+    Returns
+    -------
+    tuple
+
+    """
+
+    if defaults is None:
+        return (fillvalue,) * field_count
+    return defaults
+
+
+_NamedTupleInfo = namedtuple(
+    "_NamedTupleInfo",
+    ["fields", "field_count", "uses_tuple_new", "defaults", "missing_defaults"],
+)
+
+_named_tuple_infos = WeakKeyDictionary()
+
+
+def _named_tuple_info(named_tuple):
+    """Verify `named_tuple` and return metadata for the class.
+
+    Results are cached per class in a `WeakKeyDictionary`, so classes
+    are only verified and inspected once, and cached entries are
+    dropped when the class is garbage collected.
+
+    Parameters
+    ----------
+    named_tuple : named tuple class
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+
+    Returns
+    -------
+    _NamedTupleInfo
+        Named tuple with the field names and their number, the result
+        of `_uses_tuple_new`, default values specified in `named_tuple`
+        with None for fields without defaults (None if no defaults are
+        specified), and the indices of fields without defaults.
+
+    Raises
+    ------
+    TypeError
+        If `named_tuple` does not appear to be a named tuple class.
+
+    """
+
+    try:
+        return _named_tuple_infos[named_tuple]
+    except (KeyError, TypeError):  # TypeError for objects without weakrefs.
+        pass
+    _verify_named_tuple(named_tuple)
+    if _is_dataclass(named_tuple):
+        # Rows are created with positional arguments for the init fields.
+        init_fields = [f for f in dataclasses.fields(named_tuple) if f.init]
+        fields = tuple(f.name for f in init_fields)
+        nt_defaults = {
+            f.name: f.default
+            for f in init_fields
+            if f.default is not dataclasses.MISSING
+        }
+    else:
+        fields = tuple(named_tuple._fields)
         # Defaults attribute can be called `_field_defaults` or `_fields_defaults`.
         nt_defaults = getattr(named_tuple, "_fields_defaults", None) or getattr(
             named_tuple, "_field_defaults", None
         )
-        if nt_defaults:  # Can be empty dict.
-            defaults = tuple(
-                nt_defaults.get(field, fillvalue) for field in (named_tuple._fields)
-            )
-    return defaults
+    if nt_defaults:  # Can be empty dict.
+        defaults = tuple(nt_defaults.get(field) for field in fields)
+        missing_defaults = tuple(
+            i for i, field in enumerate(fields) if field not in nt_defaults
+        )
+    else:
+        defaults, missing_defaults = None, ()
+    info = _NamedTupleInfo(
+        fields, len(fields), _uses_tuple_new(named_tuple), defaults, missing_defaults
+    )
+    _named_tuple_infos[named_tuple] = info
+    return info
 
 
 def _verify_named_tuple(named_tuple):
     """Attempt to verify `named_tuple` object.
 
+    Besides named tuple classes, record classes with `_fields` and
+    `__slots__`, such as classes created by `namedrecord`, and
+    dataclasses are accepted as row types.
+
     Parameters
     ----------
     named_tuple : named tuple class
         tuple subclass from `collections.namedtuple` factory function,
-        or subclass of `typing.NamedTuple`.
+        subclass of `typing.NamedTuple`, record class or dataclass.
 
     Raises
     ------
     TypeError
-        If `named_tuple` does not appear to be a named tuple class.
+        If `named_tuple` does not appear to be a named tuple class,
+        record class or dataclass.
 
     """
 
     if not bool(
         isclass(named_tuple)
-        and issubclass(named_tuple, tuple)
         and callable(named_tuple)
-        and hasattr(named_tuple, "_fields")
+        and (
+            (
+                hasattr(named_tuple, "_fields")
+                and (
+                    issubclass(named_tuple, tuple) or hasattr(named_tuple, "__slots__")
+                )
+            )
+            or _is_dataclass(named_tuple)
+        )
     ):
         raise TypeError(
             "named_tuple parameter should be a tuple subclass created "
-            "by the collections.namedtuple factory function, or a "
-            "subclass of typing.NamedTuple."
+            "by the collections.namedtuple factory function, a "
+            "subclass of typing.NamedTuple, a record class with _fields "
+            "and __slots__, or a dataclass."
         )
+
+
+def _is_dataclass(cls):
+    """Check if `cls` is a dataclass, False if `dataclasses` is missing."""
+
+    return dataclasses is not None and dataclasses.is_dataclass(cls)
+
+
+@lru_cache(maxsize=None)
+def _import_numpy():
+    """Import NumPy on first use, return None if it is not installed.
+
+    NumPy is an optional dependency of `namedzip_array` and
+    `namedunzip`, and is not imported with the package.
+
+    """
+
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
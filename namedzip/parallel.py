@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""This module implements `namedzip_map`, which maps a function over
+zipped named tuples in a pool of worker processes.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import deque
+from itertools import islice
+import os
+
+from .namedzip import (
+    _compare_iterables_to_fields,
+    _create_zip,
+    _named_tuple_info,
+    _row_builder,
+    _set_defaults,
+)
+
+
+def namedzip_map(
+    func,
+    named_tuple,
+    *iterables,
+    workers=None,
+    chunksize=256,
+    ordered=True,
+    longest=False,
+    fillvalue=None,
+    defaults=None,
+    executor=None
+):
+    """Map `func` over zipped named tuples in worker processes.
+
+    Zips `*iterables` like `namedzip`, or like `namedzip_longest` if
+    `longest` is True, into plain tuples which are sent to the workers
+    in lists of `chunksize` rows. Each worker builds the named tuples of
+    a chunk and returns the results of calling `func` with each of them,
+    so the named tuple class is pickled once per chunk instead of once
+    per row. At most two chunks per worker are submitted ahead of the
+    results being consumed.
+
+    `func` and `named_tuple` are pickled, so they must be defined at
+    module level.
+
+    Returns an iterator if `*iterables` are supplied, otherwise returns
+    a function for creating iterators.
+
+    Parameters
+    ----------
+    func : function
+        Function called with each named tuple.
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+    *iterables : iterable, optional
+        Iterable objects to zip.
+    workers : int, optional
+        Number of worker processes. Defaults to the number of processors
+        when None. (default is None).
+    chunksize : int, optional
+        Maximum number of rows sent to a worker at a time.
+        (default is 256).
+    ordered : bool, optional
+        Yield results in the order of the rows. If False, the results
+        of each chunk are yielded as soon as the chunk is done.
+        (default is True).
+    longest : bool, optional
+        Zip like `namedzip_longest` instead of `namedzip`.
+        (default is False).
+    fillvalue : optional
+        Passed on to `_set_defaults` when `longest` is True.
+        (default is None).
+    defaults : iterable, optional
+        Passed on to `_set_defaults` when `longest` is True.
+        (default is None).
+    executor : concurrent.futures.Executor, optional
+        Executor to submit the chunks to instead of a new
+        `ProcessPoolExecutor`. It is not shut down when iteration ends.
+        (default is None).
+
+    Returns
+    -------
+    iterator object
+        If `*iterables` are supplied.
+    function object
+        If `*iterables` are not supplied.
+
+    Raises
+    ------
+    ValueError
+        If `chunksize` or `workers` is less than one.
+
+    """
+
+    field_count = _named_tuple_info(named_tuple).field_count
+    if chunksize < 1:
+        raise ValueError(
+            "chunksize must be at least one, received {}.".format(chunksize)
+        )
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least one, received {}.".format(workers))
+    if longest:
+        defaults = _set_defaults(defaults, fillvalue, named_tuple)
+
+    def _namedzip_map_factory(*iterables):
+        _compare_iterables_to_fields(len(iterables), field_count)
+        zipped = _create_zip(
+            *iterables, fillvalue=fillvalue, type_longest=longest, defaults=defaults
+        )
+        chunks = iter(lambda: list(islice(zipped, chunksize)), [])
+        return _map_chunks(func, named_tuple, chunks, workers, ordered, executor)
+
+    if iterables:
+        return _namedzip_map_factory(*iterables)
+    else:
+        return _namedzip_map_factory
+
+
+def _map_chunk(func, named_tuple, rows):
+    """Return the results of `func` for a chunk of rows.
+
+    Runs in a worker process.
+
+    Parameters
+    ----------
+    func : function
+    named_tuple : tuple subclass
+    rows : list of tuples
+
+    Returns
+    -------
+    list
+
+    """
+
+    return list(map(func, _row_builder(named_tuple)(rows)))
+
+
+def _map_chunks(func, named_tuple, chunks, workers, ordered, executor):
+    """Generate results of `_map_chunk` for each of `chunks`.
+
+    Keeps up to two chunks per worker submitted, or per processor if
+    `workers` is None. Pending chunks are cancelled, and an executor
+    created here is shut down, when the generator is exhausted, closed
+    or garbage collected.
+
+    """
+
+    # Imported here, as `concurrent.futures` is slow to import with the package.
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = ProcessPoolExecutor(workers) if executor is None else executor
+    limit = 2 * (workers or os.cpu_count() or 1)
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(pool.submit(_map_chunk, func, named_tuple, chunk))
+            if len(pending) >= limit:
+                for future in _next_done(pending, ordered):
+                    yield from future.result()
+        while pending:
+            for future in _next_done(pending, ordered):
+                yield from future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown()
+
+
+def _next_done(pending, ordered):
+    """Remove and return the futures of `pending` to consume next.
+
+    Returns the oldest future if `ordered` is True, otherwise waits for
+    and returns the futures which are done.
+
+    """
+
+    if ordered:
+        return [pending.popleft()]
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    done = wait(pending, return_when=FIRST_COMPLETED).done
+    for future in done:
+        pending.remove(future)
+    return done
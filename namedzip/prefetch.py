@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""This module implements prefetching of iterables in background
+threads, used by `namedzip` and `namedzip_longest` when they are called
+with a `prefetch` buffer size.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import queue
+import threading
+import weakref
+
+
+class _Failure:
+    """Exception raised by an iterable, passed through a buffer."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+
+_end = _Failure(None)
+
+# Seconds a background task waits for room in a full buffer before it
+# checks whether it was stopped.
+_POLL_INTERVAL = 0.05
+
+
+def _prefetch_iterables(iterables, size, executor=None, longest=False):
+    """Prefetch each of `iterables` in its own background thread.
+
+    Unless `longest` is True, the zip ends with the first exhausted
+    iterable, so the background tasks of all `iterables` are stopped
+    then, instead of blocking on their full buffers.
+
+    Parameters
+    ----------
+    iterables : sequence of iterables
+        Iterable objects to prefetch.
+    size : int
+        Maximum number of values buffered for each iterable.
+    executor : concurrent.futures.Executor, optional
+        Executor to run the background tasks in, new daemon threads are
+        started if not specified. Must be able to run a task for each of
+        `iterables` at the same time. (default is None).
+    longest : bool, optional
+        Whether `iterables` are zipped like `namedzip_longest`.
+        (default is False).
+
+    Returns
+    -------
+    list of iterator objects
+
+    """
+
+    iterators = [_PrefetchIterator(iterable, size, executor) for iterable in iterables]
+    if not longest:
+        finalizers = tuple(iterator._finalizer for iterator in iterators)
+        for iterator in iterators:
+            iterator._group = finalizers
+    return iterators
+
+
+def _fill(iterator, buffer, stop):
+    """Put the values of `iterator` into `buffer` until `stop` is set.
+
+    Runs in a background thread. Ends with `_end`, or a `_Failure`
+    holding the exception raised by `iterator`, unless `stop` is set,
+    in which case nobody is reading `buffer` anymore.
+
+    """
+
+    try:
+        for value in iterator:
+            if not _put(buffer, value, stop):
+                return
+        failure = _end
+    except Exception as error:
+        failure = _Failure(error)
+    _put(buffer, failure, stop)
+
+
+def _put(buffer, value, stop):
+    """Put `value` into `buffer`, waiting for room until `stop` is set.
+
+    Returns False if `stop` was set before `value` was put, so a task
+    blocked on a full buffer ends once it is stopped, even if nobody
+    drains the buffer.
+
+    """
+
+    while not stop.is_set():
+        try:
+            buffer.put(value, timeout=_POLL_INTERVAL)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _stop(buffer, stop):
+    """Signal the background task to stop and discard buffered values."""
+
+    stop.set()
+    try:
+        while True:
+            buffer.get_nowait()
+    except queue.Empty:
+        pass
+
+
+class _PrefetchIterator:
+    """Iterator over values prefetched into a bounded buffer.
+
+    The values of `iterable` are read by a background task into a
+    `queue.Queue` of at most `size` values, so reading a slow iterable
+    overlaps with the consumer and with other prefetched iterables.
+    Exceptions raised by `iterable` are raised again by `__next__` in
+    the consuming thread, after the values read before them.
+
+    The background task is stopped by `close`, which is also called
+    when the iterator is garbage collected or the interpreter exits,
+    and when another iterator of its group is exhausted. A stopped
+    iterator is exhausted.
+
+    Parameters
+    ----------
+    iterable : iterable
+        Iterable object to prefetch.
+    size : int
+        Maximum number of buffered values.
+    executor : concurrent.futures.Executor, optional
+        Executor to run the background task in, a new daemon thread is
+        started if not specified. (default is None).
+
+    """
+
+    def __init__(self, iterable, size, executor=None):
+        iterator = iter(iterable)
+        self._buffer = buffer = queue.Queue(size)
+        self._stopped = stop = threading.Event()
+        self._finalizer = weakref.finalize(self, _stop, buffer, stop)
+        # Finalizers of the iterators which end with this one.
+        self._group = ()
+        if executor is None:
+            thread = threading.Thread(
+                target=_fill, args=(iterator, buffer, stop), daemon=True
+            )
+            thread.start()
+        else:
+            executor.submit(_fill, iterator, buffer, stop)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._buffer is None or self._stopped.is_set():
+            raise StopIteration
+        value = self._buffer.get()
+        if type(value) is _Failure:
+            self.close()
+            if value is _end:
+                for finalizer in self._group:
+                    finalizer()
+                raise StopIteration
+            raise value.error
+        return value
+
+    def close(self):
+        """Stop the background task and discard buffered values."""
+
+        if self._buffer is not None:
+            self._buffer = None
+            self._finalizer()
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""This module implements readers which provide columns for `namedzip`
+and `namedzip_longest` straight from files, and `namedzip_csv`, which
+generates named tuples from the columns of CSV files.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections.abc import Sequence
+import csv
+from functools import partial
+from itertools import chain
+import mmap
+from operator import itemgetter
+import os
+
+from .namedzip import (
+    _compare_iterables_to_fields,
+    _default_values,
+    _named_tuple_info,
+    _row_maker,
+    _set_defaults,
+)
+
+
+def namedzip_csv(
+    named_tuple,
+    file,
+    columns=None,
+    header=True,
+    fillvalue=None,
+    defaults=None,
+    block_size=1 << 16,
+    **fmtparams
+):
+    """Generate named tuples from the columns of a CSV file.
+
+    Reads `file` with `csv.reader` in blocks of about `block_size`
+    bytes, so only one block of lines is held in memory at a time, and
+    yields a named tuple per record with the values of `columns`.
+    Values which are empty, or missing because a record is too short,
+    are replaced with `fillvalue` or individual `defaults` like in
+    `namedzip_longest`. Blank lines are skipped.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+    file : str or file object
+        Path of the CSV file, or a text file object opened with
+        ``newline=""``. Paths are opened on the first iteration and
+        closed when the iterator is exhausted or closed.
+    columns : sequence, optional
+        Column for each field of `named_tuple`, as a header name or a
+        zero-based index. Defaults to the field names if `header` is
+        True, otherwise to the first columns in order. (default is None).
+    header : bool, optional
+        Whether the first record contains the column names, which is
+        then not yielded. (default is True).
+    fillvalue : optional
+        Passed on to `_set_defaults`. (default is None).
+    defaults : iterable, optional
+        Passed on to `_set_defaults`. (default is None).
+    block_size : int, optional
+        Approximate number of bytes read at a time. (default is 65536).
+    **fmtparams
+        Passed on to `csv.reader`, e.g. `delimiter`.
+
+    Returns
+    -------
+    generator object
+
+    Raises
+    ------
+    ValueError
+        If the number of `columns` does not equal the number of
+        `named_tuple` field names, or if an index is negative. On the
+        first iteration, if a column name is not found in the header.
+
+    """
+
+    info = _named_tuple_info(named_tuple)
+    if columns is not None:
+        _compare_iterables_to_fields(len(columns), info.field_count)
+        for column in columns:
+            if isinstance(column, int) and column < 0:
+                raise ValueError(
+                    "Column indices must not be negative, received {}.".format(column)
+                )
+    defaults = _set_defaults(defaults, fillvalue, named_tuple)
+    defaults = _default_values(defaults, fillvalue, info.field_count)
+    return _read_csv(
+        _row_maker(named_tuple),
+        info.fields,
+        file,
+        columns,
+        header,
+        defaults,
+        block_size,
+        fmtparams,
+    )
+
+
+def _read_csv(make_row, fields, file, columns, header, defaults, block_size, fmtparams):
+    """Generate rows of `namedzip_csv`."""
+
+    opened = isinstance(file, str)
+    if opened:
+        file = open(file, newline="")
+    try:
+        # Lines are read in blocks of whole lines of about block_size bytes.
+        blocks = iter(partial(file.readlines, block_size), [])
+        records = csv.reader(chain.from_iterable(blocks), **fmtparams)
+        names = None
+        if header:
+            names = next(records, None)
+            if names is None:
+                return
+        indices = _column_indices(fields, columns, names)
+        if len(indices) == 1:
+            index = indices[0]
+
+            # `itemgetter` of one index returns the value, not a tuple.
+            def project(record):
+                return (record[index],)
+
+        else:
+            project = itemgetter(*indices)
+        for record in records:
+            try:
+                values = project(record)
+            except IndexError:
+                if not record:
+                    continue
+                values = tuple(record[i] if i < len(record) else "" for i in indices)
+            if "" in values:
+                values = [
+                    default if value == "" else value
+                    for value, default in zip(values, defaults)
+                ]
+            yield make_row(values)
+    finally:
+        if opened:
+            file.close()
+
+
+def _column_indices(fields, columns, names):
+    """Resolve the record index of each column.
+
+    Parameters
+    ----------
+    fields : tuple
+        Field names of the named tuple.
+    columns : sequence or None
+        Header names or indices, see `namedzip_csv`.
+    names : list or None
+        Column names from the header record.
+
+    Returns
+    -------
+    list of int
+
+    Raises
+    ------
+    ValueError
+        If a column name is not in `names`, or if column names are used
+        without a header.
+
+    """
+
+    if columns is None:
+        columns = fields if names is not None else range(len(fields))
+    indices = []
+    for column in columns:
+        if isinstance(column, int):
+            indices.append(column)
+        elif names is None:
+            raise ValueError(
+                "Column name {!r} requires a header record.".format(column)
+            )
+        elif column not in names:
+            raise ValueError("Column {!r} not found in the header.".format(column))
+        else:
+            indices.append(names.index(column))
+    return indices
+
+
+class MappedColumn(Sequence):
+    """Column of fixed-width binary values in a memory-mapped file.
+
+    The file is mapped with `mmap` and its bytes are cast to typed
+    values with `memoryview.cast`, so values are decoded from the mapped
+    pages on access without reading the file into memory. Columns are
+    sequences of Python numbers which can be zipped by `namedzip`,
+    `namedzip_longest` and `NamedZipView` like lists, and slices are
+    memoryviews of the same pages.
+
+    Columns keep the file mapped until `close` is called, or the column
+    is used as a context manager and the `with` block ends. Pickled
+    columns map the file again when unpickled.
+
+    Parameters
+    ----------
+    path : str
+        Path of the binary file.
+    typecode : str
+        Native single character `struct` format of the values, such as
+        ``"d"`` for double or ``"q"`` for 64-bit integer.
+    offset : int, optional
+        Position of the first value in bytes. (default is 0).
+    length : int, optional
+        Number of values. Defaults to as many complete values as follow
+        `offset` in the file when None. (default is None).
+
+    Raises
+    ------
+    ValueError
+        If `typecode` is not supported by `memoryview.cast`, or if
+        `offset` and `length` exceed the size of the file.
+
+    Examples
+    --------
+    >>> with MappedColumn("x.bin", "d") as xs, MappedColumn("y.bin", "d") as ys:
+    ...     for point in namedzip(Point, xs, ys):
+    ...         pass
+
+    """
+
+    def __init__(self, path, typecode, offset=0, length=None):
+        itemsize = memoryview(b"").cast(typecode).itemsize
+        size = os.path.getsize(path)
+        if length is None:
+            length = max(size - offset, 0) // itemsize
+        if offset < 0 or length < 0 or offset + length * itemsize > size:
+            raise ValueError(
+                "{} values of {} bytes at offset {} exceed the file size "
+                "({} bytes).".format(length, itemsize, offset, size)
+            )
+        self.path = path
+        self.typecode = typecode
+        self._offset = offset
+        self._mmap = None
+        if not length:
+            self._values = memoryview(b"").cast(typecode)
+            return
+        # Mappings must start at a multiple of the allocation granularity.
+        start = offset - offset % mmap.ALLOCATIONGRANULARITY
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(
+                file.fileno(),
+                offset + length * itemsize - start,
+                access=mmap.ACCESS_READ,
+                offset=start,
+            )
+        with memoryview(self._mmap) as data:
+            self._values = data[offset - start :].cast(typecode)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __enter__(self):
+        return self
+
+    def __reduce__(self):
+        # The file is mapped again when unpickled.
+        return type(self), (self.path, self.typecode, self._offset, len(self))
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the values and unmap the file.
+
+        Raises
+        ------
+        BufferError
+            If slices of the column are still referenced.
+
+        """
+
+        self._values.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __repr__(self):
+        return "{}({!r}, {!r}, rows={})".format(
+            type(self).__name__,
+            self.path,
+            self.typecode,
+            len(self) if not self.closed else "closed",
+        )
+
+    @property
+    def closed(self):
+        """True if the column has been closed."""
+
+        try:
+            self._values.nbytes
+        except ValueError:
+            return True
+        return False
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""This module implements `namedrecord`, a factory function for compact
+mutable record classes which `namedzip` and its relatives accept as row
+types in place of named tuples.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from keyword import iskeyword
+import sys
+
+
+def namedrecord(typename, field_names, defaults=None, module=None):
+    """Returns a new record class with named fields stored in `__slots__`.
+
+    Instances have no `__dict__` and are not tuples, so they are smaller
+    than named tuples of the same fields but support neither indexing
+    nor hashing. Fields can be reassigned after creation. Like named
+    tuples the classes have `_fields`, `_field_defaults`, `_make` and
+    `_asdict`, and `_astuple` returns the values as a tuple.
+
+    Parameters
+    ----------
+    typename : str
+        Name of the record class.
+    field_names : str or iterable
+        Field names as a sequence of strings, or a single string with
+        names separated by whitespace and/or commas.
+    defaults : iterable, optional
+        Default values for the rightmost fields, like the `defaults` of
+        `collections.namedtuple`. (default is None).
+    module : str, optional
+        Value of `__module__` for the class, defaults to the module of
+        the caller. (default is None).
+
+    Returns
+    -------
+    type
+
+    Raises
+    ------
+    ValueError
+        If a field name is not a valid identifier, is a keyword, starts
+        with an underscore or is duplicated, or if there are more
+        defaults than fields.
+
+    Examples
+    --------
+    >>> Point = namedrecord("Point", ["x", "y"])
+    >>> point = next(namedzip(Point, [1], [2]))
+    >>> point.x += 10
+    >>> point
+    Point(x=11, y=2)
+
+    """
+
+    if isinstance(field_names, str):
+        field_names = field_names.replace(",", " ").split()
+    fields = tuple(map(str, field_names))
+    for name in (typename,) + fields:
+        if not name.isidentifier() or iskeyword(name):
+            raise ValueError(
+                "Type names and field names must be valid identifiers which "
+                "are not keywords, received {!r}.".format(name)
+            )
+    seen = set()
+    for name in fields:
+        if name.startswith("_"):
+            raise ValueError(
+                "Field names cannot start with an underscore, "
+                "received {!r}.".format(name)
+            )
+        if name in seen:
+            raise ValueError("Encountered duplicate field name {!r}.".format(name))
+        seen.add(name)
+    defaults = tuple(defaults) if defaults is not None else ()
+    if len(defaults) > len(fields):
+        raise ValueError("Got more default values than field names.")
+
+    # Methods are compiled from source, so that `__init__` assigns each
+    # field directly and `_astuple` builds the tuple in one expression.
+    arguments = ", ".join(fields)
+    assignments = "".join("    _self.{0} = {0}\n".format(name) for name in fields)
+    source = (
+        "def __init__(_self, {arguments}):\n"
+        "{assignments}\n"
+        "def _astuple(_self):\n"
+        "    return ({values})\n"
+    ).format(
+        arguments=arguments,
+        assignments=assignments or "    pass\n",
+        values="".join("_self.{}, ".format(name) for name in fields),
+    )
+    namespace = {}
+    exec(source, namespace)
+    __init__ = namespace["__init__"]
+    __init__.__defaults__ = defaults or None
+    __init__.__qualname__ = typename + ".__init__"
+    _astuple = namespace["_astuple"]
+    _astuple.__qualname__ = typename + "._astuple"
+    repr_format = "{}({})".format(
+        typename, ", ".join("{}=%r".format(name) for name in fields)
+    )
+
+    def __repr__(self):
+        return repr_format % self._astuple()
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def _make(cls, iterable):
+        """Make a new record from an iterable of field values."""
+
+        return cls(*iterable)
+
+    def _asdict(self):
+        """Return a new dict which maps field names to their values."""
+
+        return dict(zip(self._fields, self._astuple()))
+
+    for method in (__repr__, __eq__, _asdict):
+        method.__qualname__ = "{}.{}".format(typename, method.__name__)
+    _make.__qualname__ = typename + "._make"
+
+    attributes = {
+        "__doc__": "{}({})".format(typename, arguments),
+        "__slots__": fields,
+        "__init__": __init__,
+        "__repr__": __repr__,
+        "__eq__": __eq__,
+        "__hash__": None,
+        "_fields": fields,
+        "_field_defaults": dict(zip(fields[len(fields) - len(defaults) :], defaults)),
+        "_make": classmethod(_make),
+        "_asdict": _asdict,
+        "_astuple": _astuple,
+    }
+    record = type(typename, (object,), attributes)
+    if module is None:
+        try:
+            module = sys._getframe(1).f_globals.get("__name__", "__main__")
+        except (AttributeError, ValueError):  # pragma: no cover
+            pass
+    if module is not None:
+        record.__module__ = module
+    return record
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""This module implements instrumentation of the iterators returned by
+`namedzip` and `namedzip_longest` when they are called with
+``stats=True``.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from operator import length_hint
+from time import perf_counter
+
+
+class ZipStats:
+    """Counters of an instrumented `NamedZipIterator`.
+
+    Each zipped iterable is read through a wrapper which counts the
+    values pulled from it and adds up the time spent waiting for them,
+    including the final wait for the end of the iterable. Rows are not
+    counted separately, so instrumentation costs nothing per row beyond
+    the wrappers. The counters are updated as the iterator is consumed.
+
+    Attributes
+    ----------
+    fields : tuple
+        Field name of each zipped iterable.
+    longest : bool
+        Whether the iterables are zipped like `namedzip_longest`.
+    pulls : list of int
+        Number of values pulled from each iterable.
+    wait : list of float
+        Seconds spent waiting for the values of each iterable.
+
+    """
+
+    __slots__ = ("fields", "longest", "pulls", "wait")
+
+    def __init__(self, fields, longest=False):
+        self.fields = fields
+        self.longest = longest
+        self.pulls = [0] * len(fields)
+        self.wait = [0.0] * len(fields)
+
+    @property
+    def rows(self):
+        """Number of rows zipped, including rows rejected by `where`."""
+
+        if not self.pulls:
+            return 0
+        # `zip` pulls a value from each iterable before the first
+        # exhausted one, and discards them, so only the least is a row.
+        return max(self.pulls) if self.longest else min(self.pulls)
+
+    @property
+    def defaults(self):
+        """Number of default values substituted for each iterable."""
+
+        if not self.longest:
+            return [0] * len(self.pulls)
+        rows = self.rows
+        return [rows - pulls for pulls in self.pulls]
+
+    def as_dict(self):
+        """Return a dict which maps field names to their counters.
+
+        Returns
+        -------
+        dict
+            Dicts of `pulls`, `wait` and `defaults` by field name.
+
+        """
+
+        return {
+            field: {"pulls": pulls, "wait": wait, "defaults": defaults}
+            for field, pulls, wait, defaults in zip(
+                self.fields, self.pulls, self.wait, self.defaults
+            )
+        }
+
+    def __repr__(self):
+        return "{}(rows={}, pulls={}, wait={}, defaults={})".format(
+            type(self).__name__,
+            self.rows,
+            dict(zip(self.fields, self.pulls)),
+            dict(zip(self.fields, self.wait)),
+            dict(zip(self.fields, self.defaults)),
+        )
+
+
+def _instrument(iterators, fields, longest):
+    """Wrap `iterators` to record their counters in a new `ZipStats`.
+
+    Parameters
+    ----------
+    iterators : tuple of iterator objects
+    fields : tuple
+        Field name of each of `iterators`.
+    longest : bool
+        Whether `iterators` are zipped like `namedzip_longest`.
+
+    Returns
+    -------
+    tuple of iterator objects
+
+    """
+
+    stats = ZipStats(fields, longest)
+    wrapped = []
+    for index, iterator in enumerate(iterators):
+        # Only iterators which report their length pass on a hint, so
+        # `_zip_iterators` still tells sized iterables from others.
+        if hasattr(type(iterator), "__length_hint__"):
+            wrapped.append(_SizedStatsIterator(iterator, stats, index))
+        else:
+            wrapped.append(_StatsIterator(iterator, stats, index))
+    return tuple(wrapped)
+
+
+class _StatsIterator:
+    """Iterator which records pulls and waits of `iterator` in `stats`.
+
+    Pickles as the wrapped iterator, so restored checkpoints are not
+    instrumented.
+
+    """
+
+    __slots__ = ("_iterator", "_next", "_index", "stats")
+
+    def __init__(self, iterator, stats, index):
+        self._iterator = iterator
+        self._next = iterator.__next__
+        self._index = index
+        self.stats = stats
+
+    def __iter__(self):
+        return self
+
+    def __next__(self, clock=perf_counter):
+        start = clock()
+        try:
+            value = self._next()
+        finally:
+            self.stats.wait[self._index] += clock() - start
+        self.stats.pulls[self._index] += 1
+        return value
+
+    def __reduce__(self):
+        return iter, (self._iterator,)
+
+
+class _SizedStatsIterator(_StatsIterator):
+    """`_StatsIterator` which passes on the length hint of `iterator`."""
+
+    __slots__ = ()
+
+    def __length_hint__(self):
+        hint = length_hint(self._iterator, -1)
+        return NotImplemented if hint < 0 else hint
+
+
+class _StatsRows:
+    """Iterator of `rows` which exposes `stats`.
+
+    Returned by the zip functions for rows filtered by `where`, which
+    are not a `NamedZipIterator`. Iterating over the object with `iter`
+    returns `rows`, so rows are not passed through the wrapper.
+
+    """
+
+    __slots__ = ("_rows", "stats")
+
+    def __init__(self, rows, stats):
+        self._rows = rows
+        self.stats = stats
+
+    def __iter__(self):
+        return self._rows
+
+    def __next__(self):
+        return next(self._rows)
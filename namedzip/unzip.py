@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""This module implements `namedunzip`, the inverse of `namedzip`, which
+splits named tuples into a column per field.
+
+NumPy is an optional dependency, imported when NumPy columns are first
+requested. Without it NumPy columns fall back to lists.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from array import array
+from inspect import isclass
+from itertools import islice
+from operator import attrgetter, itemgetter, length_hint
+
+from .namedzip import _import_numpy, _named_tuple_info, _row_maker
+
+
+def namedunzip(named_tuple, rows=None, container=list, chunk_size=4096):
+    """Split named tuples into a column per field.
+
+    The inverse of `namedzip`. Reads `rows` once, in chunks of
+    `chunk_size` rows, and extends each column with the values of its
+    field in the chunk, so only one chunk of rows is held at a time.
+    Unlike ``zip(*rows)`` no argument tuple of all rows is created, and
+    values are appended straight into typed containers.
+
+    Returns a `named_tuple` whose fields are the columns if `rows` is
+    supplied, otherwise returns a function for unzipping rows.
+
+    Parameters
+    ----------
+    named_tuple : class
+        Class of the rows: a tuple subclass from `collections.namedtuple`
+        or `typing.NamedTuple`, a record class from `namedrecord`, or a
+        dataclass.
+    rows : iterable, optional
+        Iterable of `named_tuple` instances, or of plain tuples if
+        `named_tuple` is a tuple subclass.
+    container : optional
+        Type of the columns, or a sequence of types with one for each
+        field. A type is `list`, an `array.array` typecode like ``"d"``,
+        ``"numpy"`` for a NumPy array of an inferred data type, or a
+        NumPy data type like ``numpy.float32``. NumPy arrays are
+        preallocated from the length hint of `rows`, like that of a
+        `NamedZipIterator` of sequences, and grown as needed. Without
+        NumPy, NumPy columns are lists. (default is `list`).
+    chunk_size : int, optional
+        Number of rows read at a time. (default is 4096).
+
+    Returns
+    -------
+    named_tuple instance
+        If `rows` is supplied.
+    function object
+        If `rows` is not supplied.
+
+    Raises
+    ------
+    ValueError
+        If a container type is not supported, if the number of
+        container types does not equal the number of field names, or
+        if `chunk_size` is less than one.
+
+    Examples
+    --------
+    >>> columns = namedunzip(Point, [Point(1, 2), Point(3, 4)], container="q")
+    >>> columns.x
+    array('q', [1, 3])
+
+    """
+
+    info = _named_tuple_info(named_tuple)
+    if chunk_size < 1:
+        raise ValueError(
+            "chunk_size must be at least one, received {}.".format(chunk_size)
+        )
+    if isinstance(container, (list, tuple)):
+        if len(container) != info.field_count:
+            raise ValueError(
+                "Unequal number of containers ({}) and field names ({}).".format(
+                    len(container), info.field_count
+                )
+            )
+        containers = tuple(container)
+    else:
+        containers = (container,) * info.field_count
+    for spec in containers:
+        _check_container(spec)
+    if isclass(named_tuple) and issubclass(named_tuple, tuple):
+        getters = [itemgetter(index) for index in range(info.field_count)]
+    else:
+        getters = [attrgetter(field) for field in info.fields]
+    make_columns = _row_maker(named_tuple)
+
+    def _namedunzip_factory(rows):
+        size = length_hint(rows)
+        columns = [_new_column(spec, size) for spec in containers]
+        extends = [column.extend for column in columns]
+        rows = iter(rows)
+        for chunk in iter(lambda: list(islice(rows, chunk_size)), []):
+            for extend, getter in zip(extends, getters):
+                extend(map(getter, chunk))
+        return make_columns(
+            [
+                column.result() if type(column) is _ArrayBuffer else column
+                for column in columns
+            ]
+        )
+
+    if rows is not None:
+        return _namedunzip_factory(rows)
+    else:
+        return _namedunzip_factory
+
+
+def _check_container(spec):
+    """Raise ValueError if `spec` is not a supported container type."""
+
+    if spec is list or _is_dtype(spec):
+        return
+    if isinstance(spec, str):
+        if spec != "numpy":
+            # `array` validates the typecode.
+            array(spec)
+        return
+    raise ValueError("Unsupported container type {!r}.".format(spec))
+
+
+def _is_dtype(spec):
+    """Return True if `spec` is a NumPy data type."""
+
+    if spec is list or isinstance(spec, str):
+        return False
+    numpy = _import_numpy()
+    if numpy is None:
+        return False
+    return isinstance(spec, numpy.dtype) or (
+        isclass(spec) and issubclass(spec, numpy.generic)
+    )
+
+
+def _new_column(spec, size):
+    """Return an empty column of type `spec` for about `size` values."""
+
+    # NumPy data types are not compared to strings, which they would parse.
+    if _is_dtype(spec):
+        return _ArrayBuffer(_import_numpy().dtype(spec), size)
+    if spec is list:
+        return []
+    if spec == "numpy":
+        return [] if _import_numpy() is None else _ArrayBuffer(None, size)
+    return array(spec)
+
+
+class _ArrayBuffer:
+    """Growable NumPy array which is extended like a list.
+
+    The array is allocated for `size` values on the first `extend`, and
+    its capacity is doubled when it is full. If `dtype` is None the
+    data type is inferred from the values, and promoted if later values
+    do not fit it.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype or None
+    size : int
+        Expected number of values.
+
+    """
+
+    __slots__ = ("_array", "_dtype", "_size", "_count")
+
+    def __init__(self, dtype, size):
+        self._array = None
+        self._dtype = dtype
+        self._size = size
+        self._count = 0
+
+    def extend(self, values):
+        numpy = _import_numpy()
+        block = numpy.asarray(list(values), dtype=self._dtype)
+        end = self._count + len(block)
+        if self._array is None:
+            self._array = numpy.empty(max(self._size, end), dtype=block.dtype)
+        elif self._dtype is None and not numpy.can_cast(block.dtype, self._array.dtype):
+            self._array = self._array.astype(numpy.result_type(self._array, block))
+        if end > len(self._array):
+            grown = numpy.empty(max(2 * len(self._array), end), self._array.dtype)
+            grown[: self._count] = self._array[: self._count]
+            self._array = grown
+        self._array[self._count : end] = block
+        self._count = end
+
+    def result(self):
+        """Return the array of the values."""
+
+        if self._array is None:
+            return _import_numpy().empty(0, dtype=self._dtype)
+        if self._count < len(self._array):
+            return self._array[: self._count].copy()
+        return self._array
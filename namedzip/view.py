@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""This module implements `NamedZipView`, a lazy random-access view of
+zipped sequences which only creates named tuples for the rows that are
+actually accessed.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections.abc import Sequence
+from itertools import chain, islice, repeat
+from operator import itemgetter
+
+from .namedzip import (
+    _compare_iterables_to_fields,
+    _is_sequence,
+    _named_tuple_info,
+    _row_maker,
+    _zip_rows,
+)
+
+
+class NamedZipView(Sequence):
+    """Lazy view of sequences zipped into named tuples.
+
+    Holds references to the zipped sequences instead of copying them.
+    Rows are created as named tuples only when they are accessed, by
+    index, by iteration or by membership tests. Length, indexing and
+    slicing take constant time, and slices are views of the same
+    sequences.
+
+    Columns are available as attributes named after the fields of
+    `named_tuple`, e.g. `view.x` returns the sequence zipped into field
+    `x`. Columns of sliced views are sliced accordingly. Fields named
+    like methods of `Sequence` (`count` and `index`) cannot be accessed
+    as attributes.
+
+    Parameters
+    ----------
+    named_tuple : tuple subclass
+        tuple subclass from `collections.namedtuple` factory function,
+        or subclass of `typing.NamedTuple`.
+    *sequences : sequence
+        Instances of `collections.abc.Sequence`, such as lists, tuples,
+        ranges or arrays. The view is as long as the shortest
+        sequence, like `zip`.
+
+    Raises
+    ------
+    TypeError
+        If `named_tuple` does not appear to be a named tuple class, or
+        if any of `sequences` is not a sequence.
+    ValueError
+        If the number of `sequences` does not equal the number of
+        `named_tuple` field names.
+
+    """
+
+    def __init__(self, named_tuple, *sequences):
+        info = _named_tuple_info(named_tuple)
+        _compare_iterables_to_fields(len(sequences), info.field_count)
+        for sequence in sequences:
+            if not _is_sequence(sequence):
+                raise TypeError(
+                    "NamedZipView requires sequences supporting len() and "
+                    "indexing, received {!r} object.".format(type(sequence).__name__)
+                )
+        self._named_tuple = named_tuple
+        self._sequences = sequences
+        self._defaults = None
+        self._rows = range(min((len(s) for s in sequences), default=0))
+        self._indices = self._rows
+        self._make_row = _row_maker(named_tuple)
+
+    @classmethod
+    def _longest(cls, named_tuple, sequences, defaults):
+        """Return a view zipping `sequences` like `zip_longest`.
+
+        The view is as long as the longest sequence, and fields beyond
+        the end of shorter sequences are set to their `defaults`.
+
+        Parameters
+        ----------
+        named_tuple : tuple subclass
+        sequences : tuple of sequences
+        defaults : tuple
+            Default value for each of `sequences`.
+
+        Returns
+        -------
+        NamedZipView
+
+        """
+
+        view = cls(named_tuple, *sequences)
+        view._defaults = defaults
+        view._rows = range(max((len(s) for s in sequences), default=0))
+        view._indices = view._rows
+        return view
+
+    def _slice(self, indices):
+        """Return a view of the same sequences for `indices`."""
+
+        view = object.__new__(type(self))
+        view._named_tuple = self._named_tuple
+        view._sequences = self._sequences
+        view._defaults = self._defaults
+        view._rows = self._rows
+        view._indices = indices
+        view._make_row = self._make_row
+        return view
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._slice(self._indices[index])
+        i = self._indices[index]
+        if self._defaults is None:
+            return self._make_row(map(itemgetter(i), self._sequences))
+        return self._make_row(
+            [
+                s[i] if i < len(s) else default
+                for s, default in zip(self._sequences, self._defaults)
+            ]
+        )
+
+    def __iter__(self):
+        indices = self._indices
+        if self._defaults is not None:
+            columns = tuple(
+                _padded_column(s, indices, default)
+                for s, default in zip(self._sequences, self._defaults)
+            )
+        elif indices.start == 0 and indices.step == 1:
+            columns = tuple(islice(s, indices.stop) for s in self._sequences)
+        else:
+            columns = tuple(map(s.__getitem__, indices) for s in self._sequences)
+        return _zip_rows(self._named_tuple, (None, False, None), columns)
+
+    def __getattr__(self, name):
+        named_tuple = self.__dict__.get("_named_tuple")
+        fields = () if named_tuple is None else _named_tuple_info(named_tuple).fields
+        if name not in fields:
+            raise AttributeError(
+                "{!r} object has no attribute {!r}".format(type(self).__name__, name)
+            )
+        position = fields.index(name)
+        sequence = self._sequences[position]
+        indices = self._indices
+        if self._defaults is not None and indices and max(indices) >= len(sequence):
+            return list(_padded_column(sequence, indices, self._defaults[position]))
+        if indices == self._rows:
+            return sequence
+        stop = indices.stop if indices.stop >= 0 else None
+        return sequence[indices.start : stop : indices.step]
+
+    def __repr__(self):
+        return "{}({}, rows={})".format(
+            type(self).__name__, self._named_tuple.__name__, len(self)
+        )
+
+
+def _padded_column(sequence, indices, default):
+    """Iterate over `sequence` at `indices`, with `default` past its end.
+
+    Indices beyond the end of `sequence` form a suffix of `indices` if
+    they are ascending, or a prefix if they are descending, so values
+    are read with `map` and padded with `itertools.repeat`.
+
+    Parameters
+    ----------
+    sequence : sequence
+    indices : range
+        Non-negative indices.
+    default :
+        Value for indices beyond the end of `sequence`.
+
+    Returns
+    -------
+    iterator object
+
+    """
+
+    size = len(sequence)
+    if indices.step > 0:
+        inside = len(range(indices.start, min(indices.stop, size), indices.step))
+        return chain(
+            map(sequence.__getitem__, indices[:inside]),
+            repeat(default, len(indices) - inside),
+        )
+    outside = len(range(indices.start, max(indices.stop, size - 1), indices.step))
+    return chain(repeat(default, outside), map(sequence.__getitem__, indices[outside:]))
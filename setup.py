@@ -1,4 +1,4 @@
-from setuptools import setup
+from setuptools import Extension, setup
 
 with open("README.rst", "r", encoding="utf-8") as f:
     README = f.read()
@@ -22,5 +22,10 @@ setup(
         "Programming Language :: Python :: 3.7",
     ],
     packages=["namedzip"],
+    ext_modules=[
+        # The pure-Python implementation is used if the build fails.
+        Extension("namedzip._speedups", ["namedzip/_speedups.c"], optional=True)
+    ],
     python_requires=">=3.4",
+    extras_require={"numpy": ["numpy"]},
 )
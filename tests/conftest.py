@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Shared fixtures for the namedzip test suite.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import sys
+
+import pytest
+
+import namedzip  # noqa: F401
+
+# The package re-exports the `namedzip` function under the module's name.
+namedzip_module = sys.modules["namedzip.namedzip"]
+
+# `async def` and `await` are a SyntaxError before Python 3.5.
+collect_ignore = ["test_aio.py"] if sys.version_info < (3, 5) else []
+
+
+@pytest.fixture(autouse=True, params=["python", "c"])
+def backend(request, monkeypatch):
+    """Run every test against both row-building backends.
+
+    The C backend is skipped if the `_speedups` extension is not built.
+
+    """
+
+    speedups = namedzip_module._speedups
+    if request.param == "python":
+        monkeypatch.setattr(namedzip_module, "_speedups", None)
+    elif speedups is None:
+        pytest.skip("namedzip._speedups extension is not available")
+    return request.param
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip.aio module.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import asyncio
+from collections import namedtuple
+import sys
+import types
+
+import pytest
+
+from namedzip import anamedzip, anamedzip_longest
+
+
+class AsyncIterable:
+    """Asynchronous iterable yielding `values`, awaiting `delay` first."""
+
+    def __init__(self, values, delay=0):
+        self.values = iter(values)
+        self.delay = delay
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(self.delay)
+        try:
+            return next(self.values)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def run(coroutine):
+    """Run `coroutine` in a new event loop and return its result."""
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(async_iterator):
+    """Collect the values of `async_iterator` into a list."""
+
+    values = []
+    async for value in async_iterator:
+        values.append(value)
+    return values
+
+
+@pytest.fixture()
+def pair_named_tuple():
+    """Test fixture to provide sample named tuple."""
+
+    return namedtuple("Pair", ["letter", "number"])
+
+
+class TestAnamedzip:
+    """Collection for `namedzip.aio.anamedzip`."""
+
+    def test_anamedzip_async_iterables(self, pair_named_tuple):
+        """Zips asynchronous iterables into named tuples."""
+
+        pairs = run(
+            collect(
+                anamedzip(pair_named_tuple, AsyncIterable("ABC"), AsyncIterable([1, 2]))
+            )
+        )
+        assert pairs == [("A", 1), ("B", 2)]
+        assert all(type(pair) is pair_named_tuple for pair in pairs)
+
+    def test_anamedzip_mixed_iterables(self, pair_named_tuple):
+        """Zips a mix of synchronous and asynchronous iterables."""
+
+        pairs = run(collect(anamedzip(pair_named_tuple, "AB", AsyncIterable([1, 2]))))
+        assert pairs == [("A", 1), ("B", 2)]
+
+    def test_anamedzip_stops_after_exhaustion(self, pair_named_tuple):
+        """Iteration stays stopped once an iterable is exhausted."""
+
+        async def check():
+            pairs = anamedzip(pair_named_tuple, "A", AsyncIterable([1, 2, 3]))
+            assert await collect(pairs) == [("A", 1)]
+            with pytest.raises(StopAsyncIteration):
+                await pairs.__anext__()
+
+        run(check())
+
+    def test_anamedzip_concurrent(self, pair_named_tuple):
+        """Next values of asynchronous iterables are awaited concurrently."""
+
+        class Waiting(AsyncIterable):
+            async def __anext__(self):
+                await asyncio.wait_for(self.event.wait(), timeout=1)
+                return await super().__anext__()
+
+        class Setting(AsyncIterable):
+            async def __anext__(self):
+                self.event.set()
+                return await super().__anext__()
+
+        async def check():
+            shared = asyncio.Event()
+            waiting, setting = Waiting("A"), Setting([1])
+            waiting.event = setting.event = shared
+            return await collect(anamedzip(pair_named_tuple, waiting, setting))
+
+        assert run(check()) == [("A", 1)]
+
+    def test_anamedzip_factory(self, pair_named_tuple):
+        """Returns a function when called without iterables."""
+
+        zip_pairs = anamedzip(pair_named_tuple)
+        assert isinstance(zip_pairs, types.FunctionType)
+        assert run(collect(zip_pairs("A", AsyncIterable([1])))) == [("A", 1)]
+
+    def test_anamedzip_iterables_fieldnames_mismatch(self, pair_named_tuple):
+        """Raises ValueError for non-equal number of iterables and fields."""
+
+        with pytest.raises(ValueError):
+            anamedzip(pair_named_tuple, "AB")
+
+    def test_anamedzip_propagates_errors(self, pair_named_tuple):
+        """Exceptions raised by an iterable are propagated."""
+
+        class Failing(AsyncIterable):
+            async def __anext__(self):
+                raise KeyError("failing")
+
+        with pytest.raises(KeyError):
+            run(collect(anamedzip(pair_named_tuple, "AB", Failing([]))))
+
+
+class TestAnamedzipLongest:
+    """Collection for `namedzip.aio.anamedzip_longest`."""
+
+    def test_anamedzip_longest_fillvalue(self, pair_named_tuple):
+        """Missing values are set to `fillvalue`."""
+
+        pairs = anamedzip_longest(
+            pair_named_tuple, AsyncIterable("ABC"), [1], fillvalue=0
+        )
+        assert run(collect(pairs)) == [("A", 1), ("B", 0), ("C", 0)]
+
+    def test_anamedzip_longest_defaults(self, pair_named_tuple):
+        """Individual `defaults` replace missing values."""
+
+        pairs = anamedzip_longest(
+            pair_named_tuple,
+            "A",
+            AsyncIterable([1, 2, 3]),
+            fillvalue="Missing",
+            defaults=["X", 99],
+        )
+        assert run(collect(pairs)) == [("A", 1), ("X", 2), ("X", 3)]
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="Requires Python 3.7 or higher"
+    )
+    def test_anamedzip_longest_named_tuple_defaults(self):
+        """Defaults specified in the named tuple are used."""
+
+        named_tuple = namedtuple("Pair", ["letter", "number"], defaults=(99,))
+        pairs = anamedzip_longest(named_tuple, AsyncIterable("AB"), AsyncIterable([1]))
+        assert run(collect(pairs)) == [("A", 1), ("B", 99)]
+
+    def test_anamedzip_longest_empty(self, pair_named_tuple):
+        """No rows for empty iterables."""
+
+        pairs = anamedzip_longest(pair_named_tuple, AsyncIterable(""), [])
+        assert run(collect(pairs)) == []
+
+    def test_anamedzip_longest_factory(self, pair_named_tuple):
+        """Returns a function when called without iterables."""
+
+        zip_pairs = anamedzip_longest(pair_named_tuple, defaults=["X", 99])
+        assert isinstance(zip_pairs, types.FunctionType)
+        assert run(collect(zip_pairs("AB", AsyncIterable([1])))) == [
+            ("A", 1),
+            ("B", 99),
+        ]
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip.arrays module.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+import sys
+import types
+
+import pytest
+
+import namedzip.arrays
+from namedzip import namedzip_array
+
+
+@pytest.fixture()
+def point_named_tuple():
+    """Test fixture to provide sample named tuple."""
+
+    return namedtuple("Point", ["x", "y"])
+
+
+class TestNamedzipArrayNumpy:
+    """Collection for `namedzip.arrays.namedzip_array` with NumPy."""
+
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        """Skip tests when NumPy is not installed."""
+
+        return pytest.importorskip("numpy")
+
+    def test_namedzip_array_record_array(self, numpy, point_named_tuple):
+        """Returns a record array with the named tuple field names."""
+
+        points = namedzip_array(point_named_tuple, [1, 2, 3], [1.5, 2.5, 3.5])
+        assert isinstance(points, numpy.recarray)
+        assert points.dtype.names == ("x", "y")
+        assert points.x.tolist() == [1, 2, 3]
+        assert points.y.tolist() == [1.5, 2.5, 3.5]
+
+    def test_namedzip_array_truncates_to_shortest(self, point_named_tuple):
+        """Columns are truncated like `zip`."""
+
+        points = namedzip_array(point_named_tuple, range(5), iter([7, 8]))
+        assert points.tolist() == [(0, 7), (1, 8)]
+
+    def test_namedzip_array_longest_fillvalue(self, point_named_tuple):
+        """Columns are padded with `fillvalue` like `zip_longest`."""
+
+        points = namedzip_array(
+            point_named_tuple, [1, 2, 3], [9], longest=True, fillvalue=0
+        )
+        assert points.tolist() == [(1, 9), (2, 0), (3, 0)]
+
+    def test_namedzip_array_longest_defaults(self, numpy, point_named_tuple):
+        """Individual `defaults` pad each column, widening the dtype."""
+
+        points = namedzip_array(
+            point_named_tuple, [1], [1, 2], longest=True, defaults=(0.5, -1)
+        )
+        assert points.tolist() == [(1.0, 1), (0.5, 2)]
+        assert points.dtype["x"] == numpy.float64
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="Requires Python 3.7 or higher"
+    )
+    def test_namedzip_array_named_tuple_defaults(self):
+        """Defaults specified in the named tuple are used for padding."""
+
+        named_tuple = namedtuple("Point", ["x", "y"], defaults=(-1,))
+        points = namedzip_array(named_tuple, [1, 2], [9], longest=True)
+        assert points.tolist() == [(1, 9), (2, -1)]
+
+    def test_namedzip_array_dtype(self, numpy, point_named_tuple):
+        """A structured `dtype` overrides the inferred data types."""
+
+        dtype = [("x", "i4"), ("y", "f4")]
+        points = namedzip_array(point_named_tuple, [1, 2], [3, 4], dtype=dtype)
+        assert points.dtype == numpy.dtype((numpy.record, dtype))
+
+    def test_namedzip_array_factory(self, numpy, point_named_tuple):
+        """Returns a function when called without iterables."""
+
+        zip_points = namedzip_array(point_named_tuple)
+        assert isinstance(zip_points, types.FunctionType)
+        assert zip_points([1], [2]).tolist() == [(1, 2)]
+
+    def test_namedzip_array_iterables_fieldnames_mismatch(self, point_named_tuple):
+        """Raises ValueError for non-equal number of columns and fields."""
+
+        with pytest.raises(ValueError):
+            namedzip_array(point_named_tuple, [1, 2])
+
+
+class TestNamedzipArrayFallback:
+    """Collection for `namedzip.arrays.namedzip_array` without NumPy."""
+
+    @pytest.fixture(autouse=True)
+    def without_numpy(self, monkeypatch):
+        """Disable the NumPy backend."""
+
+        monkeypatch.setattr(namedzip.arrays, "_import_numpy", lambda: None)
+
+    def test_namedzip_array_fallback_list(self, point_named_tuple):
+        """Returns a list of named tuples."""
+
+        points = namedzip_array(point_named_tuple, [1, 2, 3], [9, 8])
+        assert points == [point_named_tuple(1, 9), point_named_tuple(2, 8)]
+
+    def test_namedzip_array_fallback_longest(self, point_named_tuple):
+        """Pads like `namedzip_longest`."""
+
+        points = namedzip_array(
+            point_named_tuple, [1, 2], [9], longest=True, defaults=(0, -1)
+        )
+        assert points == [(1, 9), (2, -1)]
+
+    def test_namedzip_array_fallback_verifies_named_tuple(self):
+        """Raises TypeError for objects which are not named tuples."""
+
+        with pytest.raises(TypeError):
+            namedzip_array(tuple, [1, 2])
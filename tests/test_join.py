@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip.join module.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+from operator import itemgetter
+import sys
+import types
+
+import pytest
+
+from namedzip import namedrecord, namedzip_join
+
+Pair = namedtuple("Pair", ["left", "right"])
+
+
+def infinite(start=0):
+    """Generate increasing integers without end."""
+
+    while True:
+        yield start
+        start += 1
+
+
+class TestNamedzipJoin:
+    """Collection for `namedzip.join.namedzip_join`."""
+
+    def test_namedzip_join_aligns_keys(self):
+        """Values with equal keys share a row, gaps are filled."""
+
+        rows = namedzip_join(Pair, [1, 2, 4], [2, 3, 4])
+        assert list(rows) == [(1, None), (2, 2), (None, 3), (4, 4)]
+        assert all(type(row) is Pair for row in rows)
+
+    def test_namedzip_join_key(self):
+        """Values are aligned by the keys returned by `key`."""
+
+        left = [(1, "a"), (3, "c")]
+        right = [(2, "B"), (3, "C")]
+        rows = namedzip_join(Pair, left, right, key=itemgetter(0))
+        assert list(rows) == [
+            ((1, "a"), None),
+            (None, (2, "B")),
+            ((3, "c"), (3, "C")),
+        ]
+
+    def test_namedzip_join_fillvalue(self):
+        """Gaps are filled with `fillvalue`."""
+
+        rows = namedzip_join(Pair, [1], [2], fillvalue=0)
+        assert list(rows) == [(1, 0), (0, 2)]
+
+    def test_namedzip_join_defaults(self):
+        """Gaps are filled with individual `defaults`."""
+
+        rows = namedzip_join(Pair, [1], [2], defaults=["L", "R"])
+        assert list(rows) == [(1, "R"), ("L", 2)]
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="Requires Python 3.7 or higher"
+    )
+    def test_namedzip_join_named_tuple_defaults(self):
+        """Gaps are filled with the defaults of the named tuple."""
+
+        Defaulted = namedtuple("Defaulted", ["left", "right"], defaults=[-1])
+        rows = namedzip_join(Defaulted, [1], [2])
+        assert list(rows) == [(1, -1), (None, 2)]
+
+    def test_namedzip_join_record(self):
+        """Rows can be records."""
+
+        Record = namedrecord("Record", ["left", "right"])
+        assert list(namedzip_join(Record, [1], [1])) == [Record(1, 1)]
+
+    def test_namedzip_join_empty(self):
+        """Empty iterables produce no rows, or only rows of the others."""
+
+        assert list(namedzip_join(Pair, [], [])) == []
+        assert list(namedzip_join(Pair, [], [1, 2])) == [(None, 1), (None, 2)]
+
+    def test_namedzip_join_streaming(self):
+        """Rows are generated lazily from unbounded iterables."""
+
+        rows = namedzip_join(Pair, infinite(), infinite(5))
+        assert next(rows) == (0, None)
+        for _ in range(4):
+            next(rows)
+        assert next(rows) == (5, 5)
+
+    def test_namedzip_join_factory(self):
+        """Returns a function when called without iterables."""
+
+        join_pairs = namedzip_join(Pair, fillvalue=0)
+        assert isinstance(join_pairs, types.FunctionType)
+        assert list(join_pairs([1], [1, 2])) == [(1, 1), (0, 2)]
+
+    @pytest.mark.parametrize("left", [[2, 1], [1, 1]])
+    def test_namedzip_join_unsorted(self, left):
+        """Raises ValueError for keys which are not strictly increasing."""
+
+        rows = namedzip_join(Pair, left, [5])
+        with pytest.raises(ValueError):
+            list(rows)
+
+    def test_namedzip_join_iterables_fieldnames_mismatch(self):
+        """Raises ValueError for non-equal number of iterables and fields."""
+
+        with pytest.raises(ValueError):
+            namedzip_join(Pair, [1])
@@ -9,22 +9,45 @@ license: MIT, see LICENSE for more details.
 
 """
 
+import gc
+import io
+import pickle
 import types
 from collections import namedtuple
+from collections.abc import Iterator
 from itertools import zip_longest
+from operator import length_hint
+import os
+import subprocess
 import sys
+import warnings
+import weakref
 
 import pytest
 
-from namedzip import namedzip, namedzip_longest
+from namedzip import namedzip, namedzip_batches, namedzip_longest
 from namedzip.namedzip import (
+    NamedZipIterator,
+    SizedNamedZipIterator,
+    _bind_columns,
+    _cached_namedtuple,
     _compare_iterables_to_fields,
+    _convert_iterables,
     _create_zip,
+    _fill_iterators,
+    _filter_rows,
+    _get_namedtuple,
+    _index_fields,
     _namedzip_v1,
-    _namedzip_generator,
+    _named_tuple_info,
+    _named_tuple_infos,
     _namedzip_longest_v1,
+    _order_iterables,
+    _row_builder,
     _set_defaults,
     _verify_named_tuple,
+    _zip_builder,
+    sentinel,
 )
 
 
@@ -71,10 +94,10 @@ class TestNamedzipIntegration:
     """Collection for `namedzip.namedzip.namedzip`."""
 
     def test_namedzip_generator_type(self, pair_named_tuple, two_iterables):
-        """Returns a generator when called with iterables."""
+        """Returns an iterator when called with iterables."""
 
         pairs = namedzip(pair_named_tuple, *two_iterables)
-        assert isinstance(pairs, types.GeneratorType)
+        assert isinstance(pairs, Iterator)
 
     def test_namedzip_factory_type(self, pair_named_tuple):
         """Returns a function when called without iterables."""
@@ -137,10 +160,10 @@ class TestNamedziplongestIntegration:
     """Collection for `namedzip.namedzip.namedzip_longest`."""
 
     def test_namedzip_longest_generator_type(self, pair_named_tuple, two_iterables):
-        """Returns a generator when called with positional args."""
+        """Returns an iterator when called with positional args."""
 
         pairs = namedzip_longest(pair_named_tuple, *two_iterables)
-        assert isinstance(pairs, types.GeneratorType)
+        assert isinstance(pairs, Iterator)
 
     def test_namedzip_longest_factory_type(self, pair_named_tuple):
         """Returns a function when called without positional args."""
@@ -215,6 +238,30 @@ class TestNamedziplongestIntegration:
         else:
             raise AssertionError("Value assertions were not executed.")
 
+    def test_namedzip_longest_defaults_all_rows(self):
+        """Missing values in every position are replaced by defaults."""
+
+        named_tuple = namedtuple("Group", ["letter", "number", "symbol"])
+        groups = namedzip_longest(
+            named_tuple, "AB", [1, 2, 3, 4], "!", defaults=["X", 99, "#"]
+        )
+        assert list(groups) == [
+            ("A", 1, "!"),
+            ("B", 2, "#"),
+            ("X", 3, "#"),
+            ("X", 4, "#"),
+        ]
+
+    def test_namedzip_longest_factory_reuses_defaults(self):
+        """Iterators created by one factory fill values independently."""
+
+        named_tuple = namedtuple("Pair", ["letter", "number"])
+        zip_pairs = namedzip_longest(named_tuple, defaults=["X", 99])
+        first = zip_pairs("AB", [1])
+        second = zip_pairs("A", [1, 2])
+        assert list(first) == [("A", 1), ("B", 99)]
+        assert list(second) == [("A", 1), ("X", 2)]
+
     def test_namedzip_longest_defaults_none_value_not_repalced(self):
         """Veryfy that the `defaults` do not replace None values."""
 
@@ -242,20 +289,401 @@ class TestNamedziplongestIntegration:
             namedzip_longest(named_tuple, defaults)
 
 
+class TestNamedzipBatchesIntegration:
+    """Collection for `namedzip.namedzip.namedzip_batches`."""
+
+    def test_namedzip_batches_yields_lists(self, pair_named_tuple, two_iterables):
+        """Rows are yielded in lists of at most `batch_size` items."""
+
+        batches = list(namedzip_batches(pair_named_tuple, *two_iterables, batch_size=3))
+        assert batches == [
+            [("A", 1), ("B", 2), ("C", 3)],
+            [("D", 4)],
+        ]
+        assert all(type(row) is pair_named_tuple for row in batches[0])
+
+    def test_namedzip_batches_factory(self, pair_named_tuple, two_iterables):
+        """Returns a function when called without iterables."""
+
+        zip_batches = namedzip_batches(pair_named_tuple, batch_size=2)
+        assert isinstance(zip_batches, types.FunctionType)
+        assert list(map(len, zip_batches(*two_iterables))) == [2, 2]
+
+    def test_namedzip_batches_empty(self, pair_named_tuple):
+        """No batches are yielded for empty iterables."""
+
+        assert list(namedzip_batches(pair_named_tuple, [], [])) == []
+
+    def test_namedzip_batches_longest_defaults(self, pair_named_tuple):
+        """`longest` zips like `namedzip_longest` with `defaults`."""
+
+        batches = namedzip_batches(
+            pair_named_tuple, "ABC", [1], batch_size=2, longest=True, defaults=[99]
+        )
+        assert list(batches) == [[("A", 1), ("B", 99)], [("C", 99)]]
+
+    def test_namedzip_batches_iterables_fieldnames_mismatch(self, pair_named_tuple):
+        """Raises ValueError for non-equal number of iterables and fields."""
+
+        with pytest.raises(ValueError):
+            namedzip_batches(pair_named_tuple, "ABC")
+
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_namedzip_batches_invalid_batch_size(self, pair_named_tuple, batch_size):
+        """Raises ValueError when `batch_size` is less than one."""
+
+        with pytest.raises(ValueError):
+            namedzip_batches(pair_named_tuple, batch_size=batch_size)
+
+
+class TestNamedzipColumnsIntegration:
+    """Collection for the `columns` argument of the zip functions."""
+
+    def test_namedzip_columns_mapping(self, pair_named_tuple):
+        """Iterables of a mapping are bound to fields by name."""
+
+        rows = namedzip(pair_named_tuple, columns={"number": [1, 2], "letter": "AB"})
+        assert list(rows) == [("A", 1), ("B", 2)]
+
+    def test_namedzip_columns_projection(self, pair_named_tuple):
+        """Columns which are not fields are not read."""
+
+        unused = iter([1, 2, 3])
+        rows = namedzip(
+            pair_named_tuple, columns={"extra": unused, "letter": "A", "number": [1]}
+        )
+        assert list(rows) == [("A", 1)]
+        assert next(unused) == 1
+
+    def test_namedzip_columns_names(self, pair_named_tuple):
+        """A factory takes iterables in the order of the column names."""
+
+        zip_pairs = namedzip(pair_named_tuple, columns=["number", "extra", "letter"])
+        assert isinstance(zip_pairs, types.FunctionType)
+        assert list(zip_pairs([1, 2], [None, None], "AB")) == [("A", 1), ("B", 2)]
+        assert list(zip_pairs([3], [None], "C")) == [("C", 3)]
+
+    def test_namedzip_columns_sized(self, pair_named_tuple):
+        """Bound sequences are zipped into a sized iterator."""
+
+        rows = namedzip(pair_named_tuple, columns={"number": [1, 2], "letter": "AB"})
+        assert len(rows) == 2
+        assert rows[1] == ("B", 2)
+
+    def test_namedzip_longest_columns(self, pair_named_tuple):
+        """`namedzip_longest` binds iterables by name and pads them."""
+
+        rows = namedzip_longest(
+            pair_named_tuple, columns={"number": [1], "letter": "AB"}, defaults=[0]
+        )
+        assert list(rows) == [("A", 1), ("B", 0)]
+        zip_pairs = namedzip_longest(pair_named_tuple, columns=["number", "letter"])
+        assert list(zip_pairs([1, 2], "A")) == [("A", 1), (None, 2)]
+
+    def test_namedzip_columns_missing_field(self, pair_named_tuple):
+        """Raises ValueError if a field has no column."""
+
+        with pytest.raises(ValueError):
+            namedzip(pair_named_tuple, columns={"letter": "AB"})
+        with pytest.raises(ValueError):
+            namedzip_longest(pair_named_tuple, columns=["number"])
+
+    def test_namedzip_columns_with_iterables(self, pair_named_tuple):
+        """Raises ValueError if columns are supplied with iterables."""
+
+        with pytest.raises(ValueError):
+            namedzip(pair_named_tuple, "AB", [1, 2], columns=["letter", "number"])
+
+    def test_namedzip_columns_count_mismatch(self, pair_named_tuple):
+        """Raises ValueError for non-equal number of iterables and columns."""
+
+        zip_pairs = namedzip(pair_named_tuple, columns=["number", "letter", "extra"])
+        with pytest.raises(ValueError):
+            zip_pairs([1], "A")
+
+
+class TestNamedzipConvertersIntegration:
+    """Collection for the `converters` argument of the zip functions."""
+
+    def test_namedzip_converters(self, pair_named_tuple):
+        """Values of fields with converters are converted."""
+
+        rows = namedzip(pair_named_tuple, "AB", ["1", "2"], converters={"number": int})
+        assert list(rows) == [("A", 1), ("B", 2)]
+
+    def test_namedzip_converters_factory(self, pair_named_tuple):
+        """Converters apply to every iterator of a factory."""
+
+        zip_pairs = namedzip(
+            pair_named_tuple, converters={"letter": str.lower, "number": float}
+        )
+        assert list(zip_pairs("A", ["1"])) == [("a", 1.0)]
+        assert list(zip_pairs("BC", [2, 3])) == [("b", 2.0), ("c", 3.0)]
+
+    def test_namedzip_converters_lazy(self, pair_named_tuple):
+        """Values are converted as rows are consumed."""
+
+        calls = []
+
+        def convert(value):
+            calls.append(value)
+            return int(value)
+
+        rows = namedzip(pair_named_tuple, "AB", "12", converters={"number": convert})
+        assert calls == []
+        assert next(rows) == ("A", 1)
+        assert calls == ["1"]
+
+    def test_namedzip_converters_columns(self, pair_named_tuple):
+        """Converters apply to iterables bound by name."""
+
+        rows = namedzip(
+            pair_named_tuple,
+            columns={"number": ["7"], "letter": "A"},
+            converters={"number": int},
+        )
+        assert list(rows) == [("A", 7)]
+
+    def test_namedzip_longest_converters_defaults(self, pair_named_tuple):
+        """Default values are not converted."""
+
+        rows = namedzip_longest(
+            pair_named_tuple, "ABC", ["1"], defaults=["0"], converters={"number": int}
+        )
+        assert list(rows) == [("A", 1), ("B", "0"), ("C", "0")]
+        rows = namedzip_longest(
+            pair_named_tuple, "A", [1, 2], converters={"letter": str.lower}
+        )
+        assert list(rows) == [("a", 1), (None, 2)]
+
+    def test_namedzip_converters_unknown_field(self, pair_named_tuple):
+        """Raises ValueError for converters of unknown fields."""
+
+        with pytest.raises(ValueError):
+            namedzip(pair_named_tuple, converters={"other": int})
+        with pytest.raises(ValueError):
+            namedzip_longest(pair_named_tuple, converters={"other": int})
+
+
+class TestNamedzipWhereIntegration:
+    """Collection for the `where` argument of the zip functions."""
+
+    def test_namedzip_where(self, pair_named_tuple, two_iterables):
+        """Only rows which satisfy the predicate are generated."""
+
+        rows = namedzip(
+            pair_named_tuple, *two_iterables, where={"number": lambda n: n % 2}
+        )
+        assert list(rows) == [("A", 1), ("C", 3)]
+        assert all(type(row) is pair_named_tuple for row in rows)
+
+    def test_namedzip_where_all_predicates(self, pair_named_tuple, two_iterables):
+        """Rows must satisfy every predicate."""
+
+        where = {"letter": lambda c: c != "A", "number": lambda n: n % 2}
+        rows = namedzip(pair_named_tuple, *two_iterables, where=where)
+        assert list(rows) == [("C", 3)]
+
+    def test_namedzip_where_single_pass(self, pair_named_tuple):
+        """Iterators are read once, and predicates called once per row."""
+
+        calls = []
+
+        def keep(number):
+            calls.append(number)
+            return number > 1
+
+        rows = namedzip(
+            pair_named_tuple, iter("ABC"), iter([1, 2, 3]), where={"number": keep}
+        )
+        assert list(rows) == [("B", 2), ("C", 3)]
+        assert calls == [1, 2, 3]
+
+    def test_namedzip_where_factory(self, pair_named_tuple):
+        """Predicates apply to every iterator of a factory."""
+
+        zip_pairs = namedzip(pair_named_tuple, where={"letter": str.isupper})
+        assert list(zip_pairs("aB", [1, 2])) == [("B", 2)]
+        assert list(zip_pairs("Cd", [3, 4])) == [("C", 3)]
+
+    def test_namedzip_where_converters(self, pair_named_tuple):
+        """Predicates see converted values."""
+
+        rows = namedzip(
+            pair_named_tuple,
+            "AB",
+            ["1", "2"],
+            converters={"number": int},
+            where={"number": lambda n: n > 1},
+        )
+        assert list(rows) == [("B", 2)]
+
+    def test_namedzip_longest_where_defaults(self, pair_named_tuple):
+        """Predicates see default values of exhausted iterables."""
+
+        rows = namedzip_longest(
+            pair_named_tuple,
+            "ABC",
+            [1],
+            defaults=[0],
+            where={"number": lambda n: n == 0},
+        )
+        assert list(rows) == [("B", 0), ("C", 0)]
+        rows = namedzip_longest(
+            pair_named_tuple, "A", [1, 2], where={"letter": lambda c: c is None}
+        )
+        assert list(rows) == [(None, 2)]
+
+    def test_namedzip_where_reentrant(self, pair_named_tuple):
+        """Iterators which advance the filtered rows themselves get their
+        own rows, and values are neither leaked nor released twice."""
+
+        class Numbers:
+            def __init__(self):
+                self.count = 0
+                self.inner = None
+
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                self.count += 1
+                if self.count > 4:
+                    raise StopIteration
+                value = [self.count]
+                if self.count == 1:
+                    self.inner = next(rows)
+                return value
+
+        numbers = Numbers()
+        letters = iter([["A"], ["B"], ["C"], ["D"]])
+        rows = namedzip(
+            pair_named_tuple, letters, numbers, where={"letter": lambda c: c != ["C"]}
+        )
+        assert next(rows) == (["A"], [1])
+        assert numbers.inner == (["B"], [2])
+        assert list(rows) == [(["D"], [4])]
+        gc.collect()
+        assert numbers.inner == (["B"], [2])
+
+    def test_namedzip_where_unknown_field(self, pair_named_tuple):
+        """Raises ValueError for predicates of unknown fields."""
+
+        with pytest.raises(ValueError):
+            namedzip(pair_named_tuple, where={"other": bool})
+
+
 class TestDeprecationWarnings:
     """Verify that warnings are issued for deprecated parameters."""
 
     def test_deprecation_warning_namedzip(self):
-        """DeprecationWarning for typename & field_names kwargs."""
+        """FutureWarning for typename & field_names kwargs."""
 
-        with pytest.warns(DeprecationWarning):
+        with pytest.warns(FutureWarning):
             namedzip(typename="Pair", field_names=("letter", "number"))
 
     def test_deprecation_warning_namedzip_longest(self):
-        """DeprecationWarning for typename & field_names kwargs."""
+        """FutureWarning for typename & field_names kwargs."""
+
+        with pytest.warns(FutureWarning):
+            namedzip_longest(typename="Pair", field_names=("letter", "number"))
+
+    def test_deprecation_warning_call_site(self):
+        """Warning is attributed to the caller of the interface."""
+
+        with pytest.warns(FutureWarning) as record:
+            namedzip(typename="Pair", field_names=("letter", "number"))
+        assert record[0].filename == __file__
+
+    def test_deprecation_warning_filters_unchanged(self):
+        """Deprecated calls do not add global warning filters."""
 
-        with pytest.warns(DeprecationWarning):
+        filters = list(warnings.filters)
+        with warnings.catch_warnings(record=True):
+            for _ in range(3):
+                namedzip(typename="Pair", field_names=("letter", "number"))
+        assert warnings.filters == filters
+
+    def test_deprecation_warning_once_per_call_site(self):
+        """Default filters show the warning once per call site."""
+
+        with warnings.catch_warnings(record=True) as record:
+            warnings.resetwarnings()
+            for _ in range(3):
+                namedzip(typename="Pair", field_names=("letter", "number"))
             namedzip_longest(typename="Pair", field_names=("letter", "number"))
+        assert [w.category for w in record] == [FutureWarning] * 2
+
+    def test_deprecation_warning_imported_caller(self, tmp_path):
+        """Callers in imported modules see the warning by default."""
+
+        root = os.path.dirname(os.path.dirname(sys.modules["namedzip"].__file__))
+        (tmp_path / "caller.py").write_text(
+            "from namedzip import namedzip\n"
+            "\n"
+            "def zip_pairs():\n"
+            "    return namedzip(typename='Pair', field_names='a b')\n"
+        )
+        (tmp_path / "main.py").write_text(
+            "import sys\n"
+            "sys.path[:0] = [{!r}, {!r}]\n"
+            "import caller\n"
+            "caller.zip_pairs()\n"
+            "caller.zip_pairs()\n".format(root, str(tmp_path))
+        )
+        result = subprocess.run(
+            [sys.executable, "-E", str(tmp_path / "main.py")],
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        assert result.returncode == 0
+        assert result.stderr.count("FutureWarning") == 1
+        assert "caller.py:4" in result.stderr
+
+    def test_deprecated_api_dispatch(self):
+        """Deprecated calls are dispatched to the v1 implementations."""
+
+        with pytest.warns(FutureWarning):
+            pairs = namedzip("AB", [1, 2], typename="Pair", field_names="a b")
+        assert list(pairs) == [("A", 1), ("B", 2)]
+        with pytest.warns(FutureWarning):
+            pairs = namedzip_longest(
+                "AB", [1], typename="Pair", field_names="a b", fillvalue=0
+            )
+        assert list(pairs) == [("A", 1), ("B", 0)]
+
+    @pytest.mark.parametrize("func", [namedzip, namedzip_longest])
+    @pytest.mark.parametrize(
+        "option",
+        [
+            {"prefetch": 2},
+            {"executor": object()},
+            {"stats": True},
+            {"columns": ["a", "b"]},
+            {"converters": {"a": str}},
+            {"where": {"a": bool}},
+            {"checkpoint": True},
+        ],
+    )
+    def test_deprecated_api_options(self, func, option):
+        """TypeError for options the deprecated api does not support."""
+
+        with pytest.raises(TypeError):
+            func("AB", [1, 2], typename="Pair", field_names="a b", **option)
+
+    @pytest.mark.parametrize("func", [namedzip, namedzip_longest])
+    def test_unexpected_keyword_argument(self, pair_named_tuple, func):
+        """TypeError for keyword arguments of neither api."""
+
+        with pytest.raises(TypeError):
+            func(pair_named_tuple, "AB", [1, 2], field_name="letter")
+
+    @pytest.mark.parametrize("func", [namedzip, namedzip_longest])
+    def test_missing_named_tuple(self, func):
+        """TypeError when called without any arguments."""
+
+        with pytest.raises(TypeError):
+            func()
 
 
 class TestNamedzipV1Smoke:
@@ -283,12 +711,12 @@ class TestNamedzipV1Integration:
     """Collection for `namedzip.namedzip._namedzip_v1`."""
 
     def test_namedzip_v1_generator_type(self, two_iterables):
-        """Returns a generator when called with iterables."""
+        """Returns an iterator when called with iterables."""
 
         pairs = _namedzip_v1(
             *two_iterables, typename="Pair", field_names=["letter", "number"]
         )
-        assert isinstance(pairs, types.GeneratorType)
+        assert isinstance(pairs, Iterator)
 
     def test_namedzip_v1_factory_type(self):
         """`Returns a function when called without iterables."""
@@ -367,12 +795,12 @@ class TestNamedziplongestV1Integration:
     """Collection for `namedzip.namedzip._namedzip_longest_v1`."""
 
     def test_namedzip_longest_v1_generator_type(self, two_iterables):
-        """Returns a generator when called with positional args."""
+        """Returns an iterator when called with positional args."""
 
         pairs = _namedzip_longest_v1(
             *two_iterables, typename="Pair", field_names=["letter", "number"]
         )
-        assert isinstance(pairs, types.GeneratorType)
+        assert isinstance(pairs, Iterator)
 
     def test_namedzip_longest_v1_factory_type(self):
         """Returns a function when called without positional args."""
@@ -512,6 +940,62 @@ class TestNamedziplongestV1Integration:
             )
 
 
+class TestGetNamedtupleUnit:
+    """Collection for `namedzip.namedzip._get_namedtuple`."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start every test with an empty class cache."""
+
+        _cached_namedtuple.cache_clear()
+        yield
+        _cached_namedtuple.cache_clear()
+
+    def test__get_namedtuple_reuses_class(self):
+        """Equal arguments return the same class."""
+
+        first = _get_namedtuple("Pair", ["letter", "number"])
+        second = _get_namedtuple("Pair", ("letter", "number"))
+        assert first is second
+        assert first._fields == ("letter", "number")
+        info = _cached_namedtuple.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test__get_namedtuple_keyword_arguments(self):
+        """Keyword arguments are part of the cache key."""
+
+        plain = _get_namedtuple("Pair", "letter number")
+        renamed = _get_namedtuple("Pair", "letter number", rename=True)
+        assert plain is not renamed
+        assert renamed is _get_namedtuple("Pair", "letter number", rename=True)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="Requires Python 3.7 or higher"
+    )
+    def test__get_namedtuple_unhashable_arguments(self):
+        """Unhashable keyword arguments bypass the cache."""
+
+        named_tuple = _get_namedtuple("Pair", "letter number", defaults=[1])
+        assert named_tuple("A") == ("A", 1)
+        assert _cached_namedtuple.cache_info().currsize == 0
+
+    def test__get_namedtuple_cache_clear(self):
+        """Clearing the cache creates new classes."""
+
+        first = _get_namedtuple("Pair", "letter number")
+        _cached_namedtuple.cache_clear()
+        assert _get_namedtuple("Pair", "letter number") is not first
+
+    def test__namedzip_v1_reuses_class(self):
+        """Repeated calls of the deprecated api reuse one class."""
+
+        first = next(_namedzip_v1("A", [1], typename="Pair", field_names="a b"))
+        second = next(
+            _namedzip_longest_v1("B", [2], typename="Pair", field_names="a b")
+        )
+        assert type(first) is type(second)
+
+
 class TestCompareIterablesToFieldsUnit:
     """Collection; `namedzip.namedzip._compare_iterables_to_fields`."""
 
@@ -530,6 +1014,108 @@ class TestCompareIterablesToFieldsUnit:
             _compare_iterables_to_fields(1, 0)
 
 
+class TestBindColumnsUnit:
+    """Collection for `namedzip.namedzip._bind_columns`."""
+
+    def test__bind_columns_none(self):
+        """Iterables are returned unchanged without columns."""
+
+        assert _bind_columns(None, ("A", "B"), ("x", "y")) == (("A", "B"), None)
+
+    def test__bind_columns_mapping(self):
+        """Mapping values become the iterables."""
+
+        iterables, order = _bind_columns({"y": "B", "z": "C", "x": "A"}, (), ("x", "y"))
+        assert iterables == ("B", "C", "A")
+        assert order == ((2, 0), 3)
+
+    def test__bind_columns_names(self):
+        """Names resolve the order without iterables."""
+
+        assert _bind_columns(["y", "x"], (), ("x", "y")) == ((), ((1, 0), 2))
+
+    def test__bind_columns_duplicates(self):
+        """Raises ValueError for duplicate names."""
+
+        with pytest.raises(ValueError):
+            _bind_columns(["x", "x", "y"], (), ("x", "y"))
+
+
+class TestOrderIterablesUnit:
+    """Collection for `namedzip.namedzip._order_iterables`."""
+
+    def test__order_iterables(self):
+        """Selects the iterables of the fields in field order."""
+
+        assert _order_iterables(("B", "C", "A"), ((2, 0), 3)) == ("A", "B")
+
+    def test__order_iterables_count(self):
+        """Raises ValueError for a wrong number of iterables."""
+
+        with pytest.raises(ValueError):
+            _order_iterables(("A", "B"), ((1, 0), 3))
+
+
+class TestIndexFieldsUnit:
+    """Collection for `namedzip.namedzip._index_fields`."""
+
+    def test__index_fields(self):
+        """Functions are paired with field indices in field order."""
+
+        functions = _index_fields({"z": float, "x": int}, ("x", "y", "z"))
+        assert functions == ((0, int), (2, float))
+
+    @pytest.mark.parametrize("functions", [None, {}])
+    def test__index_fields_empty(self, functions):
+        """No functions resolve to an empty tuple."""
+
+        assert _index_fields(functions, ("x",)) == ()
+
+    def test__index_fields_unknown(self):
+        """Raises ValueError for names which are not field names."""
+
+        with pytest.raises(ValueError):
+            _index_fields({"w": int}, ("x", "y"))
+
+
+class TestConvertIterablesUnit:
+    """Collection for `namedzip.namedzip._convert_iterables`."""
+
+    def test__convert_iterables(self):
+        """Only iterables with converters are mapped."""
+
+        letters = "AB"
+        iterables = _convert_iterables((letters, "12"), ((1, int),))
+        assert iterables[0] is letters
+        assert list(iterables[1]) == [1, 2]
+
+
+class TestFilterRowsUnit:
+    """Collection for `namedzip.namedzip._filter_rows`."""
+
+    def test__filter_rows(self, pair_named_tuple):
+        """Builds named tuples of the selected rows."""
+
+        rows = _filter_rows(
+            pair_named_tuple,
+            (None, False, None),
+            (iter("ABC"), iter([1, 2, 3])),
+            ((1, lambda n: n != 2),),
+        )
+        assert list(rows) == [("A", 1), ("C", 3)]
+
+    def test__filter_rows_longest(self, pair_named_tuple):
+        """Pads the iterators with the fill value."""
+
+        rows = _filter_rows(
+            pair_named_tuple,
+            ("#", True, None),
+            (iter("ABC"), iter([1])),
+            ((1, lambda n: n == "#"),),
+        )
+        assert list(rows) == [("B", "#"), ("C", "#")]
+
+
 class TestCreateZipUnit:
     """Collection for `namedzip.namedzip._create_zip`."""
 
@@ -560,6 +1146,15 @@ class TestCreateZipUnit:
             pairs = z
         assert pairs[-1] is None
 
+    def test__create_zip_individual_defaults(self):
+        "Individual `defaults` replace missing values per iterable."
+
+        iterables = (("A", "B", "C"), (1, 2))
+        zipped = _create_zip(
+            *iterables, fillvalue=99, type_longest=True, defaults=("X", 0)
+        )
+        assert list(zipped) == [("A", 1), ("B", 2), ("C", 0)]
+
     def test__create_zip_custom_fillvalue(self):
         "Custom `fillvalue` should replace missing value."
 
@@ -570,26 +1165,372 @@ class TestCreateZipUnit:
         assert pairs[-1] == 99
 
 
-class TestNamedzipGeneratorUnit:
-    """Collection for `namedzip.namedzip._namedzip_generator`."""
+class TestFillIteratorsUnit:
+    """Collection for `namedzip.namedzip._fill_iterators`."""
+
+    @pytest.mark.parametrize(
+        "iterables",
+        [
+            ((), (), ()),
+            ((1, 2, 3), (4, 5, 6), (7, 8, 9)),
+            ((1,), (4, 5, 6), (7, 8)),
+            ((1, 2, 3), (), (7,)),
+            ((), (), (7, 8, 9)),
+            ((1, 2, 3), (4,), ()),
+        ],
+    )
+    def test__fill_iterators_matches_zip_longest(self, iterables):
+        """Zipped fill iterators equal `zip_longest` with replacement."""
+
+        defaults = ("X", 99, "#")
+        expected = [
+            tuple(d if v is sentinel else v for v, d in zip(vals, defaults))
+            for vals in zip_longest(*iterables, fillvalue=sentinel)
+        ]
+        assert list(zip(*_fill_iterators(iterables, defaults))) == expected
+
+    def test__fill_iterators_consumes_iterators(self):
+        """Works with one-shot iterators as well as sequences."""
+
+        iterables = (iter("AB"), iter([1, 2, 3]))
+        zipped = zip(*_fill_iterators(iterables, ("X", 99)))
+        assert list(zipped) == [("A", 1), ("B", 2), ("X", 3)]
+        assert list(zipped) == []
+
+
+class TestZipBuilderUnit:
+    """Collection for `namedzip.namedzip._zip_builder`."""
+
+    @pytest.mark.parametrize(
+        "iterables", [((), ()), ("ABC", [1, 2, 3]), ("AB", [1, 2, 3]), ("ABC", [1])]
+    )
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"type_longest": True},
+            {"type_longest": True, "fillvalue": 0},
+            {"type_longest": True, "defaults": ("X", 99)},
+        ],
+    )
+    def test__zip_builder_matches_zip(self, iterables, kwargs):
+        """Rows equal `zip` or `zip_longest` with replacement."""
+
+        named_tuple = namedtuple("Pair", ["letter", "number"])
+        defaults = kwargs.get("defaults") or (kwargs.get("fillvalue"),) * 2
+        if kwargs.get("type_longest"):
+            expected = [
+                tuple(d if v is sentinel else v for v, d in zip(vals, defaults))
+                for vals in zip_longest(*iterables, fillvalue=sentinel)
+            ]
+        else:
+            expected = list(zip(*iterables))
+        rows = list(_zip_builder(named_tuple, **kwargs)(*iterables))
+        assert rows == expected
+        assert all(type(row) is named_tuple for row in rows)
+
+    def test__zip_builder_custom_new(self):
+        """Custom `__new__` is called for every row."""
 
-    def test__namedzip_generator_return_type(self):
-        """Should return a generator object."""
+        class Pair(namedtuple("Pair", ["letter", "number"])):
+            def __new__(cls, letter, number):
+                return super().__new__(cls, letter.lower(), number * 10)
+
+        rows = list(_zip_builder(Pair, type_longest=True)("AB", [1, 2]))
+        assert rows == [("a", 10), ("b", 20)]
+        assert all(type(row) is Pair for row in rows)
+
+    def test__zip_builder_propagates_errors(self):
+        """Exceptions raised by an iterable are not swallowed."""
+
+        def failing():
+            yield 1
+            raise KeyError("failing")
 
-        zipped = zip(("A", "B", "C"), (1, 2, 3))
         named_tuple = namedtuple("Pair", ["letter", "number"])
-        nz_generator = _namedzip_generator(zipped, named_tuple)
-        assert isinstance(nz_generator, types.GeneratorType)
+        rows = _zip_builder(named_tuple, type_longest=True)("ABC", failing())
+        assert next(rows) == ("A", 1)
+        with pytest.raises(KeyError):
+            next(rows)
+
+    def test__zip_builder_non_iterable_arg(self):
+        """TypeError is raised for non-iterable objects."""
+
+        named_tuple = namedtuple("Pair", ["letter", "number"])
+        with pytest.raises(TypeError):
+            list(_zip_builder(named_tuple)("A", 1))
+
+
+class TestNamedZipIteratorUnit:
+    """Collection for `namedzip.namedzip.NamedZipIterator`."""
 
-    def test__namedzip_generator_yields_named_tuple(self):
-        """Returned object should yield named tuples."""
+    def test_namedzip_iterator_length_hint(self, pair_named_tuple):
+        """Hints the smallest remaining length of the iterables."""
+
+        pairs = namedzip(pair_named_tuple, "ABCD", iter([1, 2, 3]))
+        assert type(pairs) is NamedZipIterator
+        assert length_hint(pairs) == 3
+        next(pairs)
+        assert length_hint(pairs) == 2
+        with pytest.raises(TypeError):
+            len(pairs)
+
+    def test_namedzip_longest_iterator_length_hint(self, pair_named_tuple):
+        """Hints the largest remaining length of the iterables."""
+
+        pairs = namedzip_longest(pair_named_tuple, "ABCD", iter([1, 2]))
+        assert length_hint(pairs) == 4
+        assert len(list(pairs)) == 4
+        assert length_hint(pairs) == 0
+
+    def test_namedzip_iterator_no_length_hint(self, pair_named_tuple):
+        """Hints 0 if an iterable does not report its length."""
+
+        pairs = namedzip(pair_named_tuple, "ABCD", (i for i in range(4)))
+        assert length_hint(pairs, -1) == 0
+
+    @pytest.mark.parametrize("longest", [False, True])
+    def test_namedzip_iterator_len(self, pair_named_tuple, longest):
+        """Zipped sequences support `len` of the remaining rows."""
+
+        func = namedzip_longest if longest else namedzip
+        pairs = func(pair_named_tuple, "ABC", range(2))
+        assert type(pairs) is SizedNamedZipIterator
+        assert len(pairs) == (3 if longest else 2)
+        next(pairs)
+        assert len(pairs) == (2 if longest else 1)
+
+    def test_namedzip_iterator_len_exhausted(self, pair_named_tuple):
+        """Exhausted sized iterators have length 0 and remain true."""
+
+        pairs = namedzip(pair_named_tuple, "AB", [1, 2])
+        assert len(list(pairs)) == 2
+        assert len(pairs) == 0
+        assert length_hint(pairs) == 0
+        assert pairs
+
+    def test_namedzip_iterator_no_fields(self):
+        """Zipping no iterables produces no rows and does not raise."""
+
+        Empty = namedtuple("Empty", [])
+        rows = namedzip(Empty)()
+        assert length_hint(rows) == 0
+        assert list(rows) == []
+
+    def test_namedzip_iterator_getitem(self, pair_named_tuple):
+        """Indexing reads the remaining rows from the sequences."""
+
+        pairs = namedzip(pair_named_tuple, "ABCD", range(3))
+        assert pairs[2] == ("C", 2)
+        assert type(pairs[2]) is pair_named_tuple
+        assert pairs[-3] == ("A", 0)
+        next(pairs)
+        assert pairs[0] == ("B", 1)
+        assert pairs[-1] == ("C", 2)
+        with pytest.raises(IndexError):
+            pairs[2]
+        assert next(pairs) == ("B", 1)
+
+    @pytest.mark.parametrize(
+        "index", [slice(None), slice(1, 4), slice(None, None, -2), slice(5, None)]
+    )
+    @pytest.mark.parametrize("consumed", [0, 2])
+    def test_namedzip_longest_iterator_slicing(self, pair_named_tuple, index, consumed):
+        """Slices of the remaining rows are views padded with defaults."""
+
+        def zip_pairs():
+            return namedzip_longest(
+                pair_named_tuple, "ABCDE", [1, 2, 3], defaults=["X", 99]
+            )
+
+        pairs = zip_pairs()
+        for _ in range(consumed):
+            next(pairs)
+        expected = list(zip_pairs())[consumed:][index]
+        assert list(pairs[index]) == expected
+        assert [pairs[i] for i in range(len(pairs))][index] == expected
+
+    def test_namedzip_iterator_getitem_unsized(self, pair_named_tuple):
+        """Iterators of other iterables do not support indexing."""
+
+        pairs = namedzip(pair_named_tuple, "ABCD", iter([1, 2, 3]))
+        with pytest.raises(TypeError):
+            pairs[0]
+
+    def test_namedzip_iterator_mapping(self, pair_named_tuple):
+        """Mappings are zipped by key and are not indexed like sequences."""
+
+        pairs = namedzip(pair_named_tuple, {"x": 1, "y": 2, "z": 3}, [10, 20, 30])
+        assert type(pairs) is NamedZipIterator
+        with pytest.raises(TypeError):
+            pairs[0]
+        assert list(pairs) == [("x", 10), ("y", 20), ("z", 30)]
+
+    def test_namedzip_iterator_iter(self, pair_named_tuple):
+        """Iteration uses the wrapped iterator and shares its position."""
+
+        pairs = namedzip(pair_named_tuple, "ABC", [1, 2, 3])
+        assert next(pairs) == ("A", 1)
+        rows = iter(pairs)
+        assert rows is not pairs
+        assert next(rows) == ("B", 2)
+        assert list(pairs) == [("C", 3)]
+        with pytest.raises(StopIteration):
+            next(pairs)
+
+
+# Named tuple classes must be defined at module level to be pickled.
+Checkpoint = namedtuple("Checkpoint", ["letter", "number"])
+
+
+class TestNamedZipIteratorPickling:
+    """Collection for checkpointing `namedzip.namedzip.NamedZipIterator`."""
+
+    @pytest.mark.parametrize(
+        "iterables",
+        [
+            lambda: ("ABCDE", [1, 2, 3]),
+            lambda: ("ABCDE", iter([1, 2, 3])),
+            lambda: (b"ABCDE", range(3)),
+        ],
+    )
+    @pytest.mark.parametrize("longest", [False, True])
+    def test_pickle_resumes(self, iterables, longest):
+        """Unpickled iterators continue after the consumed rows."""
+
+        def zip_pairs():
+            if longest:
+                return namedzip_longest(Checkpoint, *iterables(), defaults=[0, 9])
+            return namedzip(Checkpoint, *iterables())
+
+        expected = list(zip_pairs())
+        pairs = zip_pairs()
+        assert pairs.offset == 0
+        next(pairs)
+        next(pairs)
+        assert pairs.offset == 2
+        restored = pickle.loads(pickle.dumps(pairs))
+        assert type(restored) is type(pairs)
+        assert restored.offset == 2
+        assert list(restored) == expected[2:]
+        assert list(pairs) == expected[2:]
+        assert pairs.offset == len(expected)
+
+    def test_pickle_files(self, tmp_path):
+        """Files are reopened and restored at their position."""
+
+        for name, text in [("letters", "A\nB\nC\n"), ("numbers", "1\n2\n")]:
+            (tmp_path / name).write_text(text)
+        with open(str(tmp_path / "letters")) as letters, open(
+            str(tmp_path / "numbers"), "rb"
+        ) as numbers:
+            pairs = namedzip_longest(Checkpoint, letters, numbers, checkpoint=True)
+            assert next(pairs) == ("A\n", b"1\n")
+            state = pickle.dumps(pairs)
+            assert list(pairs) == [("B\n", b"2\n"), ("C\n", None)]
+        restored = pickle.loads(state)
+        assert list(restored) == [("B\n", b"2\n"), ("C\n", None)]
+        assert restored.offset == 3
+        for source in restored._sources:
+            source.close()
+
+    def test_pickle_files_without_checkpoint(self, tmp_path):
+        """Files are iterated over unless checkpointing is requested."""
+
+        (tmp_path / "letters").write_text("A\nB\n")
+        with open(str(tmp_path / "letters")) as letters:
+            pairs = namedzip(Checkpoint, letters, [1, 2])
+            assert pairs._iterators[0] is letters
+            next(pairs)
+            with pytest.raises(TypeError):
+                pickle.dumps(pairs)
+        with open(str(tmp_path / "letters"), "rb") as letters:
+            pairs = namedzip(Checkpoint, letters, [1, 2])
+            next(pairs)
+            restored = pickle.loads(pickle.dumps(pairs))
+        assert list(restored) == [(b"B\n", 2)]
+        restored._sources[0].close()
+
+    @pytest.mark.parametrize("checkpoint", [False, True])
+    @pytest.mark.parametrize(
+        "stream, lines", [(io.StringIO, ["A\n", "B\n"]), (io.BytesIO, [b"A\n", b"B\n"])]
+    )
+    def test_pickle_in_memory_streams(self, stream, lines, checkpoint):
+        """In-memory streams have no name, and are pickled as iterators."""
+
+        pairs = namedzip(
+            Checkpoint, stream(lines[0] + lines[1]), [1, 2], checkpoint=checkpoint
+        )
+        next(pairs)
+        restored = pickle.loads(pickle.dumps(pairs))
+        assert list(restored) == [(lines[1], 2)]
+        assert list(pairs) == [(lines[1], 2)]
+
+    def test_pickle_generator(self):
+        """Iterators of generators cannot be pickled."""
+
+        pairs = namedzip(Checkpoint, "AB", (i for i in range(2)))
+        with pytest.raises(TypeError):
+            pickle.dumps(pairs)
+
+    def test_pickle_mapping(self):
+        """Mappings are pickled as their key iterators, not as sequences."""
+
+        pairs = namedzip(Checkpoint, {"A": 1, "B": 2, "C": 3}, [1, 2, 3])
+        next(pairs)
+        restored = pickle.loads(pickle.dumps(pairs))
+        assert list(restored) == [("B", 2), ("C", 3)]
+
+
+class TestRowBuilderUnit:
+    """Collection for `namedzip.namedzip._row_builder`."""
+
+    def test__row_builder_namedtuple_uses_map(self):
+        """Classes from `collections.namedtuple` are built by `map`."""
 
-        zipped = zip(("A", "B", "C"), (1, 2, 3))
         named_tuple = namedtuple("Pair", ["letter", "number"])
-        expected = named_tuple("A", 1)
-        nz_generator = _namedzip_generator(zipped, named_tuple)
-        yielded = next(nz_generator)
-        assert yielded == expected
+        rows = _row_builder(named_tuple)(zip(("A", "B"), (1, 2)))
+        assert isinstance(rows, map)
+        rows = list(rows)
+        assert rows == [named_tuple("A", 1), named_tuple("B", 2)]
+        assert all(type(row) is named_tuple for row in rows)
+
+    def test__row_builder_subclass_without_constructor(self):
+        """Subclasses that only add methods keep the `map` fast path."""
+
+        class Pair(namedtuple("Pair", ["letter", "number"])):
+            def label(self):
+                return "{}{}".format(self.letter, self.number)
+
+        rows = _row_builder(Pair)(zip(("A",), (1,)))
+        assert isinstance(rows, map)
+        row = next(rows)
+        assert type(row) is Pair
+        assert row.label() == "A1"
+
+    def test__row_builder_custom_new(self):
+        """Custom `__new__` is called for every row."""
+
+        class Pair(namedtuple("Pair", ["letter", "number"])):
+            def __new__(cls, letter, number):
+                return super().__new__(cls, letter.lower(), number * 10)
+
+        rows = list(_row_builder(Pair)(zip(("A", "B"), (1, 2))))
+        assert rows == [("a", 10), ("b", 20)]
+        assert all(type(row) is Pair for row in rows)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 6), reason="Requires Python 3.6 or higher"
+    )
+    def test__row_builder_typing_namedtuple(self):
+        """Subclasses of `typing.NamedTuple` use the `map` fast path."""
+
+        from typing import NamedTuple
+
+        named_tuple = NamedTuple("Pair", [("letter", str), ("number", int)])
+        rows = _row_builder(named_tuple)(zip(("A",), (1,)))
+        assert isinstance(rows, map)
+        assert next(rows) == named_tuple("A", 1)
 
 
 class TestVerifyNamedTuple:
@@ -623,6 +1564,60 @@ class TestVerifyNamedTuple:
             _verify_named_tuple(invalid_object)
 
 
+class TestNamedTupleInfoUnit:
+    """Collection for `namedzip.namedzip._named_tuple_info`."""
+
+    def test__named_tuple_info_fields(self):
+        """Metadata describes the named tuple class."""
+
+        named_tuple = namedtuple("Group", ["letter", "number", "symbol"])
+        info = _named_tuple_info(named_tuple)
+        assert info.fields == ("letter", "number", "symbol")
+        assert info.field_count == 3
+        assert info.uses_tuple_new is True
+        assert info.defaults is None
+        assert info.missing_defaults == ()
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="Requires Python 3.7 or higher"
+    )
+    def test__named_tuple_info_defaults(self):
+        """Defaults specified in the class are resolved once."""
+
+        named_tuple = namedtuple(
+            "Group", ["letter", "number", "symbol"], defaults=(99, "#")
+        )
+        info = _named_tuple_info(named_tuple)
+        assert info.defaults == (None, 99, "#")
+        assert info.missing_defaults == (0,)
+
+    def test__named_tuple_info_cached(self):
+        """Repeated calls return the cached metadata."""
+
+        named_tuple = namedtuple("Pair", ["letter", "number"])
+        assert _named_tuple_info(named_tuple) is _named_tuple_info(named_tuple)
+        assert named_tuple in _named_tuple_infos
+
+    def test__named_tuple_info_weak_reference(self):
+        """Cached metadata does not keep the class alive."""
+
+        named_tuple = namedtuple("Pair", ["letter", "number"])
+        _named_tuple_info(named_tuple)
+        class_ref = weakref.ref(named_tuple)
+        del named_tuple
+        gc.collect()
+        assert class_ref() is None
+
+    @pytest.mark.parametrize("invalid_object", [dict(), int(), list(), tuple])
+    def test__named_tuple_info_invalid(self, invalid_object):
+        """Invalid objects raise TypeError and are not cached."""
+
+        count = len(_named_tuple_infos)
+        with pytest.raises(TypeError):
+            _named_tuple_info(invalid_object)
+        assert len(_named_tuple_infos) == count
+
+
 class TestSetDefaultsUnit:
     """Collection for `namedzip.namedzip._set_defaults`."""
 
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip.parallel module.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import types
+
+import pytest
+
+from namedzip import namedzip_map
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+class DoubledPoint(Point):
+    """Named tuple with a custom constructor."""
+
+    __slots__ = ()
+
+    def __new__(cls, x, y):
+        return super().__new__(cls, x * 2, y)
+
+
+def describe(point):
+    """Return the type name and values of `point`."""
+
+    return type(point).__name__, point.x, point.y
+
+
+def invert(point):
+    """Return the inverse of `point.x`."""
+
+    return 1 / point.x
+
+
+@pytest.fixture(scope="module")
+def executor():
+    """Test fixture to provide a thread pool shared by the tests."""
+
+    with ThreadPoolExecutor(4) as executor:
+        yield executor
+
+
+class TestNamedzipMap:
+    """Collection for `namedzip.parallel.namedzip_map`."""
+
+    def test_namedzip_map_processes(self):
+        """Results are computed in worker processes, in order."""
+
+        results = namedzip_map(describe, Point, range(10), "ABCDEFGHIJKL", workers=2)
+        expected = [("Point", i, letter) for i, letter in zip(range(10), "ABCDEFGHIJ")]
+        assert list(results) == expected
+
+    @pytest.mark.parametrize("chunksize", [1, 3, 100])
+    def test_namedzip_map_ordered(self, executor, chunksize):
+        """Results are yielded in the order of the rows."""
+
+        results = namedzip_map(
+            describe,
+            Point,
+            range(50),
+            range(50),
+            chunksize=chunksize,
+            executor=executor,
+        )
+        assert list(results) == [("Point", i, i) for i in range(50)]
+
+    def test_namedzip_map_unordered(self, executor):
+        """All results are yielded when order is not preserved."""
+
+        results = namedzip_map(
+            describe,
+            Point,
+            range(50),
+            range(50),
+            chunksize=3,
+            ordered=False,
+            executor=executor,
+        )
+        assert sorted(results) == [("Point", i, i) for i in range(50)]
+
+    def test_namedzip_map_longest(self, executor):
+        """Rows are padded like `namedzip_longest` if `longest` is True."""
+
+        results = namedzip_map(
+            describe,
+            Point,
+            [1, 2, 3],
+            "A",
+            longest=True,
+            defaults=[0, "X"],
+            executor=executor,
+        )
+        assert list(results) == [
+            ("Point", 1, "A"),
+            ("Point", 2, "X"),
+            ("Point", 3, "X"),
+        ]
+
+    def test_namedzip_map_custom_new(self, executor):
+        """Rows of classes with a custom constructor are built with it."""
+
+        results = namedzip_map(describe, DoubledPoint, [1, 2], "AB", executor=executor)
+        assert list(results) == [("DoubledPoint", 2, "A"), ("DoubledPoint", 4, "B")]
+
+    def test_namedzip_map_error(self, executor):
+        """Exceptions raised by `func` are propagated."""
+
+        results = namedzip_map(
+            invert, Point, [1, 0], "AB", chunksize=1, executor=executor
+        )
+        assert next(results) == 1
+        with pytest.raises(ZeroDivisionError):
+            next(results)
+
+    def test_namedzip_map_factory(self, executor):
+        """Returns a function when called without iterables."""
+
+        map_points = namedzip_map(invert, Point, executor=executor)
+        assert isinstance(map_points, types.FunctionType)
+        assert list(map_points([1, 2], "AB")) == [1, 0.5]
+
+    def test_namedzip_map_empty(self, executor):
+        """No results for empty iterables."""
+
+        assert list(namedzip_map(describe, Point, [], [], executor=executor)) == []
+
+    @pytest.mark.parametrize("options", [{"chunksize": 0}, {"workers": 0}])
+    def test_namedzip_map_invalid(self, options):
+        """Raises ValueError for chunksize or workers less than one."""
+
+        with pytest.raises(ValueError):
+            namedzip_map(describe, Point, **options)
+
+    def test_namedzip_map_iterables_fieldnames_mismatch(self, executor):
+        """Raises ValueError for non-equal number of iterables and fields."""
+
+        with pytest.raises(ValueError):
+            namedzip_map(describe, Point, [1, 2], executor=executor)
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip.prefetch module.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import gc
+from itertools import count
+import threading
+
+import pytest
+
+from namedzip import namedzip, namedzip_longest
+from namedzip.prefetch import _PrefetchIterator, _prefetch_iterables
+
+
+@pytest.fixture()
+def pair_named_tuple():
+    """Test fixture to provide sample named tuple."""
+
+    return namedtuple("Pair", ["letter", "number"])
+
+
+def meet(barrier, values):
+    """Generate `values` after all parties have reached `barrier`."""
+
+    barrier.wait()
+    yield from values
+
+
+def shuts_down(executor, timeout=5):
+    """Return True if `executor` shuts down, waiting for its tasks, in
+    `timeout` seconds."""
+
+    thread = threading.Thread(target=executor.shutdown, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+class TestPrefetchIterator:
+    """Collection for `namedzip.prefetch._PrefetchIterator`."""
+
+    def test_prefetch_iterator_values(self):
+        """Yields the values of the iterable in order."""
+
+        assert list(_PrefetchIterator(range(100), 3)) == list(range(100))
+
+    def test_prefetch_iterator_stays_exhausted(self):
+        """Raises StopIteration after the iterable is exhausted."""
+
+        iterator = _PrefetchIterator("A", 1)
+        assert list(iterator) == ["A"]
+        with pytest.raises(StopIteration):
+            next(iterator)
+
+    def test_prefetch_iterator_error(self):
+        """Exceptions are raised after the values read before them."""
+
+        def failing():
+            yield 1
+            raise KeyError("failing")
+
+        iterator = _PrefetchIterator(failing(), 2)
+        assert next(iterator) == 1
+        with pytest.raises(KeyError):
+            next(iterator)
+        with pytest.raises(StopIteration):
+            next(iterator)
+
+    def test_prefetch_iterator_non_iterable(self):
+        """Raises TypeError in the calling thread for non-iterables."""
+
+        with pytest.raises(TypeError):
+            _PrefetchIterator(1, 1)
+
+    @pytest.mark.parametrize("release", ["close", "del"])
+    def test_prefetch_iterator_stops(self, release):
+        """The background thread stops when the consumer stops early."""
+
+        closed = threading.Event()
+
+        def endless():
+            try:
+                while True:
+                    yield 1
+            finally:
+                closed.set()
+
+        iterator = _PrefetchIterator(endless(), 1)
+        assert next(iterator) == 1
+        if release == "close":
+            iterator.close()
+        else:
+            del iterator
+            gc.collect()
+        assert closed.wait(timeout=5)
+
+    def test_prefetch_iterables_overlap(self):
+        """Iterables are read concurrently."""
+
+        barrier = threading.Barrier(2, timeout=5)
+        iterators = _prefetch_iterables([meet(barrier, "AB"), meet(barrier, [1, 2])], 1)
+        assert list(zip(*iterators)) == [("A", 1), ("B", 2)]
+
+    def test_prefetch_iterables_executor(self):
+        """Background tasks run in the supplied executor."""
+
+        barrier = threading.Barrier(2, timeout=5)
+        with ThreadPoolExecutor(2) as executor:
+            iterators = _prefetch_iterables(
+                [meet(barrier, "AB"), meet(barrier, [1, 2])], 1, executor
+            )
+            assert list(zip(*iterators)) == [("A", 1), ("B", 2)]
+
+
+class TestNamedzipPrefetch:
+    """Collection for the `prefetch` parameter of the public interfaces."""
+
+    def test_namedzip_prefetch(self, pair_named_tuple):
+        """Rows are the same as without prefetching."""
+
+        pairs = namedzip(pair_named_tuple, "ABCD", range(3), prefetch=2)
+        assert list(pairs) == [("A", 0), ("B", 1), ("C", 2)]
+
+    def test_namedzip_prefetch_overlap(self, pair_named_tuple):
+        """Slow iterables are read concurrently."""
+
+        barrier = threading.Barrier(2, timeout=5)
+        zip_pairs = namedzip(pair_named_tuple, prefetch=1)
+        pairs = zip_pairs(meet(barrier, "AB"), meet(barrier, [1, 2]))
+        assert list(pairs) == [("A", 1), ("B", 2)]
+
+    def test_namedzip_prefetch_error(self, pair_named_tuple):
+        """Exceptions raised by an iterable are propagated."""
+
+        def failing():
+            yield 1
+            raise KeyError("failing")
+
+        pairs = namedzip(pair_named_tuple, "ABC", failing(), prefetch=4)
+        assert next(pairs) == ("A", 1)
+        with pytest.raises(KeyError):
+            next(pairs)
+
+    def test_namedzip_longest_prefetch(self, pair_named_tuple):
+        """Exhausted iterables are padded with their defaults."""
+
+        with ThreadPoolExecutor(2) as executor:
+            pairs = namedzip_longest(
+                pair_named_tuple,
+                "ABC",
+                [1],
+                defaults=["X", 99],
+                prefetch=1,
+                executor=executor,
+            )
+            assert list(pairs) == [("A", 1), ("B", 99), ("C", 99)]
+
+    def test_namedzip_prefetch_unequal_lengths(self, pair_named_tuple):
+        """Longer iterables stop prefetching when the zip ends."""
+
+        executor = ThreadPoolExecutor(2)
+        pairs = namedzip(
+            pair_named_tuple, range(3), count(), prefetch=2, executor=executor
+        )
+        assert len(list(pairs)) == 3
+        assert shuts_down(executor)
+        assert next(pairs, None) is None
+
+    @pytest.mark.parametrize("func", [namedzip, namedzip_longest])
+    def test_namedzip_prefetch_close(self, pair_named_tuple, func):
+        """Closing the iterator stops prefetching, and ends the rows."""
+
+        executor = ThreadPoolExecutor(2)
+        with func(
+            pair_named_tuple, count(), count(), prefetch=2, executor=executor
+        ) as pairs:
+            for pair in pairs:
+                break
+        assert shuts_down(executor)
+        assert next(pairs, None) is None
+
+    @pytest.mark.parametrize("func", [namedzip, namedzip_longest])
+    def test_prefetch_invalid(self, pair_named_tuple, func):
+        """Raises ValueError for invalid prefetch arguments."""
+
+        with pytest.raises(ValueError):
+            func(pair_named_tuple, prefetch=-1)
+        with ThreadPoolExecutor(1) as executor:
+            with pytest.raises(ValueError):
+                func(pair_named_tuple, executor=executor)
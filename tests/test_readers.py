@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip.readers module.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from array import array
+from collections import namedtuple
+from collections.abc import Sequence
+import io
+import mmap
+import pickle
+
+import pytest
+
+from namedzip import (
+    MappedColumn,
+    NamedZipView,
+    namedzip,
+    namedzip_csv,
+    namedzip_longest,
+)
+
+
+# Named tuple classes must be defined at module level to be pickled.
+Point = namedtuple("Point", ["x", "y"])
+
+
+@pytest.fixture()
+def point_named_tuple():
+    """Test fixture to provide sample named tuple."""
+
+    return namedtuple("Point", ["x", "y"])
+
+
+@pytest.fixture()
+def x_path(tmp_path):
+    """Test fixture to provide a file of three doubles."""
+
+    path = tmp_path / "x.bin"
+    path.write_bytes(array("d", [1.5, 2.5, 3.5]).tobytes())
+    return str(path)
+
+
+@pytest.fixture()
+def y_path(tmp_path):
+    """Test fixture to provide a file of two integers after a header."""
+
+    path = tmp_path / "y.bin"
+    header = b"H" * (mmap.ALLOCATIONGRANULARITY + 8)
+    path.write_bytes(header + array("q", [7, 8]).tobytes())
+    return str(path)
+
+
+@pytest.fixture()
+def y_offset():
+    """Test fixture to provide the offset of the values in `y_path`."""
+
+    return mmap.ALLOCATIONGRANULARITY + 8
+
+
+class TestMappedColumn:
+    """Collection for `namedzip.readers.MappedColumn`."""
+
+    def test_mapped_column_sequence(self, x_path):
+        """Columns are sequences of the values in the file."""
+
+        with MappedColumn(x_path, "d") as xs:
+            assert isinstance(xs, Sequence)
+            assert len(xs) == 3
+            assert list(xs) == [1.5, 2.5, 3.5]
+            assert xs[-1] == 3.5
+            assert xs[1:].tolist() == [2.5, 3.5]
+            with pytest.raises(IndexError):
+                xs[3]
+
+    def test_mapped_column_offset(self, y_path, y_offset):
+        """Values start at `offset`, which need not be page aligned."""
+
+        with MappedColumn(y_path, "q", offset=y_offset) as ys:
+            assert list(ys) == [7, 8]
+        with MappedColumn(y_path, "q", offset=y_offset, length=1) as ys:
+            assert list(ys) == [7]
+
+    def test_mapped_column_empty(self, x_path):
+        """Columns can be empty."""
+
+        with MappedColumn(x_path, "d", offset=24) as xs:
+            assert list(xs) == []
+
+    def test_mapped_column_namedzip(self, point_named_tuple, x_path, y_path, y_offset):
+        """Columns are zipped like lists."""
+
+        with MappedColumn(x_path, "d") as xs, MappedColumn(
+            y_path, "q", offset=y_offset
+        ) as ys:
+            assert list(namedzip(point_named_tuple, xs, ys)) == [(1.5, 7), (2.5, 8)]
+            assert list(NamedZipView(point_named_tuple, xs, ys)[1:]) == [(2.5, 8)]
+
+    def test_mapped_column_namedzip_longest(
+        self, point_named_tuple, x_path, y_path, y_offset
+    ):
+        """Shorter columns are padded with defaults."""
+
+        with MappedColumn(x_path, "d") as xs, MappedColumn(
+            y_path, "q", offset=y_offset
+        ) as ys:
+            points = namedzip_longest(point_named_tuple, xs, ys, defaults=[0.0, -1])
+            assert list(points) == [(1.5, 7), (2.5, 8), (3.5, -1)]
+
+    def test_mapped_column_pickle(self, x_path):
+        """Pickled columns map the file again, also within iterators."""
+
+        with MappedColumn(x_path, "d", offset=8, length=2) as xs:
+            restored = pickle.loads(pickle.dumps(xs))
+            assert list(restored) == [2.5, 3.5]
+            restored.close()
+            points = namedzip(Point, xs, range(2))
+            next(points)
+            restored = pickle.loads(pickle.dumps(points))
+            assert list(restored) == [(3.5, 1)]
+            restored._sources[0].close()
+
+    def test_mapped_column_close(self, x_path):
+        """Closed columns cannot be read."""
+
+        xs = MappedColumn(x_path, "d")
+        assert not xs.closed
+        xs.close()
+        assert xs.closed
+        assert repr(xs) == "MappedColumn({!r}, 'd', rows=closed)".format(x_path)
+        with pytest.raises(ValueError):
+            xs[0]
+
+    def test_mapped_column_repr(self, x_path):
+        """Repr shows the path, the typecode and the number of rows."""
+
+        with MappedColumn(x_path, "d") as xs:
+            assert repr(xs) == "MappedColumn({!r}, 'd', rows=3)".format(x_path)
+
+    @pytest.mark.parametrize(
+        "typecode, offset, length",
+        [("<d", 0, None), ("d", 0, 4), ("d", 8, 3), ("d", -8, None)],
+    )
+    def test_mapped_column_invalid(self, x_path, typecode, offset, length):
+        """Raises ValueError for invalid typecodes and out of range values."""
+
+        with pytest.raises(ValueError):
+            MappedColumn(x_path, typecode, offset=offset, length=length)
+
+
+@pytest.fixture()
+def csv_path(tmp_path):
+    """Test fixture to provide a CSV file with a header record."""
+
+    path = tmp_path / "points.csv"
+    path.write_bytes(b'name,x,y,note\nA,1,2,"a, quoted\nnote"\n\nB,3,,x\nC,5\n')
+    return str(path)
+
+
+class TestNamedzipCsv:
+    """Collection for `namedzip.readers.namedzip_csv`."""
+
+    def test_namedzip_csv_field_names(self, point_named_tuple, csv_path):
+        """Columns default to the header names matching the fields."""
+
+        points = list(namedzip_csv(point_named_tuple, csv_path))
+        assert points == [("1", "2"), ("3", None), ("5", None)]
+        assert all(type(point) is point_named_tuple for point in points)
+
+    def test_namedzip_csv_columns(self, csv_path):
+        """Columns are projected by header name or index."""
+
+        Row = namedtuple("Row", ["note", "label"])
+        rows = namedzip_csv(Row, csv_path, columns=["note", 0], fillvalue="")
+        assert list(rows) == [("a, quoted\nnote", "A"), ("x", "B"), ("", "C")]
+
+    def test_namedzip_csv_defaults(self, point_named_tuple, csv_path):
+        """Empty and missing values are replaced like in `namedzip_longest`."""
+
+        points = namedzip_csv(point_named_tuple, csv_path, defaults=["0", "-1"])
+        assert list(points) == [("1", "2"), ("3", "-1"), ("5", "-1")]
+
+    def test_namedzip_csv_no_header(self, point_named_tuple):
+        """Records are read from file objects without a header."""
+
+        file = io.StringIO("1;2\n3;4\n")
+        points = namedzip_csv(point_named_tuple, file, header=False, delimiter=";")
+        assert list(points) == [("1", "2"), ("3", "4")]
+
+    @pytest.mark.parametrize("block_size", [1, 8, 1 << 16])
+    def test_namedzip_csv_block_size(self, point_named_tuple, csv_path, block_size):
+        """Records spanning blocks are read like any other."""
+
+        points = namedzip_csv(point_named_tuple, csv_path, block_size=block_size)
+        assert len(list(points)) == 3
+
+    def test_namedzip_csv_closes_file(self, point_named_tuple, csv_path):
+        """Files opened from paths are closed when iteration stops."""
+
+        points = namedzip_csv(point_named_tuple, csv_path)
+        next(points)
+        file = points.gi_frame.f_locals["file"]
+        points.close()
+        assert file.closed
+
+    def test_namedzip_csv_empty(self, point_named_tuple):
+        """No rows for empty files."""
+
+        assert list(namedzip_csv(point_named_tuple, io.StringIO(""))) == []
+
+    def test_namedzip_csv_custom_new(self):
+        """Custom `__new__` is called for each row."""
+
+        class Point(namedtuple("Point", ["x", "y"])):
+            def __new__(cls, x, y):
+                return super().__new__(cls, int(x), int(y))
+
+        points = namedzip_csv(Point, io.StringIO("x,y\n1,2\n"))
+        assert list(points) == [(1, 2)]
+
+    @pytest.mark.parametrize("columns", [["x"], ["x", -1]])
+    def test_namedzip_csv_invalid_columns(self, point_named_tuple, columns):
+        """Raises ValueError for invalid columns when called."""
+
+        with pytest.raises(ValueError):
+            namedzip_csv(point_named_tuple, io.StringIO(""), columns=columns)
+
+    @pytest.mark.parametrize("text, header", [("x,z\n1,2\n", True), ("1,2\n", False)])
+    def test_namedzip_csv_unknown_names(self, point_named_tuple, text, header):
+        """Raises ValueError for names not in the header when iterated."""
+
+        points = namedzip_csv(
+            point_named_tuple, io.StringIO(text), columns=["x", "y"], header=header
+        )
+        with pytest.raises(ValueError):
+            next(points)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip.records module.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+import pickle
+import sys
+
+import pytest
+
+from namedzip import NamedZipView, namedrecord, namedzip, namedzip_longest
+
+Point = namedrecord("Point", ["x", "y"])
+
+
+class TestNamedrecord:
+    """Collection for `namedzip.records.namedrecord`."""
+
+    def test_namedrecord_fields(self):
+        """Records store their fields in slots."""
+
+        point = Point(1, y=2)
+        assert (point.x, point.y) == (1, 2)
+        assert Point._fields == ("x", "y")
+        assert Point.__slots__ == ("x", "y")
+        assert not hasattr(point, "__dict__")
+        with pytest.raises(AttributeError):
+            point.z = 3
+
+    def test_namedrecord_mutable(self):
+        """Fields can be reassigned."""
+
+        point = Point(1, 2)
+        point.x += 10
+        assert point == Point(11, 2)
+        assert point != Point(1, 2)
+        with pytest.raises(TypeError):
+            hash(point)
+
+    def test_namedrecord_field_names_string(self):
+        """Field names can be separated by whitespace and commas."""
+
+        record = namedrecord("Record", "a, b c")
+        assert record._fields == ("a", "b", "c")
+
+    def test_namedrecord_defaults(self):
+        """Defaults apply to the rightmost fields."""
+
+        record = namedrecord("Record", ["a", "b", "c"], defaults=[2, 3])
+        assert record._field_defaults == {"b": 2, "c": 3}
+        assert record(1)._astuple() == (1, 2, 3)
+
+    def test_namedrecord_methods(self):
+        """Records provide the helper methods of named tuples."""
+
+        point = Point._make([1, 2])
+        assert point._astuple() == (1, 2)
+        assert point._asdict() == {"x": 1, "y": 2}
+        assert repr(point) == "Point(x=1, y=2)"
+        assert repr(namedrecord("Empty", [])()) == "Empty()"
+
+    def test_namedrecord_pickle(self):
+        """Records of module level classes can be pickled."""
+
+        point = pickle.loads(pickle.dumps(Point(1, [2])))
+        assert point == Point(1, [2])
+        assert Point.__module__ == __name__
+
+    @pytest.mark.parametrize(
+        "field_names", [["x", "x"], ["_x"], ["class"], ["1x"], ["x", "y z-"]]
+    )
+    def test_namedrecord_invalid_field_names(self, field_names):
+        """Raises ValueError for invalid field names."""
+
+        with pytest.raises(ValueError):
+            namedrecord("Record", field_names)
+
+    def test_namedrecord_too_many_defaults(self):
+        """Raises ValueError for more defaults than fields."""
+
+        with pytest.raises(ValueError):
+            namedrecord("Record", ["x"], defaults=[1, 2])
+
+
+class TestRowTypes:
+    """Collection for record classes and dataclasses as row types."""
+
+    def test_namedzip_records(self):
+        """Rows are records."""
+
+        points = list(namedzip(Point, [1, 2], [3, 4, 5]))
+        assert points == [Point(1, 3), Point(2, 4)]
+        assert all(type(point) is Point for point in points)
+
+    def test_namedzip_longest_record_defaults(self):
+        """Defaults of record classes are used for missing values."""
+
+        record = namedrecord("Record", ["x", "y"], defaults=[0])
+        rows = namedzip_longest(record, [1, 2], [3], fillvalue=-1)
+        assert list(rows) == [record(1, 3), record(2, 0)]
+
+    def test_view_records(self):
+        """Views create records for accessed rows."""
+
+        view = NamedZipView(Point, [1, 2], [3, 4])
+        assert view[1] == Point(2, 4)
+        assert view.y == [3, 4]
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="Requires Python 3.10 or higher"
+    )
+    def test_namedzip_dataclass(self):
+        """Dataclasses are called with the values of their init fields."""
+
+        import dataclasses
+
+        # Built without annotations, which are a SyntaxError before 3.6.
+        Pair = dataclasses.make_dataclass(
+            "Pair",
+            [
+                ("letter", str),
+                ("number", int, dataclasses.field(default=99)),
+                ("note", str, dataclasses.field(default="", init=False)),
+            ],
+            slots=True,
+        )
+
+        rows = list(namedzip_longest(Pair, "AB", [1]))
+        assert rows == [Pair("A", 1), Pair("B", 99)]
+        assert list(NamedZipView(Pair, "AB", [1, 2]).number) == [1, 2]
+
+    def test_namedzip_plain_class(self):
+        """Classes with `_fields` but without `__slots__` raise TypeError."""
+
+        class Record:
+            _fields = ("x", "y")
+
+        with pytest.raises(TypeError):
+            namedzip(Record)
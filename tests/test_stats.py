@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip.stats module.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+import pickle
+import time
+
+import pytest
+
+from namedzip import namedzip, namedzip_longest
+from namedzip.namedzip import SizedNamedZipIterator
+from namedzip.stats import ZipStats, _instrument, _SizedStatsIterator, _StatsIterator
+
+Triple = namedtuple("Triple", ["x", "y", "z"])
+
+
+def slow(values, delay):
+    """Generate `values`, sleeping `delay` seconds before each."""
+
+    for value in values:
+        time.sleep(delay)
+        yield value
+
+
+class TestZipStats:
+    """Collection for `namedzip.stats.ZipStats`."""
+
+    def test_zip_stats_rows_shortest(self):
+        """Rows are the fewest pulls when zipping to the shortest."""
+
+        stats = ZipStats(("x", "y"))
+        stats.pulls[:] = [4, 3]
+        assert stats.rows == 3
+        assert stats.defaults == [0, 0]
+
+    def test_zip_stats_rows_longest(self):
+        """Rows are the most pulls, the rest are defaults, when longest."""
+
+        stats = ZipStats(("x", "y"), longest=True)
+        stats.pulls[:] = [4, 1]
+        assert stats.rows == 4
+        assert stats.defaults == [0, 3]
+
+    def test_zip_stats_empty(self):
+        """No fields produce no rows."""
+
+        assert ZipStats(()).rows == 0
+
+    def test_zip_stats_as_dict(self):
+        """Counters are mapped by field name."""
+
+        stats = ZipStats(("x", "y"), longest=True)
+        stats.pulls[:] = [2, 1]
+        stats.wait[:] = [0.5, 0.25]
+        assert stats.as_dict() == {
+            "x": {"pulls": 2, "wait": 0.5, "defaults": 0},
+            "y": {"pulls": 1, "wait": 0.25, "defaults": 1},
+        }
+
+    def test_zip_stats_repr(self):
+        """Repr shows rows and counters by field name."""
+
+        stats = ZipStats(("x",))
+        stats.pulls[0] = 2
+        assert repr(stats) == (
+            "ZipStats(rows=2, pulls={'x': 2}, wait={'x': 0.0}, defaults={'x': 0})"
+        )
+
+
+class TestInstrument:
+    """Collection for `namedzip.stats._instrument`."""
+
+    def test_instrument_length_hint(self):
+        """Only iterators with a length hint are wrapped with one."""
+
+        sized, unsized = _instrument((iter([1, 2]), slow([1], 0)), ("x", "y"), False)
+        assert type(sized) is _SizedStatsIterator
+        assert type(unsized) is _StatsIterator
+        assert sized.__length_hint__() == 2
+        assert not hasattr(unsized, "__length_hint__")
+
+    def test_instrument_shared_stats(self):
+        """All wrappers record to the same `ZipStats`."""
+
+        iterators = _instrument((iter("ab"), iter("c")), ("x", "y"), False)
+        assert iterators[0].stats is iterators[1].stats
+        assert list(iterators[0]) == ["a", "b"]
+        assert iterators[0].stats.pulls == [2, 0]
+
+    def test_instrument_pickle(self):
+        """Wrappers are pickled as the wrapped iterator."""
+
+        (iterator,) = _instrument((iter([1, 2, 3]),), ("x",), False)
+        next(iterator)
+        restored = pickle.loads(pickle.dumps(iterator))
+        assert type(restored) is not _SizedStatsIterator
+        assert list(restored) == [2, 3]
+
+
+class TestNamedZipStats:
+    """Collection for the `stats` argument of the zip functions."""
+
+    def test_stats_off(self):
+        """Iterators are not instrumented by default."""
+
+        rows = namedzip(Triple, [1], [2], [3])
+        assert rows.stats is None
+        assert not any(
+            isinstance(iterator, _StatsIterator) for iterator in rows._iterators
+        )
+
+    def test_stats_namedzip(self):
+        """Counts rows and pulls of `namedzip`."""
+
+        rows = namedzip(Triple, [1, 2, 3], iter([4, 5]), "abc", stats=True)
+        assert list(rows) == [Triple(1, 4, "a"), Triple(2, 5, "b")]
+        assert rows.stats.rows == 2
+        assert rows.stats.pulls == [3, 2, 2]
+        assert rows.stats.defaults == [0, 0, 0]
+        assert rows.stats.fields == Triple._fields
+
+    @pytest.mark.parametrize("options", [{}, {"fillvalue": 0}, {"defaults": [7, 8, 9]}])
+    def test_stats_namedzip_longest(self, options):
+        """Counts the defaults substituted by `namedzip_longest`."""
+
+        rows = namedzip_longest(
+            Triple, [1, 2, 3], iter([4]), [5, 6], stats=True, **options
+        )
+        assert len(list(rows)) == 3
+        assert rows.stats.rows == 3
+        assert rows.stats.pulls == [3, 1, 2]
+        assert rows.stats.defaults == [0, 2, 1]
+
+    def test_stats_partial(self):
+        """Counters are updated as rows are consumed."""
+
+        rows = namedzip(Triple, iter(range(10)), range(10), range(10), stats=True)
+        next(rows)
+        next(rows)
+        assert rows.stats.rows == 2
+
+    def test_stats_wait(self):
+        """Waits are timed per iterable."""
+
+        rows = namedzip(Triple, slow(range(3), 0.01), range(3), range(3), stats=True)
+        list(rows)
+        fast, slowest = min(rows.stats.wait), max(rows.stats.wait)
+        assert rows.stats.wait[0] == slowest >= 0.03 > fast
+
+    def test_stats_factory(self):
+        """Each iterator of a factory gets its own counters."""
+
+        zip_rows = namedzip(Triple, stats=True)
+        first = zip_rows([1], [2], [3])
+        second = zip_rows([1, 2], [3, 4], [5, 6])
+        list(first), list(second)
+        assert first.stats.rows == 1
+        assert second.stats.rows == 2
+
+    def test_stats_sized(self):
+        """Instrumented sequences still support `len` and indexing."""
+
+        rows = namedzip(Triple, [1, 2, 3], [4, 5, 6], [7, 8, 9], stats=True)
+        assert isinstance(rows, SizedNamedZipIterator)
+        next(rows)
+        assert len(rows) == 2
+        assert rows[0] == Triple(2, 5, 8)
+        assert rows.stats.rows == 1
+
+    @pytest.mark.parametrize("func", [namedzip, namedzip_longest])
+    def test_stats_where(self, func):
+        """Filtered rows expose counters which include rejected rows."""
+
+        rows = func(
+            Triple, range(5), iter(range(5)), "abcde", stats=True, where={"x": bool}
+        )
+        assert next(rows) == Triple(1, 1, "b")
+        assert list(rows) == [Triple(2, 2, "c"), Triple(3, 3, "d"), Triple(4, 4, "e")]
+        assert rows.stats.rows == 5
+        assert rows.stats.pulls == [5, 5, 5]
+
+    def test_stats_prefetch(self):
+        """Waits for prefetched values are timed on the consumer side."""
+
+        rows = namedzip(Triple, "ab", "cd", "ef", prefetch=2, stats=True)
+        assert list(rows) == [Triple("a", "c", "e"), Triple("b", "d", "f")]
+        assert rows.stats.rows == 2
+
+    def test_stats_pickle(self):
+        """Pickled checkpoints resume without instrumentation."""
+
+        rows = namedzip(Triple, iter([1, 2]), [3, 4], [5, 6], stats=True)
+        next(rows)
+        restored = pickle.loads(pickle.dumps(rows))
+        assert restored.stats is None
+        assert list(restored) == [Triple(2, 4, 6)]
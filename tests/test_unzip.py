@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip.unzip module.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from array import array
+from collections import namedtuple
+import sys
+
+import pytest
+
+import namedzip.unzip as unzip_module
+from namedzip import namedrecord, namedunzip, namedzip
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+class TestNamedunzip:
+    """Collection for `namedzip.unzip.namedunzip`."""
+
+    def test_namedunzip_lists(self):
+        """Splits rows into a list per field."""
+
+        columns = namedunzip(Point, [Point(1, "a"), Point(2, "b"), Point(3, "c")])
+        assert columns == Point([1, 2, 3], ["a", "b", "c"])
+        assert type(columns) is Point
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 4096])
+    def test_namedunzip_chunks(self, chunk_size):
+        """Columns do not depend on the chunk size."""
+
+        rows = namedzip(Point, range(5), range(5, 10))
+        columns = namedunzip(Point, rows, chunk_size=chunk_size)
+        assert columns == Point(list(range(5)), list(range(5, 10)))
+
+    def test_namedunzip_single_pass(self):
+        """Rows are read once, from an iterator."""
+
+        rows = iter([Point(1, 2), Point(3, 4)])
+        assert namedunzip(Point, rows) == Point([1, 3], [2, 4])
+        assert next(rows, None) is None
+
+    def test_namedunzip_inverse(self):
+        """Zipping the columns again produces the same rows."""
+
+        rows = [Point(i, i * 2) for i in range(10)]
+        assert list(namedzip(Point, *namedunzip(Point, rows))) == rows
+
+    def test_namedunzip_empty(self):
+        """No rows produce empty columns."""
+
+        assert namedunzip(Point, []) == Point([], [])
+
+    def test_namedunzip_plain_tuples(self):
+        """Plain tuples are split like named tuples."""
+
+        assert namedunzip(Point, [(1, 2), (3, 4)]) == Point([1, 3], [2, 4])
+
+    def test_namedunzip_array(self):
+        """Typecodes produce `array.array` columns."""
+
+        columns = namedunzip(Point, [Point(1, 2.5), Point(3, 4.5)], container="d")
+        assert columns.x == array("d", [1.0, 3.0])
+        assert columns.y == array("d", [2.5, 4.5])
+
+    def test_namedunzip_per_field_containers(self):
+        """A container type can be supplied for each field."""
+
+        columns = namedunzip(Point, [Point(1, "a")], container=["q", list])
+        assert columns == Point(array("q", [1]), ["a"])
+
+    def test_namedunzip_record(self):
+        """Splits `namedrecord` rows by attribute."""
+
+        Record = namedrecord("Record", ["x", "y"])
+        columns = namedunzip(Record, [Record(1, 2), Record(3, 4)])
+        assert (columns.x, columns.y) == ([1, 3], [2, 4])
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="Requires Python 3.7 or higher"
+    )
+    def test_namedunzip_dataclass(self):
+        """Splits dataclass rows by attribute."""
+
+        from dataclasses import make_dataclass
+
+        Pair = make_dataclass("Pair", [("x", int), ("y", int)])
+        columns = namedunzip(Pair, [Pair(1, 2), Pair(3, 4)])
+        assert columns == Pair([1, 3], [2, 4])
+
+    def test_namedunzip_factory(self):
+        """Returns a function when no rows are supplied."""
+
+        unzip_points = namedunzip(Point, container="q")
+        assert unzip_points([Point(1, 2)]) == Point(array("q", [1]), array("q", [2]))
+        assert unzip_points([]) == Point(array("q"), array("q"))
+
+    @pytest.mark.parametrize("container", ["X", dict, 5])
+    def test_namedunzip_invalid_container(self, container):
+        """Unsupported container types raise ValueError."""
+
+        with pytest.raises(ValueError):
+            namedunzip(Point, container=container)
+
+    def test_namedunzip_container_count(self):
+        """A container type is required for each field."""
+
+        with pytest.raises(ValueError):
+            namedunzip(Point, container=[list])
+
+    def test_namedunzip_chunk_size(self):
+        """The chunk size must be positive."""
+
+        with pytest.raises(ValueError):
+            namedunzip(Point, chunk_size=0)
+
+    def test_namedunzip_numpy_fallback(self, monkeypatch):
+        """NumPy columns are lists without NumPy."""
+
+        monkeypatch.setattr(unzip_module, "_import_numpy", lambda: None)
+        columns = namedunzip(Point, [Point(1, 2)], container="numpy")
+        assert columns == Point([1], [2])
+
+
+class TestNamedunzipNumpy:
+    """Collection for `namedzip.unzip.namedunzip` with NumPy."""
+
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        """Skip tests when NumPy is not installed."""
+
+        return pytest.importorskip("numpy")
+
+    def test_namedunzip_numpy_inferred(self, numpy):
+        """NumPy columns infer their data types."""
+
+        columns = namedunzip(Point, [Point(1, 2.5), Point(3, 4.5)], container="numpy")
+        assert columns.x.dtype == numpy.int64
+        assert columns.y.dtype == numpy.float64
+        assert columns.x.tolist() == [1, 3]
+
+    def test_namedunzip_numpy_dtype(self, numpy):
+        """NumPy data types set the column data types."""
+
+        columns = namedunzip(
+            Point, [Point(1, 2)], container=[numpy.float32, numpy.dtype("int16")]
+        )
+        assert columns.x.dtype == numpy.float32
+        assert columns.y.dtype == numpy.int16
+
+    def test_namedunzip_numpy_preallocated(self, numpy):
+        """Sized rows fill arrays of their length hint."""
+
+        rows = namedzip(Point, range(10000), range(10000))
+        columns = namedunzip(Point, rows, container="numpy", chunk_size=300)
+        assert columns.x.tolist() == list(range(10000))
+        assert len(columns.y) == 10000
+
+    def test_namedunzip_numpy_grown(self, numpy):
+        """Arrays grow beyond the length hint and are trimmed."""
+
+        rows = (Point(i, i) for i in range(1000))
+        columns = namedunzip(Point, rows, container="numpy", chunk_size=7)
+        assert columns.x.tolist() == list(range(1000))
+        assert columns.x.base is None
+
+    def test_namedunzip_numpy_promoted(self, numpy):
+        """Inferred data types are promoted by later values."""
+
+        rows = [Point(1, "a"), Point(2.5, "bbb")]
+        columns = namedunzip(Point, rows, container="numpy", chunk_size=1)
+        assert columns.x.tolist() == [1.0, 2.5]
+        assert columns.y.tolist() == ["a", "bbb"]
+
+    def test_namedunzip_numpy_empty(self, numpy):
+        """No rows produce empty arrays."""
+
+        columns = namedunzip(Point, [], container=numpy.float64)
+        assert columns.x.dtype == numpy.float64
+        assert len(columns.x) == 0
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Tests for the namedzip.view module.
+
+copyright: (c) 2019 by Erik R Berlin.
+license: MIT, see LICENSE for more details.
+
+"""
+
+from collections import namedtuple
+from collections.abc import Sequence
+
+import pytest
+
+from namedzip import NamedZipView
+
+
+@pytest.fixture()
+def point_named_tuple():
+    """Test fixture to provide sample named tuple."""
+
+    return namedtuple("Point", ["x", "y"])
+
+
+@pytest.fixture()
+def points(point_named_tuple):
+    """Test fixture to provide a view of a list and a range."""
+
+    return NamedZipView(point_named_tuple, [10, 20, 30, 40, 50], range(6))
+
+
+class TestNamedZipView:
+    """Collection for `namedzip.view.NamedZipView`."""
+
+    def test_view_is_sequence(self, points):
+        """Views are sequences as long as the shortest input."""
+
+        assert isinstance(points, Sequence)
+        assert len(points) == 5
+
+    def test_view_getitem(self, point_named_tuple, points):
+        """Rows are named tuples created on access."""
+
+        assert points[1] == point_named_tuple(20, 1)
+        assert type(points[1]) is point_named_tuple
+        assert points[-1] == (50, 4)
+        with pytest.raises(IndexError):
+            points[5]
+
+    def test_view_iteration(self, points):
+        """Iteration yields the same rows as `zip`."""
+
+        assert list(points) == list(zip([10, 20, 30, 40, 50], range(6)))
+
+    @pytest.mark.parametrize(
+        "index",
+        [
+            slice(None),
+            slice(1, 3),
+            slice(None, None, 2),
+            slice(None, None, -1),
+            slice(3, 0, -2),
+            slice(10, None),
+        ],
+    )
+    def test_view_slicing(self, points, index):
+        """Slices are views with the same rows as slicing a list."""
+
+        expected = list(points)[index]
+        sliced = points[index]
+        assert isinstance(sliced, NamedZipView)
+        assert list(sliced) == expected
+        assert len(sliced) == len(expected)
+        assert list(sliced.x) == [row.x for row in expected]
+        assert [sliced[i] for i in range(len(sliced))] == expected
+
+    def test_view_nested_slicing(self, points):
+        """Slices of slices compose."""
+
+        assert list(points[1:][::2]) == [(20, 1), (40, 3)]
+
+    def test_view_column_attributes(self, points):
+        """Field attributes return the original sequences."""
+
+        column = points.x
+        assert column == [10, 20, 30, 40, 50]
+        assert points.x is column
+        assert points.y == range(6)
+        with pytest.raises(AttributeError):
+            points.z
+
+    def test_view_custom_new(self):
+        """Custom `__new__` is called for accessed rows."""
+
+        class Point(namedtuple("Point", ["x", "y"])):
+            def __new__(cls, x, y):
+                return super().__new__(cls, x * 2, y)
+
+        view = NamedZipView(Point, [1, 2], [3, 4])
+        assert view[0] == (2, 3)
+        assert list(view) == [(2, 3), (4, 4)]
+
+    def test_view_non_sequence(self, point_named_tuple):
+        """Raises TypeError for iterables without indexing."""
+
+        with pytest.raises(TypeError):
+            NamedZipView(point_named_tuple, [1, 2], iter([3, 4]))
+
+    def test_view_mapping(self, point_named_tuple):
+        """Raises TypeError for mappings, which are not sequences."""
+
+        with pytest.raises(TypeError):
+            NamedZipView(point_named_tuple, [1, 2], {"a": 3, "b": 4})
+
+    def test_view_iterables_fieldnames_mismatch(self, point_named_tuple):
+        """Raises ValueError for non-equal number of sequences and fields."""
+
+        with pytest.raises(ValueError):
+            NamedZipView(point_named_tuple, [1, 2])
+
+    @pytest.mark.parametrize(
+        "index",
+        [slice(None), slice(2, 5), slice(None, None, -1), slice(4, 0, -3), slice(9, 2)],
+    )
+    def test_view_longest(self, point_named_tuple, index):
+        """Longest views pad shorter sequences with their defaults."""
+
+        view = NamedZipView._longest(point_named_tuple, ([1, 2], range(5)), (0, -1))
+        rows = [(1, 0), (2, 1), (0, 2), (0, 3), (0, 4)]
+        assert len(view) == 5
+        assert [view[i] for i in range(-5, 5)] == rows + rows
+        assert list(view[index]) == rows[index]
+        assert list(view[index].x) == [x for x, _ in rows[index]]
+        assert list(view[index].y) == [y for _, y in rows[index]]
+
+    def test_view_repr(self, points):
+        """Repr shows the named tuple class and the number of rows."""
+
+        assert repr(points) == "NamedZipView(Point, rows=5)"